@@ -5,7 +5,11 @@ from uuid import UUID
 from aiohttp import ClientSession
 
 from utils.common import ParsedDatesStatus
-from utils.kai_parser_api.schemas import WeekParity
+from utils.kai_parser_api.schemas import (
+    ParsedGroupExams,
+    ParsedGroupSchedule,
+    WeekParity,
+)
 from utils.pocket_kai_api.base import PocketKaiApiBase, PocketKaiApiError
 from utils.pocket_kai_api.schemas import (
     PocketKaiDepartment,
@@ -13,6 +17,7 @@ from utils.pocket_kai_api.schemas import (
     PocketKaiExam,
     PocketKaiGroup,
     PocketKaiLesson,
+    PocketKaiScheduleSyncResult,
     PocketKaiTeacher,
 )
 
@@ -261,25 +266,79 @@ class PocketKaiApi(PocketKaiApiBase):
         url = self.base_pocket_kai_url + f'/lesson/{lesson_id}'
         await self._json_request('delete', url)
 
-    async def _get_groups(self, limit: int, offset: int) -> list[PocketKaiGroup]:
+    async def sync_group_schedule(
+        self,
+        group_id: UUID,
+        parsed_group_schedule: ParsedGroupSchedule,
+    ) -> PocketKaiScheduleSyncResult:
+        url = self.base_pocket_kai_url + f'/group/by_id/{group_id}/schedule/sync'
+        data = {
+            'parsed_at': parsed_group_schedule.parsed_at.replace(
+                tzinfo=None,
+            ).isoformat(),
+            'lessons': [
+                lesson.model_dump(mode='json')
+                for lesson in parsed_group_schedule.lessons
+            ],
+        }
+        result = await self._json_request('put', url, json=data)
+        return PocketKaiScheduleSyncResult(**result)
+
+    async def sync_group_exams(
+        self,
+        group_id: UUID,
+        parsed_group_exams: ParsedGroupExams,
+    ) -> PocketKaiScheduleSyncResult:
+        url = self.base_pocket_kai_url + f'/group/by_id/{group_id}/exam/sync'
+        data = {
+            'parsed_at': parsed_group_exams.parsed_at.replace(tzinfo=None).isoformat(),
+            'academic_year': parsed_group_exams.year_data.academic_year,
+            'academic_year_half': parsed_group_exams.year_data.academic_year_half,
+            'semester': parsed_group_exams.year_data.semester,
+            'exams': [
+                exam.model_dump(mode='json') for exam in parsed_group_exams.parsed_exams
+            ],
+        }
+        result = await self._json_request('put', url, json=data)
+        return PocketKaiScheduleSyncResult(**result)
+
+    async def _get_groups(
+        self,
+        limit: int,
+        after: str | None,
+    ) -> tuple[list[PocketKaiGroup], str | None]:
         url = self.base_pocket_kai_url + '/group/'
         params = {
             'limit': limit,
-            'offset': offset,
             'is_short': 'false',
         }
-        result = await self._json_request('get', url, params=params)
-        return [PocketKaiGroup(**group_dict) for group_dict in result]
+        if after is not None:
+            params['after'] = after
+
+        async with self.session.get(url, params=params) as response:
+            if not response.ok:
+                logging.error(
+                    f'Pocket kai api request failed. Method: get, URL: {url}, Status code: {response.status}\n'
+                    f'Params: {params}\n'
+                    f'Answer: {await response.text()}',
+                )
+                raise PocketKaiApiError(status_code=response.status)
+
+            result = await response.json()
+            next_cursor = response.headers.get('X-Next-Cursor')
+
+        return [PocketKaiGroup(**group_dict) for group_dict in result], next_cursor
 
     async def get_all_groups(self) -> list[PocketKaiGroup]:
+        # Курсор вместо offset: каждая страница читается по индексу
+        # с места, где закончилась предыдущая
         all_groups = list()
-        limit = 100
-        offset = 0
-        while groups := await self._get_groups(limit=limit, offset=offset):
+        after = None
+        while True:
+            groups, after = await self._get_groups(limit=100, after=after)
             all_groups.extend(groups)
-            offset += limit
-
-        return all_groups
+            if after is None:
+                return all_groups
 
     async def get_exams_by_group_id(
         self,
@@ -4,13 +4,18 @@ from typing import Protocol
 from uuid import UUID
 
 from utils.common import ParsedDatesStatus
-from utils.kai_parser_api.schemas import WeekParity
+from utils.kai_parser_api.schemas import (
+    ParsedGroupExams,
+    ParsedGroupSchedule,
+    WeekParity,
+)
 from utils.pocket_kai_api.schemas import (
     PocketKaiDepartment,
     PocketKaiDiscipline,
     PocketKaiExam,
     PocketKaiGroup,
     PocketKaiLesson,
+    PocketKaiScheduleSyncResult,
     PocketKaiTeacher,
 )
 
@@ -146,6 +151,22 @@ class PocketKaiApiBase(Protocol):
     async def delete_group_lesson(self, lesson_id: UUID) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def sync_group_schedule(
+        self,
+        group_id: UUID,
+        parsed_group_schedule: ParsedGroupSchedule,
+    ) -> PocketKaiScheduleSyncResult:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def sync_group_exams(
+        self,
+        group_id: UUID,
+        parsed_group_exams: ParsedGroupExams,
+    ) -> PocketKaiScheduleSyncResult:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_exams_by_group_id(
         self,
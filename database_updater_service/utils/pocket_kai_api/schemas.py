@@ -69,6 +69,14 @@ class PocketKaiLesson(BaseModel):
     discipline: PocketKaiDiscipline
 
 
+class PocketKaiScheduleSyncResult(BaseModel):
+    unchanged: int
+    created: int
+    updated: int
+    deleted: int
+    skipped: bool
+
+
 class PocketKaiExam(BaseModel):
     id: UUID
     created_at: datetime
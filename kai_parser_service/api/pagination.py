@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+
+from typing import Any, Callable
+
+from fastapi import HTTPException, Response, status
+
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def encode_cursor(*values) -> str:
+    """
+    Opaque cursor built from the sort key of the last record on a page
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps([str(value) for value in values]).encode(),
+    ).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> tuple:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError
+
+        return tuple(parser(value) for parser, value in zip(parsers, values))
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor',
+        )
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from api.dependencies import TaskServiceDep
+from api.pagination import decode_cursor, encode_cursor, set_next_cursor
 from api.schemas.task import TaskRead
 from core.common import TaskStatus, TaskType
 
@@ -15,8 +18,13 @@ router = APIRouter()
     response_model=list[TaskRead],
 )
 async def get_all_tasks(
+    response: Response,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
+    after: Annotated[
+        str | None,
+        Query(description='Value of the X-Next-Cursor header of the previous page'),
+    ] = None,
     group_name: str | None = None,
     login: str | None = None,
     type: TaskType | None = None,
@@ -24,11 +32,20 @@ async def get_all_tasks(
     *,
     task_service: TaskServiceDep,
 ):
-    return await task_service.get(
+    tasks = await task_service.get(
         limit=limit,
         offset=offset,
         group_name=group_name,
         login=login,
         type=type,
         status=status,
+        after=(
+            decode_cursor(after, datetime.fromisoformat, UUID)
+            if after is not None
+            else None
+        ),
     )
+    if len(tasks) == limit:
+        set_next_cursor(response, encode_cursor(tasks[-1].created_at, tasks[-1].id))
+
+    return tasks
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 
 from core.entities.task import TaskEntity
 from core.repositories.base import GenericRepository, GenericSARepository
@@ -30,7 +32,13 @@ class TaskRepositoryBase(GenericRepository[TaskEntity], ABC):
         status: str | None,
         login: str | None,
         group_name: str | None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[TaskEntity]:
+        """
+        Get tasks from newest to oldest
+
+        :param after: (created_at, id) of the last task on the previous page
+        """
         raise NotImplementedError
 
 
@@ -65,6 +73,7 @@ class SATaskRepository(GenericSARepository[TaskEntity], TaskRepositoryBase):
         status: str | None,
         login: str | None,
         group_name: str | None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[TaskEntity]:
         stmt = select(TaskModel)
 
@@ -77,7 +86,16 @@ class SATaskRepository(GenericSARepository[TaskEntity], TaskRepositoryBase):
         if group_name is not None:
             stmt = stmt.where(TaskModel.group_name == group_name)
 
-        stmt = stmt.order_by(TaskModel.created_at.desc()).limit(limit).offset(offset)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TaskModel.created_at, TaskModel.id) < tuple_(*after),
+            )
+
+        stmt = (
+            stmt.order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
 
         result = await self._session.scalars(stmt)
         return [await self._convert_db_to_entity(task) for task in result.all()]
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
 
 from core.common import TaskStatus, TaskType
 from core.entities.task import TaskEntity
@@ -40,6 +42,7 @@ class TaskServiceBase(ABC):
         login: str | None,
         type: TaskType | None,
         status: TaskStatus | None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[TaskEntity]:
         raise NotImplementedError
 
@@ -73,6 +76,7 @@ class TaskService(TaskServiceBase):
         login: str | None,
         type: TaskType | None,
         status: TaskStatus | None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[TaskEntity]:
         return await self.task_repository.get_tasks_order_by_created_at(
             limit=limit,
@@ -81,6 +85,7 @@ class TaskService(TaskServiceBase):
             login=login,
             type=type,
             status=status,
+            after=after,
         )
 
     async def update(self, task: TaskEntity) -> TaskEntity:
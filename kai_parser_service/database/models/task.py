@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.models.base import BaseModel
@@ -7,6 +8,10 @@ from database.models.base import BaseModel
 
 class TaskModel(BaseModel):
     __tablename__ = 'task'
+    __table_args__ = (
+        # Tasks are listed from newest to oldest with keyset pagination
+        Index('ix_task_created_at_id', 'created_at', 'id'),
+    )
 
     name: Mapped[str] = mapped_column()
 
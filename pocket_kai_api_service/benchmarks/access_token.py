@@ -0,0 +1,156 @@
+"""
+Сравнивает получение пользователя по Access-токену без кэша
+(проверка подписи RS256, валидация payload и запрос пользователя в БД)
+и с кэшем проверенных токенов.
+
+Запуск из корня сервиса: python -m benchmarks.access_token --requests 5000
+Пропускная способность меряется `--workers` конкурентными корутинами, у каждой
+своя сессия, как у параллельных запросов одного воркера. Поэтому тестовые
+пользователи сохраняются в БД и удаляются после замеров.
+"""
+
+import argparse
+import asyncio
+import time
+
+from typing import Callable
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.common import measure, measure_sync
+from pocket_kai.application.interfaces.cache import AccessTokenCache
+from pocket_kai.application.interactors.user import GetUserByAccessTokenInteractor
+from pocket_kai.config import get_settings
+from pocket_kai.infrastructure.cache import InMemoryAccessTokenCache
+from pocket_kai.infrastructure.database.database import new_session_maker
+from pocket_kai.infrastructure.database.models import UserModel
+from pocket_kai.infrastructure.datetime_manager import UTCDateTimeManager
+from pocket_kai.infrastructure.gateways.user import UserGateway
+from pocket_kai.infrastructure.jwt import PyJWTManager
+
+
+async def measure_throughput(
+    name: str,
+    session_maker: async_sessionmaker[AsyncSession],
+    get_interactor: Callable[[AsyncSession], GetUserByAccessTokenInteractor],
+    tokens: list[str],
+    requests_count: int,
+    workers_count: int,
+) -> None:
+    # Корутины берут номера запросов из общего итератора, пока они не кончатся
+    request_numbers = iter(range(requests_count))
+
+    async def worker() -> None:
+        async with session_maker() as session:
+            interactor = get_interactor(session)
+            for i in request_numbers:
+                await interactor(access_token=tokens[i % len(tokens)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers_count)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f'{name:<40} {requests_count / elapsed:10.0f} requests/s '
+        f'({workers_count} workers)',
+    )
+
+
+async def main(
+    users_count: int,
+    requests_count: int,
+    workers_count: int,
+    iterations: int,
+) -> None:
+    settings = get_settings()
+    session_maker = new_session_maker(settings.postgres)
+    datetime_manager = UTCDateTimeManager()
+    jwt_manager = PyJWTManager(
+        access_token_expire_minutes=settings.jwt.ACCESS_TOKEN_EXPIRE_MINUTES,
+        refresh_token_expire_minutes=settings.jwt.REFRESH_TOKEN_EXPIRE_MINUTES,
+        private_key=settings.jwt.private_key_path.read_text(),
+        public_key=settings.jwt.public_key_path.read_text(),
+        algorithm=settings.jwt.JWT_ALGORITHM,
+        datetime_manager=datetime_manager,
+    )
+
+    uncached_cache = InMemoryAccessTokenCache(max_size=0, ttl=0)
+    cached_cache = InMemoryAccessTokenCache(
+        max_size=settings.cache.ACCESS_TOKEN_CACHE_MAX_SIZE,
+        ttl=settings.cache.ACCESS_TOKEN_CACHE_TTL_SECONDS,
+    )
+
+    def get_interactor(
+        access_token_cache: AccessTokenCache,
+    ) -> Callable[[AsyncSession], GetUserByAccessTokenInteractor]:
+        return lambda session: GetUserByAccessTokenInteractor(
+            user_gateway=UserGateway(session),
+            jwt_manager=jwt_manager,
+            access_token_cache=access_token_cache,
+            datetime_manager=datetime_manager,
+        )
+
+    async with session_maker() as session:
+        users = [UserModel() for _ in range(users_count)]
+        session.add_all(users)
+        await session.commit()
+        user_ids = [user.id for user in users]
+        tokens = [jwt_manager.create_access_token(str(user_id)) for user_id in user_ids]
+
+    try:
+        async with session_maker() as session:
+            uncached = get_interactor(uncached_cache)(session)
+            cached = get_interactor(cached_cache)(session)
+
+            print(f'{users_count} users, {iterations} iterations')
+            measure_sync(
+                'decode_access_token',
+                lambda: jwt_manager.decode_access_token(tokens[0]),
+                iterations,
+            )
+            await measure(
+                'uncached',
+                lambda: uncached(access_token=tokens[0]),
+                iterations,
+            )
+            await measure(
+                'cached',
+                lambda: cached(access_token=tokens[0]),
+                iterations,
+            )
+
+        for name, access_token_cache in (
+            ('uncached', uncached_cache),
+            ('cached', cached_cache),
+        ):
+            await measure_throughput(
+                name=name,
+                session_maker=session_maker,
+                get_interactor=get_interactor(access_token_cache),
+                tokens=tokens,
+                requests_count=requests_count,
+                workers_count=workers_count,
+            )
+    finally:
+        async with session_maker() as session:
+            await session.execute(delete(UserModel).where(UserModel.id.in_(user_ids)))
+            await session.commit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=10)
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            users_count=args.users,
+            requests_count=args.requests,
+            workers_count=args.workers,
+            iterations=args.iterations,
+        ),
+    )
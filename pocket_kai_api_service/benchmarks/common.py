@@ -0,0 +1,119 @@
+import datetime as dt
+import statistics
+import time
+import uuid
+
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pocket_kai.domain.common import LessonType, ParsedDatesStatus, WeekParity
+from pocket_kai.infrastructure.database.models.kai import (
+    DepartmentModel,
+    DisciplineModel,
+    GroupModel,
+    LessonModel,
+    TeacherModel,
+)
+
+
+def random_kai_id() -> int:
+    return uuid.uuid4().int >> 80
+
+
+async def seed_group_with_lessons(
+    session: AsyncSession,
+    lessons_count: int,
+) -> GroupModel:
+    """
+    Создаёт группу с парами для бенчмарков.
+    Вызывающий код должен откатить транзакцию после замеров
+    """
+    suffix = uuid.uuid4().hex[:8]
+    group = GroupModel(
+        kai_id=random_kai_id(),
+        group_name=f'bench-{suffix}',
+        schedule_parsed_at=dt.datetime.utcnow(),
+    )
+    department = DepartmentModel(kai_id=random_kai_id(), name=f'Кафедра {suffix}')
+    teachers = [
+        TeacherModel(login=f'bench-{suffix}-{i}', name=f'Преподаватель {i}')
+        for i in range(10)
+    ]
+    disciplines = [
+        DisciplineModel(kai_id=random_kai_id(), name=f'Дисциплина {i}')
+        for i in range(15)
+    ]
+    session.add_all([group, department, *teachers, *disciplines])
+    await session.flush()
+
+    parities = (WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN)
+    session.add_all(
+        LessonModel(
+            number_of_day=i % 6 + 1,
+            original_dates=None,
+            parsed_parity=parities[i % 3],
+            parsed_dates=None,
+            parsed_dates_status=ParsedDatesStatus.GOOD,
+            audience_number=str(100 + i),
+            building_number=str(i % 8 + 1),
+            original_lesson_type='лек',
+            parsed_lesson_type=LessonType.lecture,
+            start_time=dt.time(8 + i % 10, 0),
+            end_time=dt.time(9 + i % 10, 30),
+            discipline_id=disciplines[i % len(disciplines)].id,
+            teacher_id=teachers[i % len(teachers)].id if i % 7 else None,
+            department_id=department.id if i % 5 else None,
+            group_id=group.id,
+        )
+        for i in range(lessons_count)
+    )
+    await session.flush()
+
+    return group
+
+
+def _print_timings(name: str, timings: list[float]) -> None:
+    timings.sort()
+    print(
+        f'{name:<40} '
+        f'mean={statistics.fmean(timings):8.3f}ms '
+        f'median={statistics.median(timings):8.3f}ms '
+        f'p95={timings[int(len(timings) * 0.95) - 1]:8.3f}ms',
+    )
+
+
+async def measure(
+    name: str,
+    func: Callable[[], Awaitable],
+    iterations: int,
+    warmup: int = 10,
+) -> None:
+    for _ in range(warmup):
+        await func()
+
+    timings = list()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    _print_timings(name, timings)
+
+
+def measure_sync(
+    name: str,
+    func: Callable[[], object],
+    iterations: int,
+    warmup: int = 10,
+) -> None:
+    for _ in range(warmup):
+        func()
+
+    timings = list()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    _print_timings(name, timings)
@@ -0,0 +1,407 @@
+"""
+Проверяет, что запросы гейтвеев используют индексы.
+
+Каждый сценарий вызывает метод гейтвея, выполненные им запросы перехватываются,
+и для каждого строится план через EXPLAIN с `enable_seqscan = off`.
+При этом последовательное чтение остаётся в плане только там, где подходящего
+индекса нет. Если в плане есть Seq Scan по одной из больших таблиц,
+скрипт завершается с ненулевым кодом.
+
+Запуск из корня сервиса: python -m benchmarks.query_plans
+Тестовые данные создаются в транзакции, которая откатывается после проверки.
+
+Для сценариев из QUERY_LIMITS дополнительно проверяется количество запросов.
+
+Не проверяются запросы, которые читают таблицу целиком намеренно:
+LessonGateway.get_all_with_room и загрузка индекса поиска преподавателей.
+"""
+
+import asyncio
+import datetime as dt
+import json
+import sys
+import uuid
+
+from typing import Any, Awaitable, Callable, Iterator
+
+from sqlalchemy import ClauseElement, Delete, Executable, Insert, Select, Update
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+
+from benchmarks.common import random_kai_id, seed_group_with_lessons
+from pocket_kai.application.interactors.schedule import cached_teacher_schedule
+from pocket_kai.config import get_settings
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.infrastructure.cache import (
+    InMemoryReferenceCatalog,
+    InMemoryScheduleCache,
+)
+from pocket_kai.infrastructure.database.database import new_session_maker
+from pocket_kai.infrastructure.database.models.kai import (
+    ExamModel,
+    LessonModel,
+    StudentModel,
+)
+from pocket_kai.infrastructure.gateways.discipline import DisciplineGateway
+from pocket_kai.infrastructure.gateways.exam import ExamGateway
+from pocket_kai.infrastructure.gateways.group import GroupGateway
+from pocket_kai.infrastructure.gateways.lesson import LessonGateway
+from pocket_kai.infrastructure.gateways.lesson_occurrence import (
+    LessonOccurrenceGateway,
+)
+from pocket_kai.infrastructure.gateways.refresh_token import RefreshTokenGateway
+from pocket_kai.infrastructure.gateways.service_token import ServiceTokenGateway
+from pocket_kai.infrastructure.gateways.student import StudentGateway
+from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
+
+
+# Таблицы, которые растут вместе с количеством групп и пользователей
+BIG_TABLES = frozenset(
+    {
+        'discipline',
+        'exam',
+        'group',
+        'lesson',
+        'lesson_occurrence',
+        'refresh_token',
+        'service_token',
+        'student',
+        'teacher',
+        'user',
+    },
+)
+
+# Сценарии, для которых важно количество запросов к БД, и его максимум
+QUERY_LIMITS = {
+    # Занятия одним запросом и их группы вторым, без проверки преподавателя
+    'cached_teacher_schedule': 2,
+}
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Executable):
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element: _Explain, compiler, **kwargs) -> str:
+    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(element.statement, **kwargs)
+
+
+class RecordingSession:
+    """
+    Прокси сессии, который запоминает выполненные через него запросы
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.statements: list[Executable] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def _record(self, statement: Executable) -> None:
+        if isinstance(statement, Insert):
+            # Проверяются только INSERT ... SELECT
+            if statement.select is not None:
+                self.statements.append(statement)
+        elif isinstance(statement, (Select, Update, Delete)):
+            self.statements.append(statement)
+
+    async def execute(self, statement: Executable, *args, **kwargs):
+        self._record(statement)
+        return await self._session.execute(statement, *args, **kwargs)
+
+    async def scalars(self, statement: Executable, *args, **kwargs):
+        self._record(statement)
+        return await self._session.scalars(statement, *args, **kwargs)
+
+    async def scalar(self, statement: Executable, *args, **kwargs):
+        self._record(statement)
+        return await self._session.scalar(statement, *args, **kwargs)
+
+
+def _find_seq_scans(plan: dict) -> Iterator[str]:
+    if plan['Node Type'] == 'Seq Scan' and plan['Relation Name'] in BIG_TABLES:
+        yield plan['Relation Name']
+
+    for subplan in plan.get('Plans', ()):
+        yield from _find_seq_scans(subplan)
+
+
+async def _get_seq_scans(session: AsyncSession, statement: Executable) -> list[str]:
+    plan = await session.scalar(_Explain(statement))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return list(_find_seq_scans(plan[0]['Plan']))
+
+
+async def _seed(session: AsyncSession) -> dict[str, Any]:
+    group = await seed_group_with_lessons(session, lessons_count=64)
+    teacher_id = await session.scalar(
+        select(LessonModel.teacher_id)
+        .where(LessonModel.group_id == group.id, LessonModel.teacher_id.is_not(None))
+        .limit(1),
+    )
+    lesson = await session.scalar(
+        select(LessonModel).where(LessonModel.group_id == group.id).limit(1),
+    )
+
+    suffix = uuid.uuid4().hex[:8]
+    session.add(
+        StudentModel(
+            kai_id=random_kai_id(),
+            full_name=f'Студент {suffix}',
+            email=f'bench-{suffix}@example.com',
+            is_leader=False,
+            position=1,
+            group_id=group.id,
+        ),
+    )
+    session.add(
+        ExamModel(
+            original_date='01.01',
+            time=dt.time(9, 0),
+            academic_year='2024/2025',
+            academic_year_half=1,
+            discipline_id=lesson.discipline_id,
+            group_id=group.id,
+        ),
+    )
+    await session.flush()
+
+    return {
+        'group_id': str(group.id),
+        'group_name': group.group_name,
+        'teacher_id': str(teacher_id),
+        'lesson_id': str(lesson.id),
+        'building_number': lesson.building_number,
+        'audience_number': lesson.audience_number,
+    }
+
+
+def _get_cases(
+    session: RecordingSession,
+    data: dict[str, Any],
+) -> list[tuple[str, Callable[[], Awaitable]]]:
+    reference_catalog = InMemoryReferenceCatalog()
+    group_gateway = GroupGateway(session, reference_catalog)
+    lesson_gateway = LessonGateway(session)
+    lesson_occurrence_gateway = LessonOccurrenceGateway(session)
+    exam_gateway = ExamGateway(session)
+    student_gateway = StudentGateway(session)
+    teacher_gateway = TeacherGateway(
+        session=session,
+        search_similarity_threshold=0,
+        search_index=TeacherSearchIndex(),
+    )
+    discipline_gateway = DisciplineGateway(session)
+
+    group_id = data['group_id']
+    teacher_id = data['teacher_id']
+    date_from = dt.date.today()
+    date_to = date_from + dt.timedelta(days=14)
+
+    return [
+        (
+            'GroupGateway.get_by_name',
+            lambda: group_gateway.get_by_name(data['group_name']),
+        ),
+        (
+            'GroupGateway.suggest_by_name',
+            lambda: group_gateway.suggest_by_name(
+                data['group_name'][:4],
+                limit=20,
+                offset=0,
+            ),
+        ),
+        (
+            'GroupGateway.get_all',
+            lambda: group_gateway.get_all(
+                limit=100,
+                offset=0,
+                after=(data['group_name'], group_id),
+            ),
+        ),
+        (
+            'GroupGateway.get_by_ids_and_names',
+            lambda: group_gateway.get_by_ids_and_names(
+                [group_id],
+                [data['group_name']],
+            ),
+        ),
+        (
+            'LessonGateway.get_by_group_id',
+            lambda: lesson_gateway.get_by_group_id(group_id, WeekParity.ODD),
+        ),
+        (
+            'LessonGateway.get_by_group_id_extended',
+            lambda: lesson_gateway.get_by_group_id_extended(group_id, WeekParity.ANY),
+        ),
+        (
+            'LessonGateway.get_by_group_ids_extended',
+            lambda: lesson_gateway.get_by_group_ids_extended(
+                [group_id],
+                WeekParity.ANY,
+            ),
+        ),
+        (
+            'LessonGateway.get_group_schedule_by_group_id',
+            lambda: lesson_gateway.get_group_schedule_by_group_id(
+                group_id,
+                WeekParity.ANY,
+            ),
+        ),
+        (
+            'LessonGateway.get_by_teacher_id_extended',
+            lambda: lesson_gateway.get_by_teacher_id_extended(
+                teacher_id,
+                WeekParity.ANY,
+            ),
+        ),
+        (
+            'cached_teacher_schedule',
+            lambda: cached_teacher_schedule(
+                teacher_id=teacher_id,
+                week_parity=WeekParity.ANY,
+                lesson_gateway=lesson_gateway,
+                teacher_gateway=teacher_gateway,
+                schedule_cache=InMemoryScheduleCache(max_size=0, ttl=0),
+            ),
+        ),
+        (
+            'LessonGateway.get_schedule_parsed_at_by_teacher_id',
+            lambda: lesson_gateway.get_schedule_parsed_at_by_teacher_id(teacher_id),
+        ),
+        (
+            'LessonGateway.get_by_room_extended',
+            lambda: lesson_gateway.get_by_room_extended(
+                data['building_number'],
+                data['audience_number'],
+                WeekParity.ANY,
+            ),
+        ),
+        (
+            'LessonGateway.get_by_id_extended',
+            lambda: lesson_gateway.get_by_id_extended(data['lesson_id']),
+        ),
+        (
+            'LessonOccurrenceGateway.regenerate_for_group',
+            lambda: lesson_occurrence_gateway.regenerate_for_group(
+                group_id,
+                date_from,
+                date_to,
+            ),
+        ),
+        (
+            'LessonOccurrenceGateway.regenerate_for_lesson',
+            lambda: lesson_occurrence_gateway.regenerate_for_lesson(
+                data['lesson_id'],
+                date_from,
+                date_to,
+            ),
+        ),
+        (
+            'LessonOccurrenceGateway.get_by_group_id_extended',
+            lambda: lesson_occurrence_gateway.get_by_group_id_extended(
+                group_id,
+                date_from,
+                date_to,
+            ),
+        ),
+        (
+            'LessonOccurrenceGateway.get_by_teacher_id_extended',
+            lambda: lesson_occurrence_gateway.get_by_teacher_id_extended(
+                teacher_id,
+                date_from,
+                date_to,
+            ),
+        ),
+        (
+            'DisciplineGateway.get_by_kai_id',
+            lambda: discipline_gateway.get_by_kai_id(random_kai_id()),
+        ),
+        (
+            'DisciplineGateway.get_by_group_id_with_teachers',
+            lambda: discipline_gateway.get_by_group_id_with_teachers(group_id),
+        ),
+        (
+            'ExamGateway.get_by_group_id',
+            lambda: exam_gateway.get_by_group_id(group_id, '2024/2025', 1),
+        ),
+        (
+            'ExamGateway.get_by_group_id_extended',
+            lambda: exam_gateway.get_by_group_id_extended(group_id, None, None),
+        ),
+        (
+            'StudentGateway.get_by_email',
+            lambda: student_gateway.get_by_email('bench@example.com'),
+        ),
+        (
+            'StudentGateway.get_by_user_id',
+            lambda: student_gateway.get_by_user_id(str(uuid.uuid4())),
+        ),
+        (
+            'StudentGateway.get_by_group_id',
+            lambda: student_gateway.get_by_group_id(group_id),
+        ),
+        (
+            'TeacherGateway.get_by_login',
+            lambda: teacher_gateway.get_by_login('bench'),
+        ),
+        (
+            'TeacherGateway.get_by_id',
+            lambda: teacher_gateway.get_by_id(teacher_id),
+        ),
+        (
+            'ServiceTokenGateway.get_by_token',
+            lambda: ServiceTokenGateway(session).get_by_token('bench'),
+        ),
+        (
+            'RefreshTokenGateway.get_by_token',
+            lambda: RefreshTokenGateway(session).get_by_token('bench'),
+        ),
+    ]
+
+
+async def main() -> int:
+    session_maker = new_session_maker(get_settings().postgres)
+    failures = []
+
+    async with session_maker() as session:
+        try:
+            data = await _seed(session)
+            await session.execute(text('SET LOCAL enable_seqscan = off'))
+
+            recording_session = RecordingSession(session)
+            for name, call in _get_cases(recording_session, data):
+                recording_session.statements.clear()
+                await call()
+
+                queries_count = len(recording_session.statements)
+                if queries_count > QUERY_LIMITS.get(name, queries_count):
+                    failures.append(name)
+                    print(f'FAIL {name}: {queries_count} queries')
+
+                for statement in recording_session.statements:
+                    seq_scans = await _get_seq_scans(session, statement)
+                    if seq_scans:
+                        failures.append(name)
+                        print(f'FAIL {name}: Seq Scan on {", ".join(seq_scans)}')
+                        print(f'     {statement}')
+                    else:
+                        print(f'ok   {name}')
+        finally:
+            await session.rollback()
+
+    print(f'{len(failures)} failed checks')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
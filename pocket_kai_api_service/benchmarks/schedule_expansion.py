@@ -0,0 +1,127 @@
+"""
+Сравнивает раскладку пар по датам перебором всех пар для каждого дня
+и через индексы ScheduleExpander на диапазонах 7, 31 и 120 дней.
+
+Запуск из корня сервиса: python -m benchmarks.schedule_expansion --lessons 64
+База данных не нужна, пары создаются в памяти.
+"""
+
+import argparse
+import datetime as dt
+import uuid
+
+from benchmarks.common import measure_sync
+from pocket_kai.domain.common import LessonType, ParsedDatesStatus, WeekParity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.schedule import ScheduleExpander
+
+
+DAYS_COUNTS = (7, 31, 120)
+
+
+def make_lessons(lessons_count: int, date_from: dt.date) -> list[LessonEntity]:
+    parities = (WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN)
+    lessons = [
+        LessonEntity(
+            id=str(uuid.uuid4()),
+            created_at=dt.datetime.utcnow(),
+            number_of_day=i % 6 + 1,
+            original_dates=None,
+            parsed_parity=parities[i % 3],
+            # Каждая пятая пара проходит только в конкретные даты
+            parsed_dates=[
+                date_from + dt.timedelta(days=days)
+                for days in range(i % 6, 120, 14)
+            ]
+            if i % 5 == 0
+            else None,
+            parsed_dates_status=ParsedDatesStatus.GOOD,
+            start_time=dt.time(8 + i % 10, 0),
+            end_time=dt.time(9 + i % 10, 30),
+            audience_number=str(100 + i),
+            building_number=str(i % 8 + 1),
+            original_lesson_type='лек',
+            parsed_lesson_type=LessonType.lecture,
+            group_id=uuid.uuid4(),
+            discipline_id=uuid.uuid4(),
+            department_id=None,
+            teacher_id=None,
+        )
+        for i in range(lessons_count)
+    ]
+    lessons.sort(key=lambda lesson: (lesson.number_of_day, lesson.start_time))
+
+    return lessons
+
+
+def linear_filter(
+    lessons: list[LessonEntity],
+    date_from: dt.date,
+    days_count: int,
+) -> list[list[LessonEntity]]:
+    # Раскладка до перехода на индексы
+    days = []
+    for days_offset in range(days_count):
+        date = date_from + dt.timedelta(days=days_offset)
+        day_number = date.isoweekday()
+        date_week_parity = WeekParity.get_parity_for_date(date)
+        filtered_lessons = []
+        for lesson in lessons:
+            if lesson.parsed_dates:
+                if date in lesson.parsed_dates:
+                    filtered_lessons.append(lesson)
+            elif lesson.number_of_day == day_number and lesson.parsed_parity in (
+                WeekParity.ANY,
+                date_week_parity,
+            ):
+                filtered_lessons.append(lesson)
+        days.append(filtered_lessons)
+
+    return days
+
+
+def indexed_expansion(
+    lessons: list[LessonEntity],
+    date_from: dt.date,
+    days_count: int,
+) -> list[list[LessonEntity]]:
+    return [
+        day_lessons
+        for _, _, day_lessons in ScheduleExpander(lessons).expand(
+            date_from=date_from,
+            days_count=days_count,
+        )
+    ]
+
+
+def main(lessons_count: int, iterations: int) -> None:
+    date_from = dt.date.today()
+    lessons = make_lessons(lessons_count, date_from)
+
+    print(f'{lessons_count} lessons, {iterations} iterations')
+    for days_count in DAYS_COUNTS:
+        assert linear_filter(lessons, date_from, days_count) == indexed_expansion(
+            lessons,
+            date_from,
+            days_count,
+        ), 'Expansions returned different lessons'
+
+        measure_sync(
+            f'linear filter, {days_count} days',
+            lambda: linear_filter(lessons, date_from, days_count),
+            iterations,
+        )
+        measure_sync(
+            f'ScheduleExpander, {days_count} days',
+            lambda: indexed_expansion(lessons, date_from, days_count),
+            iterations,
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lessons', type=int, default=64)
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args()
+
+    main(lessons_count=args.lessons, iterations=args.iterations)
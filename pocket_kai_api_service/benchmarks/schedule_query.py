@@ -0,0 +1,98 @@
+"""
+Сравнивает чтение расписания группы через selectinload и через один запрос
+с JOIN, из строк которого сразу собираются DTO.
+
+Запуск из корня сервиса: python -m benchmarks.schedule_query --lessons 64
+Тестовые данные создаются в транзакции, которая откатывается после замеров.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from benchmarks.common import measure, seed_group_with_lessons
+from pocket_kai.config import get_settings
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.infrastructure.cache import InMemoryReferenceCatalog
+from pocket_kai.infrastructure.database.database import new_session_maker
+from pocket_kai.infrastructure.database.models.kai import LessonModel
+from pocket_kai.infrastructure.gateways.group import GroupGateway
+from pocket_kai.infrastructure.gateways.lesson import LessonGateway
+
+
+async def selectinload_path(session: AsyncSession, group_name: str) -> list:
+    # Путь чтения до перехода на один запрос
+    group = await GroupGateway(
+        session,
+        InMemoryReferenceCatalog(),
+    ).get_by_name(group_name)
+    lessons = await session.scalars(
+        select(LessonModel)
+        .where(
+            LessonModel.group_id == group.id,
+            LessonModel.parsed_parity.in_(
+                {WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN},
+            ),
+        )
+        .order_by(LessonModel.number_of_day, LessonModel.start_time)
+        .options(
+            selectinload(LessonModel.discipline),
+            selectinload(LessonModel.department),
+            selectinload(LessonModel.teacher),
+        ),
+    )
+    result = [LessonGateway._db_to_extended_dto(lesson) for lesson in lessons.all()]
+    session.expunge_all()
+
+    return result
+
+
+async def single_query_path(session: AsyncSession, group_id: str) -> list:
+    _, lessons = await LessonGateway(session).get_group_schedule_by_group_id(
+        group_id=group_id,
+        week_parity=WeekParity.ANY,
+    )
+
+    return lessons
+
+
+async def main(lessons_count: int, iterations: int) -> None:
+    session_maker = new_session_maker(get_settings().postgres)
+
+    async with session_maker() as session:
+        try:
+            group = await seed_group_with_lessons(session, lessons_count)
+            group_id, group_name = group.id, group.group_name
+            session.expunge_all()
+
+            old_lessons = await selectinload_path(session, group_name)
+            new_lessons = await single_query_path(session, group_id)
+            assert {lesson.id for lesson in old_lessons} == {
+                lesson.id for lesson in new_lessons
+            }, 'Paths returned different lessons'
+
+            print(f'Group with {lessons_count} lessons, {iterations} iterations')
+            await measure(
+                'get_by_name + selectinload',
+                lambda: selectinload_path(session, group_name),
+                iterations,
+            )
+            await measure(
+                'get_group_schedule_by_group_id',
+                lambda: single_query_path(session, group_id),
+                iterations,
+            )
+        finally:
+            await session.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lessons', type=int, default=64)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(lessons_count=args.lessons, iterations=args.iterations))
@@ -0,0 +1,164 @@
+"""
+Сравнивает поиск преподавателей по ФИО через pg_trgm в SQL
+и через триграммный индекс в памяти.
+
+Запуск из корня сервиса: python -m benchmarks.teacher_search --teachers 3000
+Тестовые данные создаются в транзакции, которая откатывается после замеров.
+"""
+
+import argparse
+import asyncio
+import itertools
+import uuid
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from benchmarks.common import measure, measure_sync
+from pocket_kai.config import get_settings
+from pocket_kai.infrastructure.database.database import new_session_maker
+from pocket_kai.infrastructure.database.models.kai import TeacherModel
+from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
+
+
+SURNAMES = (
+    'Иванов', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Петров', 'Соколов',
+    'Михайлов', 'Новиков', 'Федоров', 'Морозов', 'Волков', 'Алексеев', 'Лебедев',
+    'Семенов', 'Егоров', 'Павлов', 'Козлов', 'Степанов', 'Николаев', 'Орлов',
+    'Андреев', 'Макаров', 'Никитин', 'Захаров', 'Зайцев', 'Соловьев', 'Борисов',
+)
+FIRST_NAMES = (
+    'Александр', 'Дмитрий', 'Максим', 'Сергей', 'Андрей', 'Алексей', 'Артем',
+    'Илья', 'Кирилл', 'Михаил', 'Никита', 'Матвей', 'Роман', 'Егор', 'Арсений',
+)
+PATRONYMICS = (
+    'Александрович', 'Дмитриевич', 'Сергеевич', 'Андреевич', 'Алексеевич',
+    'Михайлович', 'Николаевич', 'Владимирович', 'Игоревич', 'Олегович',
+)
+QUERIES = ('иванов', 'смирнов сергей', 'михайлович', 'кузнецв', 'петров а', 'ор')
+LIMIT = 20
+
+
+async def sql_suggest_by_name(
+    session: AsyncSession,
+    name: str,
+    limit: int,
+    similarity_threshold: float,
+) -> list[str]:
+    # Запрос, которым поиск выполнялся до перехода на индекс в памяти
+    name = name.replace('ё', 'е').lower()
+
+    name_parts_subq = select(
+        TeacherModel.id,
+        func.unnest(func.string_to_array(func.lower(TeacherModel.name), ' ')).label(
+            'name_part',
+        ),
+    ).cte('name_parts')
+    search_query_subq = select(
+        func.unnest(func.string_to_array(name, ' ')).label('query_part'),
+    ).cte('search_query')
+    similarities_subq = (
+        select(
+            TeacherModel,
+            func.avg(
+                func.similarity(
+                    search_query_subq.c.query_part,
+                    name_parts_subq.c.name_part,
+                ),
+            ).label('avg_similarity'),
+        )
+        .join(name_parts_subq, TeacherModel.id == name_parts_subq.c.id)
+        .join(search_query_subq, text('True'))
+        .group_by(TeacherModel.id, TeacherModel.name)
+        .cte('similarities')
+    )
+    similarities_alias = aliased(TeacherModel, similarities_subq)
+
+    records = await session.scalars(
+        select(similarities_alias)
+        .where(
+            or_(
+                similarities_subq.c.avg_similarity >= similarity_threshold,
+                similarities_subq.c.name.ilike(f'%{name}%'),
+            ),
+        )
+        .order_by(
+            similarities_subq.c.avg_similarity.desc(),
+            similarities_subq.c.name,
+        )
+        .limit(limit),
+    )
+
+    return [record.id for record in records]
+
+
+async def main(teachers_count: int, iterations: int) -> None:
+    settings = get_settings()
+    threshold = settings.common.TEACHER_SEARCH_SIMILARITY
+    session_maker = new_session_maker(settings.postgres)
+
+    async with session_maker() as session:
+        try:
+            suffix = uuid.uuid4().hex[:8]
+            names = itertools.cycle(
+                itertools.product(SURNAMES, FIRST_NAMES, PATRONYMICS),
+            )
+            session.add_all(
+                TeacherModel(login=f'bench-{suffix}-{i}', name=' '.join(next(names)))
+                for i in range(teachers_count)
+            )
+            await session.flush()
+            session.expunge_all()
+
+            search_index = TeacherSearchIndex()
+            gateway = TeacherGateway(
+                session=session,
+                search_similarity_threshold=threshold,
+                search_index=search_index,
+            )
+            await measure(
+                'index load',
+                lambda: gateway._get_search_index(),
+                iterations=1,
+                warmup=0,
+            )
+
+            # Порядок при равной похожести зависит от сортировки строк в БД,
+            # поэтому сравниваются множества найденных преподавателей
+            for query in QUERIES:
+                sql_ids = await sql_suggest_by_name(session, query, LIMIT, threshold)
+                index_ids = [
+                    teacher.id
+                    for teacher in search_index.search(query, LIMIT, threshold)
+                ]
+                if set(sql_ids) != set(index_ids):
+                    print(f'Results differ for {query!r}')
+
+            print(
+                f'{len(search_index)} teachers, {len(QUERIES)} queries, '
+                f'{iterations} iterations',
+            )
+            for query in QUERIES:
+                await measure(
+                    f'sql {query!r}',
+                    lambda: sql_suggest_by_name(session, query, LIMIT, threshold),
+                    iterations,
+                )
+                measure_sync(
+                    f'index {query!r}',
+                    lambda: search_index.search(query, LIMIT, threshold),
+                    iterations,
+                )
+        finally:
+            await session.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teachers', type=int, default=3000)
+    parser.add_argument('--iterations', type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(teachers_count=args.teachers, iterations=args.iterations))
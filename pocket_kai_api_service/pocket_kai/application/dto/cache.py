@@ -0,0 +1,11 @@
+import dataclasses
+
+
+@dataclasses.dataclass(slots=True)
+class CacheStatsDTO:
+    name: str
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
@@ -0,0 +1,21 @@
+import datetime as dt
+
+import dataclasses
+
+
+@dataclasses.dataclass(slots=True)
+class CalendarEventDTO:
+    uid: str
+    date: dt.date
+    start_time: dt.time
+    end_time: dt.time
+    summary: str
+    location: str | None
+    description: str | None
+
+
+@dataclasses.dataclass(slots=True)
+class CalendarDTO:
+    name: str
+    parsed_at: dt.datetime | None
+    events: list[CalendarEventDTO]
@@ -63,3 +63,44 @@ class TeacherLessonExtendedDTO(LessonEntity):
     department: DepartmentEntity | None
     discipline: DisciplineEntity
     groups: list[GroupEntity]
+
+
+@dataclasses.dataclass(slots=True)
+class RoomLessonExtendedDTO(LessonEntity):
+    teacher: TeacherEntity | None
+    department: DepartmentEntity | None
+    discipline: DisciplineEntity
+    groups: list[GroupEntity]
+
+
+@dataclasses.dataclass(slots=True)
+class GroupWithLessonsDTO:
+    group: GroupEntity
+    lessons: list[LessonExtendedDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class LessonOccurrenceDTO:
+    date: date
+    lesson: LessonExtendedDTO
+
+
+@dataclasses.dataclass(slots=True)
+class TeacherLessonOccurrenceDTO:
+    date: date
+    lesson: TeacherLessonExtendedDTO
+
+
+@dataclasses.dataclass(slots=True)
+class LessonChangesDTO:
+    create: list[NewLessonDTO]
+    update: list[LessonEntity]
+    delete: list[str]
+
+
+@dataclasses.dataclass(slots=True)
+class LessonChangesResultDTO:
+    # id созданных пар идут в том же порядке, что и `LessonChangesDTO.create`
+    created: list[str]
+    updated: list[str]
+    deleted: list[str]
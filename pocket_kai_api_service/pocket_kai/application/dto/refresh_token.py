@@ -0,0 +1,12 @@
+from datetime import datetime
+
+import dataclasses
+
+
+@dataclasses.dataclass(slots=True)
+class RefreshTokenUsageDTO:
+    id: str
+    token: str
+    issued_at: datetime
+    expires_at: datetime
+    last_used_at: datetime
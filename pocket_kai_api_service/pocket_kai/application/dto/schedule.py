@@ -2,7 +2,11 @@ import datetime as dt
 
 import dataclasses
 
-from pocket_kai.application.dto.lesson import LessonExtendedDTO
+from pocket_kai.application.dto.lesson import (
+    LessonExtendedDTO,
+    RoomLessonExtendedDTO,
+    TeacherLessonExtendedDTO,
+)
 from pocket_kai.domain.common import WeekParity
 
 
@@ -35,3 +39,41 @@ class WeekDaysDTO:
     parsed_at: dt.datetime | None
     week_parity: WeekParity
     week_days: WeekDTO
+
+
+@dataclasses.dataclass(slots=True)
+class GroupWeekScheduleDTO:
+    group_id: str
+    group_name: str
+    schedule: WeekDaysDTO
+
+
+@dataclasses.dataclass(slots=True)
+class GroupScheduleDTO:
+    group_id: str
+    group_name: str
+    schedule: ScheduleDTO
+
+
+@dataclasses.dataclass(slots=True)
+class TeacherDayDTO:
+    date: dt.date
+    parity: WeekParity
+    lessons: list[TeacherLessonExtendedDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class TeacherScheduleDTO:
+    days: list[TeacherDayDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class RoomDayDTO:
+    date: dt.date
+    parity: WeekParity
+    lessons: list[RoomLessonExtendedDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class RoomScheduleDTO:
+    days: list[RoomDayDTO]
@@ -0,0 +1,67 @@
+import dataclasses
+import datetime as dt
+
+from pocket_kai.domain.common import LessonType, ParsedDatesStatus, WeekParity
+
+
+@dataclasses.dataclass(slots=True)
+class ParsedLessonDTO:
+    day_number: int
+    start_time: dt.time | None
+    end_time: dt.time | None
+    dates: str | None
+    parsed_dates: list[dt.date] | None
+    parsed_dates_status: ParsedDatesStatus
+    parsed_parity: WeekParity
+    parsed_lesson_type: LessonType
+
+    discipline_name: str
+    discipline_type: str
+    discipline_number: int
+
+    audience_number: str | None
+    building_number: str | None
+
+    department_id: int | None
+    department_name: str | None
+
+    teacher_name: str
+    teacher_login: str | None
+
+
+@dataclasses.dataclass(slots=True)
+class ParsedExamDTO:
+    date: str
+    parsed_date: dt.date | None
+    time: dt.time
+    discipline_name: str
+    discipline_number: int
+    audience_number: str | None
+    building_number: str | None
+    teacher_name: str
+    teacher_login: str | None
+
+
+@dataclasses.dataclass(slots=True)
+class GroupScheduleSyncDTO:
+    parsed_at: dt.datetime
+    lessons: list[ParsedLessonDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class GroupExamsSyncDTO:
+    parsed_at: dt.datetime
+    academic_year: str
+    academic_year_half: int
+    semester: int | None
+    exams: list[ParsedExamDTO]
+
+
+@dataclasses.dataclass(slots=True)
+class ScheduleSyncResultDTO:
+    unchanged: int
+    created: int
+    updated: int
+    deleted: int
+    # Экзамены не синхронизировались: на сайте ещё расписание прошлого семестра
+    skipped: bool = False
@@ -0,0 +1,10 @@
+import dataclasses
+
+from pocket_kai.domain.entitites.task import TaskEntity
+
+
+@dataclasses.dataclass(slots=True)
+class TaskPageDTO:
+    tasks: list[TaskEntity]
+    # Непрозрачный курсор сервиса парсинга, None - страница последняя
+    next_cursor: str | None
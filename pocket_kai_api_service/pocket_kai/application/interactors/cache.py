@@ -0,0 +1,33 @@
+from pocket_kai.application.dto.cache import CacheStatsDTO
+from pocket_kai.application.interfaces.cache import (
+    AccessTokenCache,
+    ReferenceCatalog,
+    ResponseCache,
+    ScheduleCache,
+    ServiceTokenCache,
+)
+
+
+class GetCacheStatsInteractor:
+    def __init__(
+        self,
+        schedule_cache: ScheduleCache,
+        response_cache: ResponseCache,
+        service_token_cache: ServiceTokenCache,
+        access_token_cache: AccessTokenCache,
+        reference_catalog: ReferenceCatalog,
+    ):
+        self._schedule_cache = schedule_cache
+        self._response_cache = response_cache
+        self._service_token_cache = service_token_cache
+        self._access_token_cache = access_token_cache
+        self._reference_catalog = reference_catalog
+
+    async def __call__(self) -> list[CacheStatsDTO]:
+        return [
+            *self._schedule_cache.stats(),
+            *self._response_cache.stats(),
+            *self._service_token_cache.stats(),
+            *self._access_token_cache.stats(),
+            *self._reference_catalog.stats(),
+        ]
@@ -0,0 +1,163 @@
+import datetime as dt
+
+from pocket_kai.application.dto.calendar import CalendarDTO, CalendarEventDTO
+from pocket_kai.application.interfaces.entities.group import GroupReader
+from pocket_kai.application.interfaces.entities.lesson import LessonReader
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceReader,
+)
+from pocket_kai.application.interfaces.entities.teacher import TeacherReader
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.exceptions.group import GroupNotFoundError
+from pocket_kai.domain.exceptions.teacher import TeacherNotFoundError
+
+
+DEFAULT_LESSON_DURATION = dt.timedelta(minutes=90)
+
+
+def _lesson_event(
+    lesson: LessonEntity,
+    date: dt.date,
+    discipline_name: str,
+    description: str | None,
+) -> CalendarEventDTO | None:
+    # Без времени начала пару нельзя поставить в календарь
+    if lesson.start_time is None:
+        return None
+
+    end_time = lesson.end_time
+    if end_time is None:
+        end_time = (
+            dt.datetime.combine(date, lesson.start_time) + DEFAULT_LESSON_DURATION
+        ).time()
+
+    summary = discipline_name
+    if lesson.original_lesson_type:
+        summary = f'{discipline_name} ({lesson.original_lesson_type})'
+
+    location_parts = []
+    if lesson.building_number:
+        location_parts.append(f'{lesson.building_number} зд.')
+    if lesson.audience_number:
+        location_parts.append(lesson.audience_number)
+
+    return CalendarEventDTO(
+        uid=f'{lesson.id}-{date:%Y%m%d}@pocket-kai',
+        date=date,
+        start_time=lesson.start_time,
+        end_time=end_time,
+        summary=summary,
+        location=', '.join(location_parts) or None,
+        description=description,
+    )
+
+
+class GetGroupCalendarInteractor:
+    def __init__(
+        self,
+        group_gateway: GroupReader,
+        lesson_occurrence_gateway: LessonOccurrenceReader,
+    ):
+        self._group_gateway = group_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+
+    async def __call__(
+        self,
+        group_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> CalendarDTO:
+        group = await self._group_gateway.get_by_id(group_id)
+        if group is None:
+            raise GroupNotFoundError
+
+        occurrences = await self._lesson_occurrence_gateway.get_by_group_id_extended(
+            group_id=group.id,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        events = [
+            _lesson_event(
+                occurrence.lesson,
+                date=occurrence.date,
+                discipline_name=occurrence.lesson.discipline.name,
+                description=occurrence.lesson.teacher.name
+                if occurrence.lesson.teacher
+                else None,
+            )
+            for occurrence in occurrences
+        ]
+
+        return CalendarDTO(
+            name=f'Расписание {group.group_name}',
+            parsed_at=group.schedule_parsed_at,
+            events=[event for event in events if event is not None],
+        )
+
+
+class GetTeacherCalendarVersionInteractor:
+    def __init__(
+        self,
+        teacher_gateway: TeacherReader,
+        lesson_gateway: LessonReader,
+    ):
+        self._teacher_gateway = teacher_gateway
+        self._lesson_gateway = lesson_gateway
+
+    async def __call__(self, teacher_id: str) -> dt.datetime | None:
+        teacher = await self._teacher_gateway.get_by_id(id=teacher_id)
+        if teacher is None:
+            raise TeacherNotFoundError
+
+        return await self._lesson_gateway.get_schedule_parsed_at_by_teacher_id(
+            teacher_id=teacher_id,
+        )
+
+
+class GetTeacherCalendarInteractor:
+    def __init__(
+        self,
+        teacher_gateway: TeacherReader,
+        lesson_gateway: LessonReader,
+        lesson_occurrence_gateway: LessonOccurrenceReader,
+    ):
+        self._teacher_gateway = teacher_gateway
+        self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+
+    async def __call__(
+        self,
+        teacher_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> CalendarDTO:
+        teacher = await self._teacher_gateway.get_by_id(id=teacher_id)
+        if teacher is None:
+            raise TeacherNotFoundError
+
+        occurrences = (
+            await self._lesson_occurrence_gateway.get_by_teacher_id_extended(
+                teacher_id=teacher_id,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        )
+        events = [
+            _lesson_event(
+                occurrence.lesson,
+                date=occurrence.date,
+                discipline_name=occurrence.lesson.discipline.name,
+                description=', '.join(
+                    group.group_name for group in occurrence.lesson.groups
+                ),
+            )
+            for occurrence in occurrences
+        ]
+
+        return CalendarDTO(
+            name=f'Расписание {teacher.name}',
+            parsed_at=await self._lesson_gateway.get_schedule_parsed_at_by_teacher_id(
+                teacher_id=teacher_id,
+            ),
+            events=[event for event in events if event is not None],
+        )
@@ -5,6 +5,8 @@ from pocket_kai.application.dto.group import (
     GroupPatchDTO,
     NewGroupDTO,
 )
+from pocket_kai.application.interactors.reference import get_reference
+from pocket_kai.application.interfaces.cache import ReferenceCatalog, ScheduleCache
 from pocket_kai.application.interfaces.common import DateTimeManager, UUIDGenerator
 from pocket_kai.application.interfaces.entities.department import DepartmentReader
 from pocket_kai.application.interfaces.entities.group import (
@@ -13,10 +15,19 @@ from pocket_kai.application.interfaces.entities.group import (
     GroupSaver,
 )
 from pocket_kai.application.interfaces.entities.institute import InstituteReader
+from pocket_kai.application.interfaces.entities.lesson import LessonReader
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceUpdater,
+)
 from pocket_kai.application.interfaces.entities.profile import ProfileReader
 from pocket_kai.application.interfaces.entities.speciality import SpecialityReader
 from pocket_kai.application.interfaces.unit_of_work import UnitOfWork
+from pocket_kai.domain.common import WeekParity, get_lesson_occurrences_window
+from pocket_kai.domain.entitites.department import DepartmentEntity
 from pocket_kai.domain.entitites.group import GroupEntity
+from pocket_kai.domain.entitites.institute import InstituteEntity
+from pocket_kai.domain.entitites.profile import ProfileEntity
+from pocket_kai.domain.entitites.speciality import SpecialityEntity
 from pocket_kai.domain.exceptions.group import GroupNotFoundError
 
 
@@ -27,27 +38,41 @@ class GroupExtendedDTOConverter:
         speciality_gateway: SpecialityReader,
         department_gateway: DepartmentReader,
         institute_gateway: InstituteReader,
+        reference_catalog: ReferenceCatalog,
     ):
         self._profile_gateway = profile_gateway
         self._speciality_gateway = speciality_gateway
         self._department_gateway = department_gateway
         self._institute_gateway = institute_gateway
+        self._reference_catalog = reference_catalog
 
     async def __call__(self, entity: GroupEntity) -> GroupExtendedDTO:
         return GroupExtendedDTO(
             **asdict(entity),
-            profile=await self._profile_gateway.get_by_id(entity.profile_id)
-            if entity.profile_id
-            else None,
-            speciality=await self._speciality_gateway.get_by_id(entity.speciality_id)
-            if entity.speciality_id
-            else None,
-            department=await self._department_gateway.get_by_id(entity.department_id)
-            if entity.department_id
-            else None,
-            institute=await self._institute_gateway.get_by_id(entity.institute_id)
-            if entity.institute_id
-            else None,
+            profile=await get_reference(
+                self._reference_catalog,
+                ProfileEntity,
+                entity.profile_id,
+                self._profile_gateway.get_by_id,
+            ),
+            speciality=await get_reference(
+                self._reference_catalog,
+                SpecialityEntity,
+                entity.speciality_id,
+                self._speciality_gateway.get_by_id,
+            ),
+            department=await get_reference(
+                self._reference_catalog,
+                DepartmentEntity,
+                entity.department_id,
+                self._department_gateway.get_by_id,
+            ),
+            institute=await get_reference(
+                self._reference_catalog,
+                InstituteEntity,
+                entity.institute_id,
+                self._institute_gateway.get_by_id,
+            ),
         )
 
 
@@ -82,13 +107,19 @@ class GetAllGroupsInteractor:
         is_short: bool,
         limit: int,
         offset: int,
+        after: tuple[str, str] | None = None,
     ) -> list[GroupExtendedDTO] | list[GroupEntity]:
         if is_short:
-            return await self._group_gateway.get_all(limit=limit, offset=offset)
+            return await self._group_gateway.get_all(
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
         else:
             return await self._group_gateway.get_all_extended(
                 limit=limit,
                 offset=offset,
+                after=after,
             )
 
 
@@ -122,6 +153,30 @@ class GetGroupByIdInteractor:
         )
 
 
+class GetShortGroupByNameInteractor:
+    def __init__(self, group_gateway: GroupReader):
+        self._group_gateway = group_gateway
+
+    async def __call__(self, group_name: str) -> GroupEntity:
+        group = await self._group_gateway.get_by_name(group_name=group_name)
+        if group is None:
+            raise GroupNotFoundError
+
+        return group
+
+
+class GetShortGroupByIdInteractor:
+    def __init__(self, group_gateway: GroupReader):
+        self._group_gateway = group_gateway
+
+    async def __call__(self, group_id: str) -> GroupEntity:
+        group = await self._group_gateway.get_by_id(id=group_id)
+        if group is None:
+            raise GroupNotFoundError
+
+        return group
+
+
 class CreateGroupInteractor:
     def __init__(
         self,
@@ -169,12 +224,20 @@ class PatchGroupByNameInteractor:
     def __init__(
         self,
         group_gateway: GroupGatewayProtocol,
+        lesson_gateway: LessonReader,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
         uow: UnitOfWork,
         group_extended_dto_converter: GroupExtendedDTOConverter,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
     ):
         self._group_gateway = group_gateway
+        self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
         self._uow = uow
         self._group_extended_dto_converter = group_extended_dto_converter
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
 
     async def __call__(
         self,
@@ -185,12 +248,29 @@ class PatchGroupByNameInteractor:
             group_name=group_name,
             group_patch=group_patch,
         )
-        await self._uow.commit()
 
         group = await self._group_gateway.get_by_name(group_name=group_name)
         if group is None:
             raise GroupNotFoundError
 
+        # Расписание группы обновилось, пересобираем даты проведения её пар
+        if 'schedule_parsed_at' in group_patch.model_fields_set:
+            await self._lesson_occurrence_gateway.regenerate_for_group(
+                group.id,
+                *get_lesson_occurrences_window(self._datetime_manager.now().date()),
+            )
+
+        group_lessons = await self._lesson_gateway.get_by_group_id(
+            group.id,
+            week_parity=WeekParity.ANY,
+        )
+        await self._uow.commit()
+        self._schedule_cache.invalidate_group(group.id)
+        # Группа входит в расписание только своих преподавателей
+        for teacher_id in {lesson.teacher_id for lesson in group_lessons}:
+            if teacher_id:
+                self._schedule_cache.invalidate_teacher(teacher_id)
+
         return await self._group_extended_dto_converter(group)
 
 
@@ -198,12 +278,20 @@ class PatchGroupByIdInteractor:
     def __init__(
         self,
         group_gateway: GroupGatewayProtocol,
+        lesson_gateway: LessonReader,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
         uow: UnitOfWork,
         group_extended_dto_converter: GroupExtendedDTOConverter,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
     ):
         self._group_gateway = group_gateway
+        self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
         self._uow = uow
         self._group_extended_dto_converter = group_extended_dto_converter
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
 
     async def __call__(
         self,
@@ -214,10 +302,27 @@ class PatchGroupByIdInteractor:
             id=group_id,
             group_patch=group_patch,
         )
-        await self._uow.commit()
 
         group = await self._group_gateway.get_by_id(id=group_id)
         if group is None:
             raise GroupNotFoundError
 
+        # Расписание группы обновилось, пересобираем даты проведения её пар
+        if 'schedule_parsed_at' in group_patch.model_fields_set:
+            await self._lesson_occurrence_gateway.regenerate_for_group(
+                group.id,
+                *get_lesson_occurrences_window(self._datetime_manager.now().date()),
+            )
+
+        group_lessons = await self._lesson_gateway.get_by_group_id(
+            group.id,
+            week_parity=WeekParity.ANY,
+        )
+        await self._uow.commit()
+        self._schedule_cache.invalidate_group(group.id)
+        # Группа входит в расписание только своих преподавателей
+        for teacher_id in {lesson.teacher_id for lesson in group_lessons}:
+            if teacher_id:
+                self._schedule_cache.invalidate_teacher(teacher_id)
+
         return await self._group_extended_dto_converter(group)
@@ -1,25 +1,42 @@
 from dataclasses import asdict
+from typing import AsyncIterator
 
 from pocket_kai.application.dto.lesson import (
+    GroupWithLessonsDTO,
+    LessonChangesDTO,
+    LessonChangesResultDTO,
     LessonExtendedDTO,
     NewLessonDTO,
     TeacherLessonExtendedDTO,
 )
+from pocket_kai.application.interactors.reference import get_reference
+from pocket_kai.application.interactors.schedule import cached_teacher_schedule
+from pocket_kai.application.interfaces.cache import (
+    ReferenceCatalog,
+    RoomOccupancyCache,
+    ScheduleCache,
+)
 from pocket_kai.application.interfaces.common import DateTimeManager, UUIDGenerator
 from pocket_kai.application.interfaces.entities.department import DepartmentReader
 from pocket_kai.application.interfaces.entities.discipline import DisciplineReader
+from pocket_kai.application.interfaces.entities.group import GroupUpdater
 from pocket_kai.application.interfaces.entities.lesson import (
     LessonDeleter,
     LessonGatewayProtocol,
     LessonReader,
     LessonSaver,
 )
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceUpdater,
+)
 from pocket_kai.application.interfaces.entities.teacher import TeacherReader
 from pocket_kai.application.interfaces.unit_of_work import UnitOfWork
-from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.common import WeekParity, get_lesson_occurrences_window
+from pocket_kai.domain.entitites.department import DepartmentEntity
+from pocket_kai.domain.entitites.discipline import DisciplineEntity
 from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.entitites.teacher import TeacherEntity
 from pocket_kai.domain.exceptions.lesson import LessonNotFoundError
-from pocket_kai.domain.exceptions.teacher import TeacherNotFoundError
 
 
 class ExtendedLessonConverter:
@@ -28,24 +45,33 @@ class ExtendedLessonConverter:
         teacher_gateway: TeacherReader,
         department_gateway: DepartmentReader,
         discipline_gateway: DisciplineReader,
+        reference_catalog: ReferenceCatalog,
     ):
         self._teacher_gateway = teacher_gateway
         self._department_gateway = department_gateway
         self._discipline_gateway = discipline_gateway
+        self._reference_catalog = reference_catalog
 
     async def __call__(self, entity: LessonEntity) -> LessonExtendedDTO:
         return LessonExtendedDTO(
             **asdict(entity),
-            teacher=await self._teacher_gateway.get_by_id(entity.teacher_id)
-            if entity.teacher_id
-            else None,
-            department=await self._department_gateway.get_by_id(
+            teacher=await get_reference(
+                self._reference_catalog,
+                TeacherEntity,
+                entity.teacher_id,
+                self._teacher_gateway.get_by_id,
+            ),
+            department=await get_reference(
+                self._reference_catalog,
+                DepartmentEntity,
                 entity.department_id,
-            )
-            if entity.department_id
-            else None,
-            discipline=await self._discipline_gateway.get_by_id(
+                self._department_gateway.get_by_id,
+            ),
+            discipline=await get_reference(
+                self._reference_catalog,
+                DisciplineEntity,
                 entity.discipline_id,
+                self._discipline_gateway.get_by_id,
             ),
         )
 
@@ -64,21 +90,40 @@ class GetLessonsByGroupIdInteractor:
         )
 
 
+class ExportGroupsWithLessonsInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonReader,
+    ):
+        self._lesson_gateway = lesson_gateway
+
+    def __call__(self) -> AsyncIterator[GroupWithLessonsDTO]:
+        return self._lesson_gateway.stream_groups_with_lessons()
+
+
 class CreateLessonInteractor:
     def __init__(
         self,
         lesson_gateway: LessonSaver,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
+        group_gateway: GroupUpdater,
         extended_lesson_converter: ExtendedLessonConverter,
         uow: UnitOfWork,
         uuid_generator: UUIDGenerator,
         datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+        room_occupancy_cache: RoomOccupancyCache,
     ):
         self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._group_gateway = group_gateway
         self._extended_lesson_converter = extended_lesson_converter
 
         self._uow = uow
         self._uuid_generator = uuid_generator
         self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+        self._room_occupancy_cache = room_occupancy_cache
 
     async def __call__(self, new_lesson: NewLessonDTO) -> LessonExtendedDTO:
         lesson = LessonEntity(
@@ -101,7 +146,16 @@ class CreateLessonInteractor:
             group_id=new_lesson.group_id,
         )
         await self._lesson_gateway.save(lesson)
+        await self._lesson_occurrence_gateway.regenerate_for_lesson(
+            lesson.id,
+            *get_lesson_occurrences_window(lesson.created_at.date()),
+        )
+        await self._group_gateway.touch_schedule([lesson.group_id], lesson.created_at)
         await self._uow.commit()
+        self._schedule_cache.invalidate_group(lesson.group_id)
+        if lesson.teacher_id:
+            self._schedule_cache.invalidate_teacher(lesson.teacher_id)
+        self._room_occupancy_cache.upsert_lesson(lesson)
 
         return await self._extended_lesson_converter(lesson)
 
@@ -110,57 +164,179 @@ class DeleteLessonInteractor:
     def __init__(
         self,
         lesson_gateway: LessonDeleter,
+        group_gateway: GroupUpdater,
         uow: UnitOfWork,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+        room_occupancy_cache: RoomOccupancyCache,
     ):
         self._lesson_gateway = lesson_gateway
+        self._group_gateway = group_gateway
         self._uow = uow
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+        self._room_occupancy_cache = room_occupancy_cache
 
     async def __call__(self, lesson_id: str) -> None:
-        await self._lesson_gateway.delete(lesson_id)
+        lesson = await self._lesson_gateway.delete(lesson_id)
+        if lesson is not None:
+            await self._group_gateway.touch_schedule(
+                [lesson.group_id],
+                self._datetime_manager.now(),
+            )
         await self._uow.commit()
 
+        if lesson is not None:
+            self._schedule_cache.invalidate_group(lesson.group_id)
+            if lesson.teacher_id:
+                self._schedule_cache.invalidate_teacher(lesson.teacher_id)
+            self._room_occupancy_cache.remove_lesson(lesson.id)
+
 
 class UpdateLessonInteractor:
     def __init__(
         self,
         lesson_gateway: LessonGatewayProtocol,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
+        group_gateway: GroupUpdater,
         extended_lesson_converter: ExtendedLessonConverter,
         uow: UnitOfWork,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+        room_occupancy_cache: RoomOccupancyCache,
     ):
         self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._group_gateway = group_gateway
         self._lesson_extended_converter = extended_lesson_converter
 
         self._uow = uow
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+        self._room_occupancy_cache = room_occupancy_cache
 
     async def __call__(self, lesson_entity: LessonEntity) -> LessonExtendedDTO:
         lesson = await self._lesson_gateway.get_by_id_extended(lesson_entity.id)
         if lesson is None:
             raise LessonNotFoundError
 
+        now = self._datetime_manager.now()
         await self._lesson_gateway.update(lesson_entity)
+        await self._lesson_occurrence_gateway.regenerate_for_lesson(
+            lesson_entity.id,
+            *get_lesson_occurrences_window(now.date()),
+        )
+        await self._group_gateway.touch_schedule(
+            list({lesson.group_id, lesson_entity.group_id}),
+            now,
+        )
         await self._uow.commit()
+        self._schedule_cache.invalidate_group(lesson.group_id)
+        self._schedule_cache.invalidate_group(lesson_entity.group_id)
+        for teacher_id in (lesson.teacher_id, lesson_entity.teacher_id):
+            if teacher_id:
+                self._schedule_cache.invalidate_teacher(teacher_id)
+        self._room_occupancy_cache.upsert_lesson(lesson_entity)
         return await self._lesson_extended_converter(lesson_entity)
 
 
+class ApplyLessonChangesInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonGatewayProtocol,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
+        group_gateway: GroupUpdater,
+        uow: UnitOfWork,
+        uuid_generator: UUIDGenerator,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+        room_occupancy_cache: RoomOccupancyCache,
+    ):
+        self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._group_gateway = group_gateway
+
+        self._uow = uow
+        self._uuid_generator = uuid_generator
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+        self._room_occupancy_cache = room_occupancy_cache
+
+    async def __call__(self, changes: LessonChangesDTO) -> LessonChangesResultDTO:
+        """
+        Применяет создание, изменение и удаление пар в одной транзакции.
+        Если хотя бы одной изменяемой пары нет, не применяется ничего
+        """
+        now = self._datetime_manager.now()
+        new_lessons = [
+            LessonEntity(
+                id=self._uuid_generator(),
+                created_at=now,
+                **asdict(new_lesson),
+            )
+            for new_lesson in changes.create
+        ]
+
+        # Старые значения нужны для сброса кэшей прежних группы и преподавателя
+        update_ids = {str(lesson.id) for lesson in changes.update}
+        old_lessons = await self._lesson_gateway.get_by_ids(list(update_ids))
+        if len(old_lessons) != len(update_ids):
+            raise LessonNotFoundError
+
+        deleted_lessons = await self._lesson_gateway.delete_many(changes.delete)
+        await self._lesson_gateway.update_many(changes.update)
+        await self._lesson_gateway.save_many(new_lessons)
+        await self._lesson_occurrence_gateway.regenerate_for_lessons(
+            [lesson.id for lesson in (*changes.update, *new_lessons)],
+            *get_lesson_occurrences_window(now.date()),
+        )
+        touched_lessons = (
+            *old_lessons,
+            *changes.update,
+            *new_lessons,
+            *deleted_lessons,
+        )
+        touched_group_ids = {lesson.group_id for lesson in touched_lessons}
+        await self._group_gateway.touch_schedule(list(touched_group_ids), now)
+        await self._uow.commit()
+
+        for group_id in touched_group_ids:
+            self._schedule_cache.invalidate_group(group_id)
+        for teacher_id in {lesson.teacher_id for lesson in touched_lessons}:
+            if teacher_id:
+                self._schedule_cache.invalidate_teacher(teacher_id)
+        for lesson in (*changes.update, *new_lessons):
+            self._room_occupancy_cache.upsert_lesson(lesson)
+        for lesson in deleted_lessons:
+            self._room_occupancy_cache.remove_lesson(lesson.id)
+
+        return LessonChangesResultDTO(
+            created=[lesson.id for lesson in new_lessons],
+            updated=[lesson.id for lesson in changes.update],
+            deleted=[lesson.id for lesson in deleted_lessons],
+        )
+
+
 class GetLessonsByTeacherIdInteractor:
     def __init__(
         self,
         lesson_gateway: LessonReader,
         teacher_gateway: TeacherReader,
+        schedule_cache: ScheduleCache,
     ):
         self._lesson_gateway = lesson_gateway
         self._teacher_gateway = teacher_gateway
+        self._schedule_cache = schedule_cache
 
     async def __call__(
         self,
         teacher_id: str,
         week_parity: WeekParity,
     ) -> list[TeacherLessonExtendedDTO]:
-        teacher = await self._teacher_gateway.get_by_id(id=teacher_id)
-        if teacher is None:
-            raise TeacherNotFoundError
-
-        return await self._lesson_gateway.get_by_teacher_id_extended(
+        return await cached_teacher_schedule(
             teacher_id=teacher_id,
             week_parity=week_parity,
+            lesson_gateway=self._lesson_gateway,
+            teacher_gateway=self._teacher_gateway,
+            schedule_cache=self._schedule_cache,
         )
@@ -0,0 +1,25 @@
+from typing import Awaitable, Callable
+
+from pocket_kai.application.interfaces.cache import R, ReferenceCatalog
+
+
+async def get_reference(
+    reference_catalog: ReferenceCatalog,
+    entity_type: type[R],
+    id: str | None,
+    get_by_id: Callable[[str], Awaitable[R | None]],
+) -> R | None:
+    """
+    Берёт запись справочника из каталога, а при промахе - из БД через
+    `get_by_id` и добавляет её в каталог
+    """
+    if not id:
+        return None
+
+    entity = reference_catalog.get(entity_type, id)
+    if entity is None:
+        entity = await get_by_id(id)
+        if entity is not None:
+            reference_catalog.add(entity)
+
+    return entity
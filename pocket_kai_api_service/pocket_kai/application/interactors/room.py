@@ -0,0 +1,83 @@
+import datetime as dt
+
+from pocket_kai.application.dto.lesson import RoomLessonExtendedDTO
+from pocket_kai.application.dto.schedule import RoomDayDTO, RoomScheduleDTO
+from pocket_kai.application.interfaces.cache import RoomOccupancyCache
+from pocket_kai.application.interfaces.entities.lesson import LessonReader
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.room_occupancy import RoomOccupancyIndex
+from pocket_kai.domain.schedule import ScheduleExpander
+
+
+class GetFreeRoomsInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonReader,
+        room_occupancy_cache: RoomOccupancyCache,
+    ):
+        self._lesson_gateway = lesson_gateway
+        self._room_occupancy_cache = room_occupancy_cache
+
+    async def __call__(
+        self,
+        building_number: str,
+        date: dt.date,
+        pair_number: int,
+    ) -> list[str]:
+        index = self._room_occupancy_cache.get_index()
+        # Индекс строится при старте приложения, здесь - только если
+        # при старте его не удалось загрузить
+        if index is None:
+            index = RoomOccupancyIndex(await self._lesson_gateway.get_all_with_room())
+            self._room_occupancy_cache.set_index(index)
+
+        return index.get_free_rooms(
+            building_number=building_number,
+            date=date,
+            pair_number=pair_number,
+        )
+
+
+class GetLessonsByRoomInteractor:
+    def __init__(self, lesson_gateway: LessonReader):
+        self._lesson_gateway = lesson_gateway
+
+    async def __call__(
+        self,
+        building_number: str,
+        audience_number: str,
+        week_parity: WeekParity,
+    ) -> list[RoomLessonExtendedDTO]:
+        return await self._lesson_gateway.get_by_room_extended(
+            building_number=building_number,
+            audience_number=audience_number,
+            week_parity=week_parity,
+        )
+
+
+class GetDatesScheduleByRoomInteractor:
+    def __init__(self, lesson_gateway: LessonReader):
+        self._lesson_gateway = lesson_gateway
+
+    async def __call__(
+        self,
+        building_number: str,
+        audience_number: str,
+        date_from: dt.date,
+        days_count: int,
+    ) -> RoomScheduleDTO:
+        room_lessons = await self._lesson_gateway.get_by_room_extended(
+            building_number=building_number,
+            audience_number=audience_number,
+            week_parity=WeekParity.ANY,
+        )
+
+        return RoomScheduleDTO(
+            days=[
+                RoomDayDTO(date=date, parity=parity, lessons=lessons)
+                for date, parity, lessons in ScheduleExpander(room_lessons).expand(
+                    date_from=date_from,
+                    days_count=days_count,
+                )
+            ],
+        )
@@ -1,18 +1,34 @@
 import datetime as dt
 
+from collections import defaultdict
 
-from pocket_kai.application.dto.lesson import LessonExtendedDTO
+from pocket_kai.application.dto.lesson import (
+    LessonExtendedDTO,
+    TeacherLessonExtendedDTO,
+)
 from pocket_kai.application.dto.schedule import (
     DayDTO,
+    GroupScheduleDTO,
+    GroupWeekScheduleDTO,
     ScheduleDTO,
+    TeacherDayDTO,
+    TeacherScheduleDTO,
     WeekDTO,
     WeekDaysDTO,
 )
+from pocket_kai.application.interfaces.cache import ScheduleCache
+from pocket_kai.application.interfaces.common import DateTimeManager
 from pocket_kai.application.interfaces.entities.group import GroupReader
 from pocket_kai.application.interfaces.entities.lesson import LessonReader
-from pocket_kai.domain.common import WeekParity
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceReader,
+)
+from pocket_kai.application.interfaces.entities.teacher import TeacherReader
+from pocket_kai.domain.common import WeekParity, get_lesson_occurrences_window
 from pocket_kai.domain.entitites.group import GroupEntity
 from pocket_kai.domain.exceptions.group import GroupNotFoundError
+from pocket_kai.domain.exceptions.teacher import TeacherNotFoundError
+from pocket_kai.domain.schedule import ScheduleExpander, get_week_parity
 
 
 async def week_schedule(
@@ -60,29 +76,78 @@ async def week_schedule(
     )
 
 
+async def cached_week_schedule(
+    group: GroupEntity,
+    week_parity: WeekParity,
+    lesson_gateway: LessonReader,
+    schedule_cache: ScheduleCache,
+) -> WeekDaysDTO:
+    schedule = schedule_cache.get_week_schedule(group.id, week_parity)
+    if schedule is not None:
+        return schedule
+
+    group_lessons = await lesson_gateway.get_by_group_id_extended(
+        group_id=group.id,
+        week_parity=week_parity,
+    )
+    schedule = await week_schedule(
+        group_lessons=group_lessons,
+        group=group,
+        week_parity=week_parity,
+    )
+    schedule_cache.set_week_schedule(group.id, week_parity, schedule)
+
+    return schedule
+
+
+async def cached_teacher_schedule(
+    teacher_id: str,
+    week_parity: WeekParity,
+    lesson_gateway: LessonReader,
+    teacher_gateway: TeacherReader,
+    schedule_cache: ScheduleCache,
+) -> list[TeacherLessonExtendedDTO]:
+    """
+    Объединённое расписание преподавателя из кэша или из БД. Существование
+    преподавателя проверяется отдельным запросом, только если занятий нет
+    """
+    lessons = schedule_cache.get_teacher_schedule(teacher_id, week_parity)
+    if lessons is not None:
+        return lessons
+
+    lessons = await lesson_gateway.get_by_teacher_id_extended(
+        teacher_id=teacher_id,
+        week_parity=week_parity,
+    )
+    if not lessons and await teacher_gateway.get_by_id(id=teacher_id) is None:
+        raise TeacherNotFoundError
+
+    schedule_cache.set_teacher_schedule(teacher_id, week_parity, lessons)
+
+    return lessons
+
+
 class GetWeekScheduleByGroupNameInteractor:
     def __init__(
         self,
         lesson_gateway: LessonReader,
         group_gateway: GroupReader,
+        schedule_cache: ScheduleCache,
     ):
         self._lesson_gateway = lesson_gateway
         self._group_gateway = group_gateway
+        self._schedule_cache = schedule_cache
 
     async def __call__(self, group_name: str, week_parity: WeekParity) -> WeekDaysDTO:
         group = await self._group_gateway.get_by_name(group_name)
         if group is None:
             raise GroupNotFoundError
 
-        group_lessons = await self._lesson_gateway.get_by_group_id_extended(
-            group_id=group.id,
-            week_parity=week_parity,
-        )
-
-        return await week_schedule(
-            group_lessons=group_lessons,
+        return await cached_week_schedule(
             group=group,
             week_parity=week_parity,
+            lesson_gateway=self._lesson_gateway,
+            schedule_cache=self._schedule_cache,
         )
 
 
@@ -90,47 +155,33 @@ class GetWeekScheduleByGroupIdInteractor:
     def __init__(
         self,
         lesson_gateway: LessonReader,
-        group_gateway: GroupReader,
+        schedule_cache: ScheduleCache,
     ):
         self._lesson_gateway = lesson_gateway
-        self._group_gateway = group_gateway
+        self._schedule_cache = schedule_cache
 
     async def __call__(self, group_id: str, week_parity: WeekParity) -> WeekDaysDTO:
-        group = await self._group_gateway.get_by_id(group_id)
-        if group is None:
-            raise GroupNotFoundError
+        schedule = self._schedule_cache.get_week_schedule(group_id, week_parity)
+        if schedule is not None:
+            return schedule
 
-        group_lessons = await self._lesson_gateway.get_by_group_id_extended(
-            group_id=group.id,
+        # Группа и её пары читаются одним запросом
+        group_schedule = await self._lesson_gateway.get_group_schedule_by_group_id(
+            group_id=group_id,
             week_parity=week_parity,
         )
+        if group_schedule is None:
+            raise GroupNotFoundError
 
-        return await week_schedule(
+        group, group_lessons = group_schedule
+        schedule = await week_schedule(
             group_lessons=group_lessons,
             group=group,
             week_parity=week_parity,
         )
+        self._schedule_cache.set_week_schedule(group.id, week_parity, schedule)
 
-
-def _filter_lessons_by_date(
-    group_lessons: list[LessonExtendedDTO],
-    date: dt.date,
-) -> list[LessonExtendedDTO]:
-    day_number = date.isoweekday()
-    date_week_parity = WeekParity.get_parity_for_date(date)
-    filtered_lessons = []
-
-    for lesson in group_lessons:
-        if lesson.parsed_dates:
-            if date in lesson.parsed_dates:
-                filtered_lessons.append(lesson)
-        elif lesson.number_of_day == day_number and lesson.parsed_parity in (
-            WeekParity.ANY,
-            date_week_parity,
-        ):
-            filtered_lessons.append(lesson)
-
-    return filtered_lessons
+        return schedule
 
 
 async def form_schedule(
@@ -139,15 +190,60 @@ async def form_schedule(
     group_lessons: list[LessonExtendedDTO],
     group: GroupEntity,
 ):
-    dates = [date_from + dt.timedelta(days=x) for x in range(days_count)]
+    schedule_days = [
+        DayDTO(date=date, parity=parity, lessons=lessons)
+        for date, parity, lessons in ScheduleExpander(group_lessons).expand(
+            date_from=date_from,
+            days_count=days_count,
+        )
+    ]
+
+    return ScheduleDTO(parsed_at=group.schedule_parsed_at, days=schedule_days)
+
+
+async def dates_schedule(
+    date_from: dt.date,
+    days_count: int,
+    group: GroupEntity,
+    today: dt.date,
+    lesson_gateway: LessonReader,
+    lesson_occurrence_gateway: LessonOccurrenceReader,
+) -> ScheduleDTO:
+    """
+    Собирает расписание по датам из материализованной таблицы lesson_occurrence.
+    Таблица покрывает текущий и следующий семестры (get_lesson_occurrences_window),
+    только для дат вне этого периода пары фильтруются в памяти
+    """
+    date_to = date_from + dt.timedelta(days=days_count - 1)
+    window_start, window_end = get_lesson_occurrences_window(today)
+    if date_from < window_start or date_to > window_end:
+        group_lessons = await lesson_gateway.get_by_group_id_extended(
+            group.id,
+            week_parity=WeekParity.ANY,
+        )
+        return await form_schedule(
+            date_from=date_from,
+            days_count=days_count,
+            group_lessons=group_lessons,
+            group=group,
+        )
+
+    occurrences = await lesson_occurrence_gateway.get_by_group_id_extended(
+        group_id=group.id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    lessons_by_date = defaultdict(list)
+    for occurrence in occurrences:
+        lessons_by_date[occurrence.date].append(occurrence.lesson)
 
     schedule_days = list()
-    for date in dates:
-        parity = WeekParity.get_parity_for_date(date)
+    for days in range(days_count):
+        date = date_from + dt.timedelta(days=days)
         schedule_day = DayDTO(
             date=date,
-            parity=parity,
-            lessons=_filter_lessons_by_date(group_lessons, date),
+            parity=get_week_parity(date),
+            lessons=lessons_by_date.get(date, []),
         )
         schedule_days.append(schedule_day)
 
@@ -159,9 +255,13 @@ class GetDatesScheduleByGroupNameInteractor:
         self,
         lesson_gateway: LessonReader,
         group_gateway: GroupReader,
+        lesson_occurrence_gateway: LessonOccurrenceReader,
+        datetime_manager: DateTimeManager,
     ):
         self._lesson_gateway = lesson_gateway
         self._group_gateway = group_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._datetime_manager = datetime_manager
 
     async def __call__(
         self,
@@ -173,16 +273,13 @@ class GetDatesScheduleByGroupNameInteractor:
         if group is None:
             raise GroupNotFoundError
 
-        group_lessons = await self._lesson_gateway.get_by_group_id_extended(
-            group.id,
-            week_parity=WeekParity.ANY,
-        )
-
-        return await form_schedule(
+        return await dates_schedule(
             date_from=date_from,
             days_count=days_count,
-            group_lessons=group_lessons,
             group=group,
+            today=self._datetime_manager.now().date(),
+            lesson_gateway=self._lesson_gateway,
+            lesson_occurrence_gateway=self._lesson_occurrence_gateway,
         )
 
 
@@ -191,9 +288,13 @@ class GetDatesScheduleByGroupIdInteractor:
         self,
         lesson_gateway: LessonReader,
         group_gateway: GroupReader,
+        lesson_occurrence_gateway: LessonOccurrenceReader,
+        datetime_manager: DateTimeManager,
     ):
         self._lesson_gateway = lesson_gateway
         self._group_gateway = group_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._datetime_manager = datetime_manager
 
     async def __call__(
         self,
@@ -205,14 +306,148 @@ class GetDatesScheduleByGroupIdInteractor:
         if group is None:
             raise GroupNotFoundError
 
-        group_lessons = await self._lesson_gateway.get_by_group_id_extended(
-            group.id,
-            week_parity=WeekParity.ANY,
-        )
-
-        return await form_schedule(
+        return await dates_schedule(
             date_from=date_from,
             days_count=days_count,
-            group_lessons=group_lessons,
             group=group,
+            today=self._datetime_manager.now().date(),
+            lesson_gateway=self._lesson_gateway,
+            lesson_occurrence_gateway=self._lesson_occurrence_gateway,
+        )
+
+
+class GetWeekScheduleBatchInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonReader,
+        group_gateway: GroupReader,
+        schedule_cache: ScheduleCache,
+    ):
+        self._lesson_gateway = lesson_gateway
+        self._group_gateway = group_gateway
+        self._schedule_cache = schedule_cache
+
+    async def __call__(
+        self,
+        group_ids: list[str],
+        group_names: list[str],
+        week_parity: WeekParity,
+    ) -> list[GroupWeekScheduleDTO]:
+        groups = await self._group_gateway.get_by_ids_and_names(
+            group_ids=group_ids,
+            group_names=group_names,
+        )
+
+        schedules = dict()
+        missing_groups = list()
+        for group in groups:
+            schedule = self._schedule_cache.get_week_schedule(group.id, week_parity)
+            if schedule is None:
+                missing_groups.append(group)
+            else:
+                schedules[group.id] = schedule
+
+        # Пары всех групп, которых нет в кэше, читаются одним запросом
+        if missing_groups:
+            lessons_by_group = await self._lesson_gateway.get_by_group_ids_extended(
+                group_ids=[group.id for group in missing_groups],
+                week_parity=week_parity,
+            )
+            for group in missing_groups:
+                schedule = await week_schedule(
+                    group_lessons=lessons_by_group.get(group.id, []),
+                    group=group,
+                    week_parity=week_parity,
+                )
+                self._schedule_cache.set_week_schedule(group.id, week_parity, schedule)
+                schedules[group.id] = schedule
+
+        return [
+            GroupWeekScheduleDTO(
+                group_id=group.id,
+                group_name=group.group_name,
+                schedule=schedules[group.id],
+            )
+            for group in groups
+        ]
+
+
+class GetDatesScheduleBatchInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonReader,
+        group_gateway: GroupReader,
+    ):
+        self._lesson_gateway = lesson_gateway
+        self._group_gateway = group_gateway
+
+    async def __call__(
+        self,
+        group_ids: list[str],
+        group_names: list[str],
+        date_from: dt.date,
+        days_count: int,
+    ) -> list[GroupScheduleDTO]:
+        groups = await self._group_gateway.get_by_ids_and_names(
+            group_ids=group_ids,
+            group_names=group_names,
+        )
+        if not groups:
+            return []
+
+        lessons_by_group = await self._lesson_gateway.get_by_group_ids_extended(
+            group_ids=[group.id for group in groups],
+            week_parity=WeekParity.ANY,
+        )
+
+        return [
+            GroupScheduleDTO(
+                group_id=group.id,
+                group_name=group.group_name,
+                schedule=await form_schedule(
+                    date_from=date_from,
+                    days_count=days_count,
+                    group_lessons=lessons_by_group.get(group.id, []),
+                    group=group,
+                ),
+            )
+            for group in groups
+        ]
+
+
+class GetDatesScheduleByTeacherIdInteractor:
+    def __init__(
+        self,
+        lesson_gateway: LessonReader,
+        teacher_gateway: TeacherReader,
+        schedule_cache: ScheduleCache,
+    ):
+        self._lesson_gateway = lesson_gateway
+        self._teacher_gateway = teacher_gateway
+        self._schedule_cache = schedule_cache
+
+    async def __call__(
+        self,
+        teacher_id: str,
+        date_from: dt.date,
+        days_count: int,
+    ) -> TeacherScheduleDTO:
+        # Объединённое расписание недели берётся из кэша или из БД
+        # и раскладывается по датам в памяти
+        teacher_lessons = await cached_teacher_schedule(
+            teacher_id=teacher_id,
+            week_parity=WeekParity.ANY,
+            lesson_gateway=self._lesson_gateway,
+            teacher_gateway=self._teacher_gateway,
+            schedule_cache=self._schedule_cache,
+        )
+
+        return TeacherScheduleDTO(
+            days=[
+                TeacherDayDTO(date=date, parity=parity, lessons=lessons)
+                for date, parity, lessons in ScheduleExpander(teacher_lessons).expand(
+                    date_from=date_from,
+                    days_count=days_count,
+                )
+            ],
         )
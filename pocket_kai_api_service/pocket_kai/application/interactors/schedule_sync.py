@@ -0,0 +1,401 @@
+import dataclasses
+
+from pocket_kai.application.dto.exam import ExamExtendedDTO
+from pocket_kai.application.dto.group import GroupPatchDTO
+from pocket_kai.application.dto.schedule_sync import (
+    GroupExamsSyncDTO,
+    GroupScheduleSyncDTO,
+    ParsedExamDTO,
+    ScheduleSyncResultDTO,
+)
+from pocket_kai.application.interfaces.cache import RoomOccupancyCache, ScheduleCache
+from pocket_kai.application.interfaces.common import DateTimeManager, UUIDGenerator
+from pocket_kai.application.interfaces.entities.department import DepartmentSaver
+from pocket_kai.application.interfaces.entities.discipline import DisciplineSaver
+from pocket_kai.application.interfaces.entities.exam import ExamGatewayProtocol
+from pocket_kai.application.interfaces.entities.group import GroupGatewayProtocol
+from pocket_kai.application.interfaces.entities.lesson import LessonGatewayProtocol
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceUpdater,
+)
+from pocket_kai.application.interfaces.entities.teacher import TeacherSaver
+from pocket_kai.application.interfaces.unit_of_work import UnitOfWork
+from pocket_kai.domain.common import WeekParity, get_lesson_occurrences_window
+from pocket_kai.domain.entitites.department import DepartmentEntity
+from pocket_kai.domain.entitites.discipline import DisciplineEntity
+from pocket_kai.domain.entitites.exam import ExamEntity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.entitites.teacher import TeacherEntity
+from pocket_kai.domain.exceptions.group import GroupNotFoundError
+from pocket_kai.domain.schedule_sync import (
+    diff_schedule,
+    exam_match_key,
+    exam_sync_key,
+    get_previous_semester,
+    lesson_match_key,
+    lesson_sync_key,
+)
+
+
+def _parsed_exam_key(exam: ParsedExamDTO) -> tuple:
+    return (
+        exam.date,
+        exam.parsed_date,
+        exam.time,
+        exam.discipline_number,
+        exam.audience_number,
+        exam.building_number,
+        exam.teacher_login or None,
+    )
+
+
+def _saved_exam_key(exam: ExamExtendedDTO) -> tuple:
+    return (
+        exam.original_date,
+        exam.parsed_date,
+        exam.time,
+        exam.discipline.kai_id,
+        exam.audience_number,
+        exam.building_number,
+        exam.teacher.login if exam.teacher else None,
+    )
+
+
+class ScheduleReferencesResolver:
+    """
+    Находит или создаёт преподавателей, дисциплины и кафедры из распарсенного
+    расписания одним запросом на каждый вид записей
+    """
+
+    def __init__(
+        self,
+        teacher_gateway: TeacherSaver,
+        discipline_gateway: DisciplineSaver,
+        department_gateway: DepartmentSaver,
+        uuid_generator: UUIDGenerator,
+        datetime_manager: DateTimeManager,
+    ):
+        self._teacher_gateway = teacher_gateway
+        self._discipline_gateway = discipline_gateway
+        self._department_gateway = department_gateway
+        self._uuid_generator = uuid_generator
+        self._datetime_manager = datetime_manager
+
+    async def get_teacher_ids(self, names_by_login: dict[str, str]) -> dict[str, str]:
+        now = self._datetime_manager.now()
+        teachers = await self._teacher_gateway.get_or_create_many(
+            [
+                TeacherEntity(
+                    id=self._uuid_generator(),
+                    created_at=now,
+                    login=login,
+                    name=name,
+                )
+                for login, name in names_by_login.items()
+            ],
+        )
+
+        return {teacher.login: teacher.id for teacher in teachers}
+
+    async def get_discipline_ids(
+        self,
+        names_by_kai_id: dict[int, str],
+    ) -> dict[int, str]:
+        now = self._datetime_manager.now()
+        disciplines = await self._discipline_gateway.get_or_create_many(
+            [
+                DisciplineEntity(
+                    id=self._uuid_generator(),
+                    created_at=now,
+                    kai_id=kai_id,
+                    name=name,
+                )
+                for kai_id, name in names_by_kai_id.items()
+            ],
+        )
+
+        return {discipline.kai_id: discipline.id for discipline in disciplines}
+
+    async def get_department_ids(
+        self,
+        names_by_kai_id: dict[int, str],
+    ) -> dict[int, str]:
+        now = self._datetime_manager.now()
+        departments = await self._department_gateway.get_or_create_many(
+            [
+                DepartmentEntity(
+                    id=self._uuid_generator(),
+                    created_at=now,
+                    kai_id=kai_id,
+                    name=name,
+                )
+                for kai_id, name in names_by_kai_id.items()
+            ],
+        )
+
+        return {department.kai_id: department.id for department in departments}
+
+
+class SyncGroupScheduleInteractor:
+    def __init__(
+        self,
+        group_gateway: GroupGatewayProtocol,
+        lesson_gateway: LessonGatewayProtocol,
+        lesson_occurrence_gateway: LessonOccurrenceUpdater,
+        references_resolver: ScheduleReferencesResolver,
+        uow: UnitOfWork,
+        uuid_generator: UUIDGenerator,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+        room_occupancy_cache: RoomOccupancyCache,
+    ):
+        self._group_gateway = group_gateway
+        self._lesson_gateway = lesson_gateway
+        self._lesson_occurrence_gateway = lesson_occurrence_gateway
+        self._references_resolver = references_resolver
+
+        self._uow = uow
+        self._uuid_generator = uuid_generator
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+        self._room_occupancy_cache = room_occupancy_cache
+
+    async def __call__(
+        self,
+        group_id: str,
+        schedule: GroupScheduleSyncDTO,
+    ) -> ScheduleSyncResultDTO:
+        """
+        Приводит пары группы к распарсенному расписанию в одной транзакции
+        """
+        group = await self._group_gateway.get_by_id(id=group_id)
+        if group is None:
+            raise GroupNotFoundError
+
+        teacher_ids = await self._references_resolver.get_teacher_ids(
+            {
+                lesson.teacher_login: lesson.teacher_name
+                for lesson in schedule.lessons
+                if lesson.teacher_login
+            },
+        )
+        discipline_ids = await self._references_resolver.get_discipline_ids(
+            {
+                lesson.discipline_number: lesson.discipline_name
+                for lesson in schedule.lessons
+            },
+        )
+        department_ids = await self._references_resolver.get_department_ids(
+            {
+                lesson.department_id: lesson.department_name
+                for lesson in schedule.lessons
+                if lesson.department_id is not None
+            },
+        )
+
+        now = self._datetime_manager.now()
+        parsed_lessons = [
+            LessonEntity(
+                id=self._uuid_generator(),
+                created_at=now,
+                number_of_day=lesson.day_number,
+                original_dates=lesson.dates,
+                parsed_parity=lesson.parsed_parity,
+                parsed_dates=lesson.parsed_dates,
+                parsed_dates_status=lesson.parsed_dates_status,
+                start_time=lesson.start_time,
+                end_time=lesson.end_time,
+                audience_number=lesson.audience_number,
+                building_number=lesson.building_number,
+                original_lesson_type=lesson.discipline_type,
+                parsed_lesson_type=lesson.parsed_lesson_type,
+                group_id=group.id,
+                discipline_id=discipline_ids[lesson.discipline_number],
+                department_id=department_ids.get(lesson.department_id),
+                teacher_id=teacher_ids.get(lesson.teacher_login),
+            )
+            for lesson in schedule.lessons
+        ]
+        saved_lessons = await self._lesson_gateway.get_by_group_id(
+            group.id,
+            week_parity=WeekParity.ANY,
+        )
+
+        diff = diff_schedule(
+            parsed_lessons,
+            saved_lessons,
+            key=lesson_sync_key,
+            match_key=lesson_match_key,
+        )
+        # Изменённая пара сохраняет свои id и дату создания
+        updated_lessons = [
+            dataclasses.replace(
+                parsed_lesson,
+                id=saved_lesson.id,
+                created_at=saved_lesson.created_at,
+            )
+            for saved_lesson, parsed_lesson in diff.changed
+        ]
+
+        await self._lesson_gateway.delete_many([lesson.id for lesson in diff.deleted])
+        await self._lesson_gateway.update_many(updated_lessons)
+        await self._lesson_gateway.save_many(diff.added)
+        await self._group_gateway.patch_by_id(
+            id=group.id,
+            group_patch=GroupPatchDTO(schedule_parsed_at=schedule.parsed_at),
+        )
+        # Как и при PATCH группы, даты пересобираются для всех её пар,
+        # чтобы окно материализации сдвигалось и для неизменных пар
+        await self._lesson_occurrence_gateway.regenerate_for_group(
+            group.id,
+            *get_lesson_occurrences_window(now.date()),
+        )
+        await self._uow.commit()
+
+        self._schedule_cache.invalidate_group(group.id)
+        # Сбрасываются только преподаватели изменённых пар: у остальных
+        # расписание не изменилось, а ночное обновление затрагивает все группы
+        changed_lessons = (
+            *(lesson for pair in diff.changed for lesson in pair),
+            *diff.added,
+            *diff.deleted,
+        )
+        for teacher_id in {lesson.teacher_id for lesson in changed_lessons}:
+            if teacher_id:
+                self._schedule_cache.invalidate_teacher(teacher_id)
+        for lesson in (*updated_lessons, *diff.added):
+            self._room_occupancy_cache.upsert_lesson(lesson)
+        for lesson in diff.deleted:
+            self._room_occupancy_cache.remove_lesson(lesson.id)
+
+        return ScheduleSyncResultDTO(
+            unchanged=len(diff.unchanged),
+            created=len(diff.added),
+            updated=len(updated_lessons),
+            deleted=len(diff.deleted),
+        )
+
+
+class SyncGroupExamsInteractor:
+    def __init__(
+        self,
+        group_gateway: GroupGatewayProtocol,
+        exam_gateway: ExamGatewayProtocol,
+        references_resolver: ScheduleReferencesResolver,
+        uow: UnitOfWork,
+        uuid_generator: UUIDGenerator,
+        datetime_manager: DateTimeManager,
+        schedule_cache: ScheduleCache,
+    ):
+        self._group_gateway = group_gateway
+        self._exam_gateway = exam_gateway
+        self._references_resolver = references_resolver
+
+        self._uow = uow
+        self._uuid_generator = uuid_generator
+        self._datetime_manager = datetime_manager
+        self._schedule_cache = schedule_cache
+
+    async def __call__(
+        self,
+        group_id: str,
+        exams: GroupExamsSyncDTO,
+    ) -> ScheduleSyncResultDTO:
+        """
+        Приводит экзамены группы за семестр к распарсенным в одной транзакции.
+        Пока на сайте висят экзамены прошлого семестра, ничего не меняется
+        """
+        group = await self._group_gateway.get_by_id(id=group_id)
+        if group is None:
+            raise GroupNotFoundError
+
+        previous_academic_year, previous_academic_year_half = get_previous_semester(
+            academic_year=exams.academic_year,
+            academic_year_half=exams.academic_year_half,
+        )
+        previous_exams = await self._exam_gateway.get_by_group_id_extended(
+            group.id,
+            academic_year=previous_academic_year,
+            academic_year_half=previous_academic_year_half,
+        )
+        parsed_exams_keys = {_parsed_exam_key(exam) for exam in exams.exams}
+        if previous_exams and all(
+            _saved_exam_key(exam) in parsed_exams_keys for exam in previous_exams
+        ):
+            return ScheduleSyncResultDTO(
+                unchanged=0,
+                created=0,
+                updated=0,
+                deleted=0,
+                skipped=True,
+            )
+
+        teacher_ids = await self._references_resolver.get_teacher_ids(
+            {
+                exam.teacher_login: exam.teacher_name
+                for exam in exams.exams
+                if exam.teacher_login
+            },
+        )
+        discipline_ids = await self._references_resolver.get_discipline_ids(
+            {exam.discipline_number: exam.discipline_name for exam in exams.exams},
+        )
+
+        now = self._datetime_manager.now()
+        parsed_exams = [
+            ExamEntity(
+                id=self._uuid_generator(),
+                created_at=now,
+                original_date=exam.date,
+                time=exam.time,
+                audience_number=exam.audience_number,
+                building_number=exam.building_number,
+                parsed_date=exam.parsed_date,
+                academic_year=exams.academic_year,
+                academic_year_half=exams.academic_year_half,
+                semester=exams.semester,
+                discipline_id=discipline_ids[exam.discipline_number],
+                teacher_id=teacher_ids.get(exam.teacher_login),
+                group_id=group.id,
+            )
+            for exam in exams.exams
+        ]
+        saved_exams = await self._exam_gateway.get_by_group_id(
+            group.id,
+            academic_year=exams.academic_year,
+            academic_year_half=exams.academic_year_half,
+        )
+
+        # Экзамен считается изменённым, только если по дисциплине он один
+        diff = diff_schedule(
+            parsed_exams,
+            saved_exams,
+            key=exam_sync_key,
+            match_key=exam_match_key,
+            unique_match_only=True,
+        )
+        updated_exams = [
+            dataclasses.replace(
+                parsed_exam,
+                id=saved_exam.id,
+                created_at=saved_exam.created_at,
+            )
+            for saved_exam, parsed_exam in diff.changed
+        ]
+
+        await self._exam_gateway.delete_many([exam.id for exam in diff.deleted])
+        await self._exam_gateway.update_many(updated_exams)
+        await self._exam_gateway.save_many(diff.added)
+        await self._group_gateway.patch_by_id(
+            id=group.id,
+            group_patch=GroupPatchDTO(exams_parsed_at=exams.parsed_at),
+        )
+        await self._uow.commit()
+        self._schedule_cache.invalidate_group(group.id)
+
+        return ScheduleSyncResultDTO(
+            unchanged=len(diff.unchanged),
+            created=len(diff.added),
+            updated=len(updated_exams),
+            deleted=len(diff.deleted),
+        )
@@ -1,15 +1,41 @@
+from pocket_kai.application.interfaces.cache import ServiceTokenCache
 from pocket_kai.application.interfaces.entities.service_token import ServiceTokenReader
 from pocket_kai.domain.exceptions.service_token import ServiceTokenError
 
 
 class CheckServiceTokenInteractor:
-    def __init__(self, service_token_gateway: ServiceTokenReader):
+    def __init__(
+        self,
+        service_token_gateway: ServiceTokenReader,
+        service_token_cache: ServiceTokenCache,
+    ):
         self._service_token_gateway = service_token_gateway
+        self._service_token_cache = service_token_cache
 
     async def __call__(self, token: str) -> bool:
+        # Кэшируются только действительные токены, неверный токен
+        # каждый раз проверяется по БД
+        if self._service_token_cache.is_valid(token):
+            return True
+
         try:
             await self._service_token_gateway.get_by_token(token=token)
         except ServiceTokenError:
             return False
 
+        self._service_token_cache.add(token)
         return True
+
+
+class InvalidateServiceTokenCacheInteractor:
+    def __init__(self, service_token_cache: ServiceTokenCache):
+        self._service_token_cache = service_token_cache
+
+    async def __call__(self, token: str | None = None) -> None:
+        """
+        Убирает токен из кэша воркера, без токена кэш очищается полностью
+        """
+        if token is None:
+            self._service_token_cache.clear()
+        else:
+            self._service_token_cache.invalidate(token)
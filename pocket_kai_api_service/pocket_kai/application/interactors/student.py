@@ -1,3 +1,4 @@
+from pocket_kai.application.dto.group import GroupPatchDTO
 from pocket_kai.application.dto.student import NewStudentDTO
 from pocket_kai.application.interfaces.common import DateTimeManager, UUIDGenerator
 from pocket_kai.application.interfaces.entities.group import GroupGatewayProtocol
@@ -31,27 +32,17 @@ class AddGroupMembersInteractor:
         if group is None:
             raise GroupNotFoundError
 
-        existing_students = await self.student_gateway.get_by_group_id(
-            group_id=group.id,
-        )
-        for group_member in members:
-            for existing_student in existing_students:
-                # Если новый студент уже существует, то обновляем его
-                if existing_student.email == group_member.email:
-                    existing_student.full_name = group_member.full_name
-                    existing_student.position = group_member.number
-                    existing_student.is_leader = group_member.is_leader
-                    existing_student.phone = group_member.phone
-                    await self.student_gateway.update(existing_student)
-                    current_student = existing_student
+        # Повторяющиеся почты сводятся к одному студенту, иначе
+        # INSERT ... ON CONFLICT изменит одну строку дважды
+        members_by_email = {member.email: member for member in members}
+        now = self.datetime_manager.now()
 
-                    existing_students.remove(existing_student)
-                    break
-
-            else:  # Новый студент
-                new_student = StudentEntity(
+        # id и дата создания используются, только если студента ещё нет
+        students = await self.student_gateway.upsert_group_members(
+            [
+                StudentEntity(
                     id=self.uuid_generator(),
-                    created_at=self.datetime_manager.now(),
+                    created_at=now,
                     kai_id=None,
                     position=group_member.number,
                     login=None,
@@ -73,20 +64,29 @@ class AddGroupMembersInteractor:
                     group_id=group.id,
                     user_id=None,
                 )
-                await self.student_gateway.save(new_student)
-                current_student = new_student
+                for group_member in members_by_email.values()
+            ],
+        )
 
-            # Устанавливаем старосту для группы
-            if current_student.is_leader:
-                group.group_leader_id = current_student.id
-                await self.group_gateway.update(group)
+        # Студенты группы, которых нет в новом списке, открепляются от неё
+        await self.student_gateway.unlink_from_group(
+            group_id=group.id,
+            keep_emails=list(members_by_email),
+        )
 
-        # Оставшиеся в списке студенты лишние, открепляем их от группы
-        for student_to_unlink in existing_students:
-            student_to_unlink.group_id = None
-            student_to_unlink.position = None
-            student_to_unlink.is_leader = False
-            await self.student_gateway.update(student_to_unlink)
+        # Как и раньше, старостой становится последний отмеченный в списке
+        leader_email = next(
+            (member.email for member in reversed(members) if member.is_leader),
+            None,
+        )
+        if leader_email is not None:
+            leader = next(
+                student for student in students if student.email == leader_email
+            )
+            await self.group_gateway.patch_by_id(
+                id=group.id,
+                group_patch=GroupPatchDTO(group_leader_id=str(leader.id)),
+            )
 
         await self.uow.commit()
 
@@ -1,5 +1,5 @@
+from pocket_kai.application.dto.task import TaskPageDTO
 from pocket_kai.application.interfaces.entities.task import TaskReader
-from pocket_kai.domain.entitites.task import TaskEntity
 from pocket_kai.infrastructure.kai_parser_api.schemas import TaskStatus, TaskType
 
 
@@ -18,7 +18,8 @@ class GetTasksInteractor:
         group_name: str | None,
         task_type: TaskType | None,
         task_status: TaskStatus | None,
-    ) -> list[TaskEntity]:
+        after: str | None = None,
+    ) -> TaskPageDTO:
         return await self._task_gateway.get_tasks(
             limit=limit,
             offset=offset,
@@ -26,4 +27,5 @@ class GetTasksInteractor:
             task_type=task_type,
             task_status=task_status,
             group_name=group_name,
+            after=after,
         )
@@ -1,5 +1,9 @@
+from pocket_kai.application.interfaces.cache import AccessTokenCache
+from pocket_kai.application.interfaces.common import DateTimeManager
 from pocket_kai.application.interfaces.jwt import JWTManagerProtocol
-from pocket_kai.application.interfaces.entities.user import UserReader
+from pocket_kai.application.interfaces.entities.user import UserReader, UserUpdater
+from pocket_kai.application.interfaces.unit_of_work import UnitOfWork
+from pocket_kai.domain.entitites.user import UserEntity
 
 
 class GetUserByAccessTokenInteractor:
@@ -7,10 +11,54 @@ class GetUserByAccessTokenInteractor:
         self,
         user_gateway: UserReader,
         jwt_manager: JWTManagerProtocol,
+        access_token_cache: AccessTokenCache,
+        datetime_manager: DateTimeManager,
     ):
         self._user_gateway = user_gateway
         self._jwt_manager = jwt_manager
+        self._access_token_cache = access_token_cache
+        self._datetime_manager = datetime_manager
 
     async def __call__(self, access_token: str):
+        cached = self._access_token_cache.get(access_token)
+        if cached is not None:
+            _, user = cached
+            return user
+
         access_token_payload = self._jwt_manager.decode_access_token(access_token)
-        return await self._user_gateway.get_by_id(id=str(access_token_payload.sub))
+        user = await self._user_gateway.get_by_id(id=str(access_token_payload.sub))
+
+        if user is not None:
+            # Запись не должна пережить сам токен
+            expires_at = access_token_payload.exp.replace(tzinfo=None)
+            self._access_token_cache.set(
+                access_token,
+                access_token_payload,
+                user,
+                ttl=(expires_at - self._datetime_manager.now()).total_seconds(),
+            )
+
+        return user
+
+
+class SetUserBlockedInteractor:
+    def __init__(
+        self,
+        user_gateway: UserUpdater,
+        access_token_cache: AccessTokenCache,
+        uow: UnitOfWork,
+    ):
+        self._user_gateway = user_gateway
+        self._access_token_cache = access_token_cache
+        self._uow = uow
+
+    async def __call__(self, user_id: str, is_blocked: bool) -> UserEntity:
+        user = await self._user_gateway.set_is_blocked(
+            id=user_id,
+            is_blocked=is_blocked,
+        )
+        await self._uow.commit()
+
+        self._access_token_cache.invalidate_user(user_id)
+
+        return user
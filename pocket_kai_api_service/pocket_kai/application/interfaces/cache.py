@@ -0,0 +1,168 @@
+from abc import abstractmethod
+
+from typing import Iterable, Protocol, TypeVar, Union
+
+from pocket_kai.application.dto.cache import CacheStatsDTO
+from pocket_kai.application.dto.lesson import TeacherLessonExtendedDTO
+from pocket_kai.application.dto.schedule import WeekDaysDTO
+from pocket_kai.application.interfaces.jwt import AccessJWTPayload
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.department import DepartmentEntity
+from pocket_kai.domain.entitites.discipline import DisciplineEntity
+from pocket_kai.domain.entitites.institute import InstituteEntity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.entitites.profile import ProfileEntity
+from pocket_kai.domain.entitites.speciality import SpecialityEntity
+from pocket_kai.domain.entitites.teacher import TeacherEntity
+from pocket_kai.domain.entitites.user import UserEntity
+from pocket_kai.domain.room_occupancy import RoomOccupancyIndex
+
+
+# Небольшие и почти не меняющиеся справочники
+ReferenceEntity = Union[
+    DepartmentEntity,
+    DisciplineEntity,
+    InstituteEntity,
+    ProfileEntity,
+    SpecialityEntity,
+    TeacherEntity,
+]
+R = TypeVar('R', bound=ReferenceEntity)
+
+
+class CacheStatsProvider(Protocol):
+    @abstractmethod
+    def stats(self) -> list[CacheStatsDTO]:
+        raise NotImplementedError
+
+
+class ScheduleCache(CacheStatsProvider, Protocol):
+    @abstractmethod
+    def get_week_schedule(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+    ) -> WeekDaysDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_week_schedule(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+        schedule: WeekDaysDTO,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_group(self, group_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_teacher_schedule(
+        self,
+        teacher_id: str,
+        week_parity: WeekParity,
+    ) -> list[TeacherLessonExtendedDTO] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_teacher_schedule(
+        self,
+        teacher_id: str,
+        week_parity: WeekParity,
+        schedule: list[TeacherLessonExtendedDTO],
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_teacher(self, teacher_id: str) -> None:
+        raise NotImplementedError
+
+
+class ResponseCache(CacheStatsProvider, Protocol):
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, content: bytes) -> None:
+        raise NotImplementedError
+
+
+class RoomOccupancyCache(Protocol):
+    @abstractmethod
+    def get_index(self) -> RoomOccupancyIndex | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_index(self, index: RoomOccupancyIndex) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_lesson(self, lesson: LessonEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_lesson(self, lesson_id: str) -> None:
+        raise NotImplementedError
+
+
+class ServiceTokenCache(CacheStatsProvider, Protocol):
+    @abstractmethod
+    def is_valid(self, token: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, token: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, token: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class AccessTokenCache(CacheStatsProvider, Protocol):
+    @abstractmethod
+    def get(self, token: str) -> tuple[AccessJWTPayload, UserEntity] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self,
+        token: str,
+        payload: AccessJWTPayload,
+        user: UserEntity,
+        ttl: float,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_user(self, user_id: str) -> None:
+        raise NotImplementedError
+
+
+class ReferenceCatalog(CacheStatsProvider, Protocol):
+    @abstractmethod
+    def get(self, entity_type: type[R], id: str) -> R | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, entity: ReferenceEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, entity_type: type[ReferenceEntity], id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self) -> str | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, entities: Iterable[ReferenceEntity], version: str | None) -> None:
+        raise NotImplementedError
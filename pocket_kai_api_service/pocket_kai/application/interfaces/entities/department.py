@@ -20,5 +20,16 @@ class DepartmentSaver(Protocol):
     async def save(self, department: DepartmentEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_or_create_many(
+        self,
+        departments: list[DepartmentEntity],
+    ) -> list[DepartmentEntity]:
+        """
+        Сохраняет записи с новыми kai_id и возвращает все переданные,
+        уже существующие записи не изменяются
+        """
+        raise NotImplementedError
+
 
 class DepartmentGatewayProtocol(DepartmentReader, DepartmentSaver, Protocol): ...
@@ -28,5 +28,16 @@ class DisciplineSaver(Protocol):
     async def save(self, discipline: DisciplineEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_or_create_many(
+        self,
+        disciplines: list[DisciplineEntity],
+    ) -> list[DisciplineEntity]:
+        """
+        Сохраняет записи с новыми kai_id и возвращает все переданные,
+        уже существующие записи не изменяются
+        """
+        raise NotImplementedError
+
 
 class DisciplineGatewayProtocol(DisciplineReader, DisciplineSaver, Protocol): ...
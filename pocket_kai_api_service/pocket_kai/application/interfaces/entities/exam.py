@@ -39,18 +39,36 @@ class ExamSaver(Protocol):
     async def save(self, exam: ExamEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, exams: list[ExamEntity]) -> None:
+        """
+        :raise BadRelatedEntityError:
+        """
+        raise NotImplementedError
+
 
 class ExamUpdater(Protocol):
     @abstractmethod
     async def update(self, exam: ExamEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, exams: list[ExamEntity]) -> None:
+        """
+        :raise BadRelatedEntityError:
+        """
+        raise NotImplementedError
+
 
 class ExamDeleter(Protocol):
     @abstractmethod
     async def delete(self, exam_id: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def delete_many(self, exam_ids: list[str]) -> None:
+        raise NotImplementedError
+
 
 class ExamGatewayProtocol(
     ExamReader,
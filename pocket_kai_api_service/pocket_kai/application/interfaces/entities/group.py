@@ -2,8 +2,14 @@ from abc import abstractmethod
 
 from typing import Protocol
 
+from datetime import datetime
+
 from pocket_kai.application.dto.group import GroupExtendedDTO, GroupPatchDTO
+from pocket_kai.domain.entitites.department import DepartmentEntity
 from pocket_kai.domain.entitites.group import GroupEntity
+from pocket_kai.domain.entitites.institute import InstituteEntity
+from pocket_kai.domain.entitites.profile import ProfileEntity
+from pocket_kai.domain.entitites.speciality import SpecialityEntity
 
 
 class GroupReader(Protocol):
@@ -15,6 +21,14 @@ class GroupReader(Protocol):
     async def get_by_id(self, id: str) -> GroupEntity | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_ids_and_names(
+        self,
+        group_ids: list[str],
+        group_names: list[str],
+    ) -> list[GroupEntity]:
+        raise NotImplementedError
+
     @abstractmethod
     async def suggest_by_name(
         self,
@@ -25,11 +39,25 @@ class GroupReader(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all(self, limit: int, offset: int) -> list[GroupEntity]:
+    async def get_all(
+        self,
+        limit: int,
+        offset: int,
+        after: tuple[str, str] | None = None,
+    ) -> list[GroupEntity]:
+        """
+        Группы в порядке (group_name, id). `after` - ключ последней группы
+        предыдущей страницы
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all_extended(self, limit: int, offset: int) -> list[GroupExtendedDTO]:
+    async def get_all_extended(
+        self,
+        limit: int,
+        offset: int,
+        after: tuple[str, str] | None = None,
+    ) -> list[GroupExtendedDTO]:
         raise NotImplementedError
 
 
@@ -52,5 +80,35 @@ class GroupUpdater(Protocol):
     async def patch_by_id(self, id: str, group_patch: GroupPatchDTO) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def touch_schedule(
+        self,
+        group_ids: list[str],
+        schedule_parsed_at: datetime,
+    ) -> None:
+        """
+        Обновляет версию расписания групп после ручного изменения пар,
+        чтобы сменились ETag и ключи кэша ответов
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify_with_references(
+        self,
+        group_name: str,
+        speciality: SpecialityEntity,
+        institute: InstituteEntity,
+        profile: ProfileEntity,
+        department: DepartmentEntity,
+        verified_at: datetime,
+    ) -> GroupEntity:
+        """
+        Создаёт или обновляет по kai_id специальность, институт, профиль
+        и кафедру, привязывает их к группе и отмечает группу верифицированной
+
+        :raise GroupNotFoundError:
+        """
+        raise NotImplementedError
+
 
 class GroupGatewayProtocol(GroupReader, GroupSaver, GroupUpdater, Protocol): ...
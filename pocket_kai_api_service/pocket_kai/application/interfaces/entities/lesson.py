@@ -1,13 +1,18 @@
+import datetime as dt
+
 from abc import abstractmethod
 
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 from pocket_kai.application.dto.lesson import (
+    GroupWithLessonsDTO,
     LessonExtendedDTO,
     LessonPatchDTO,
+    RoomLessonExtendedDTO,
     TeacherLessonExtendedDTO,
 )
 from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.group import GroupEntity
 from pocket_kai.domain.entitites.lesson import LessonEntity
 
 
@@ -20,6 +25,14 @@ class LessonReader(Protocol):
     ) -> list[LessonEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_all_with_room(self) -> list[LessonEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_ids(self, lesson_ids: list[str]) -> list[LessonEntity]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id_extended(self, lesson_id: str) -> LessonExtendedDTO:
         raise NotImplementedError
@@ -32,6 +45,29 @@ class LessonReader(Protocol):
     ) -> list[LessonExtendedDTO]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_group_ids_extended(
+        self,
+        group_ids: list[str],
+        week_parity: WeekParity,
+    ) -> dict[str, list[LessonExtendedDTO]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_group_schedule_by_group_id(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+    ) -> tuple[GroupEntity, list[LessonExtendedDTO]] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_schedule_parsed_at_by_teacher_id(
+        self,
+        teacher_id: str,
+    ) -> dt.datetime | None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_teacher_id_extended(
         self,
@@ -40,12 +76,35 @@ class LessonReader(Protocol):
     ) -> list[TeacherLessonExtendedDTO]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_room_extended(
+        self,
+        building_number: str,
+        audience_number: str,
+        week_parity: WeekParity,
+    ) -> list[RoomLessonExtendedDTO]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_groups_with_lessons(self) -> AsyncIterator[GroupWithLessonsDTO]:
+        """
+        Все группы с их парами, читаются из БД курсором по мере потребления
+        """
+        raise NotImplementedError
+
 
 class LessonSaver(Protocol):
     @abstractmethod
     async def save(self, lesson: LessonEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, lessons: list[LessonEntity]) -> None:
+        """
+        :raise BadRelatedEntityError:
+        """
+        raise NotImplementedError
+
 
 class LessonUpdater(Protocol):
     @abstractmethod
@@ -56,10 +115,21 @@ class LessonUpdater(Protocol):
     async def patch(self, lesson_id: str, lesson_patch: LessonPatchDTO) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_many(self, lessons: list[LessonEntity]) -> None:
+        """
+        :raise BadRelatedEntityError:
+        """
+        raise NotImplementedError
+
 
 class LessonDeleter(Protocol):
     @abstractmethod
-    async def delete(self, lesson_id: str) -> None:
+    async def delete(self, lesson_id: str) -> LessonEntity | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, lesson_ids: list[str]) -> list[LessonEntity]:
         raise NotImplementedError
 
 
@@ -0,0 +1,66 @@
+import datetime as dt
+
+from abc import abstractmethod
+
+from typing import Protocol
+
+from pocket_kai.application.dto.lesson import (
+    LessonOccurrenceDTO,
+    TeacherLessonOccurrenceDTO,
+)
+
+
+class LessonOccurrenceReader(Protocol):
+    @abstractmethod
+    async def get_by_group_id_extended(
+        self,
+        group_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> list[LessonOccurrenceDTO]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_teacher_id_extended(
+        self,
+        teacher_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> list[TeacherLessonOccurrenceDTO]:
+        raise NotImplementedError
+
+
+class LessonOccurrenceUpdater(Protocol):
+    @abstractmethod
+    async def regenerate_for_group(
+        self,
+        group_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def regenerate_for_lesson(
+        self,
+        lesson_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def regenerate_for_lessons(
+        self,
+        lesson_ids: list[str],
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        raise NotImplementedError
+
+
+class LessonOccurrenceGatewayProtocol(
+    LessonOccurrenceReader,
+    LessonOccurrenceUpdater,
+    Protocol,
+): ...
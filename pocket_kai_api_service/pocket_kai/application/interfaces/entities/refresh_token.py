@@ -2,6 +2,7 @@ from abc import abstractmethod
 
 from typing import Protocol
 
+from pocket_kai.application.dto.refresh_token import RefreshTokenUsageDTO
 from pocket_kai.domain.entitites.refresh_token import RefreshTokenEntity
 
 
@@ -26,6 +27,10 @@ class RefreshTokenUpdater(Protocol):
     async def update(self, refresh_token: RefreshTokenEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_usages(self, usages: list[RefreshTokenUsageDTO]) -> None:
+        raise NotImplementedError
+
 
 class RefreshTokenGatewayProtocol(
     RefreshTokenReader,
@@ -33,3 +38,13 @@ class RefreshTokenGatewayProtocol(
     RefreshTokenUpdater,
     Protocol,
 ): ...
+
+
+class RefreshTokenUsageWriter(Protocol):
+    @abstractmethod
+    def add_usage(self, usage: RefreshTokenUsageDTO) -> None:
+        """
+        Откладывает запись использования токена, она попадёт в БД
+        при следующем сбросе буфера
+        """
+        raise NotImplementedError
@@ -24,11 +24,37 @@ class StudentSaver(Protocol):
     async def save(self, student: StudentEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_by_email(self, student: StudentEntity) -> StudentEntity:
+        """
+        Создаёт студента или обновляет данные из личного кабинета у студента
+        с той же почтой. Позиция, староста и пользователь не перезаписываются
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_group_members(
+        self,
+        students: list[StudentEntity],
+    ) -> list[StudentEntity]:
+        """
+        Создаёт студентов или обновляет ФИО, телефон, группу и позицию
+        у студентов с той же почтой. Почты в списке не должны повторяться
+        """
+        raise NotImplementedError
+
 
 class StudentUpdater(Protocol):
     @abstractmethod
     async def update(self, student: StudentEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def unlink_from_group(self, group_id: str, keep_emails: list[str]) -> None:
+        """
+        Открепляет от группы всех студентов, чьих почт нет в `keep_emails`
+        """
+        raise NotImplementedError
+
 
 class StudentGatewayProtocol(StudentReader, StudentSaver, StudentUpdater, Protocol): ...
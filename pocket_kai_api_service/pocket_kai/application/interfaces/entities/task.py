@@ -2,6 +2,7 @@ from abc import abstractmethod
 
 from typing import Protocol
 
+from pocket_kai.application.dto.task import TaskPageDTO
 from pocket_kai.infrastructure.kai_parser_api.schemas import TaskStatus, TaskType
 
 
@@ -15,5 +16,6 @@ class TaskReader(Protocol):
         group_name: str | None,
         task_type: TaskType | None,
         task_status: TaskStatus | None,
-    ):
+        after: str | None,
+    ) -> TaskPageDTO:
         raise NotImplementedError
@@ -15,6 +15,17 @@ class TeacherSaver(Protocol):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_or_create_many(
+        self,
+        teachers: list[TeacherEntity],
+    ) -> list[TeacherEntity]:
+        """
+        Сохраняет преподавателей с новыми логинами и возвращает всех переданных,
+        уже существующие преподаватели не изменяются
+        """
+        raise NotImplementedError
+
 
 class TeacherReader(Protocol):
     @abstractmethod
@@ -15,3 +15,12 @@ class UserSaver(Protocol):
     @abstractmethod
     async def save(self, user: UserEntity) -> None:
         raise NotImplementedError
+
+
+class UserUpdater(Protocol):
+    @abstractmethod
+    async def set_is_blocked(self, id: str, is_blocked: bool) -> UserEntity:
+        """
+        :raise UserNotFoundError:
+        """
+        raise NotImplementedError
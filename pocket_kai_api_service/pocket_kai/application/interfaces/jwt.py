@@ -52,3 +52,16 @@ class JWTManagerProtocol(Protocol):
         expires_at: datetime | None = None,
     ) -> str:
         raise NotImplementedError
+
+    @abstractmethod
+    def issue_refresh_token(
+        self,
+        jti: str,
+        user_id: str,
+        expires_at: datetime | None = None,
+    ) -> tuple[str, RefreshJWTPayload]:
+        """
+        То же, что `create_refresh_token`, но вместе с токеном возвращает
+        его payload, чтобы не декодировать только что подписанный токен
+        """
+        raise NotImplementedError
@@ -30,5 +30,6 @@ class KaiParserApiProtocol(Protocol):
         login: str | None,
         type: TaskType | None = None,
         status: TaskStatus | None = None,
-    ) -> list[TaskSchema]:
+        after: str | None = None,
+    ) -> tuple[list[TaskSchema], str | None]:
         raise NotImplementedError
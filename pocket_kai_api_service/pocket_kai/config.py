@@ -25,6 +25,11 @@ class PostgresSettings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_HOST: str = 'postgres'
     POSTGRES_PORT: int = 5432
+    # Реплика для чтения, без неё все запросы идут в основную БД
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int = 5432
+    # Сколько секунд после записи воркер читает из основной БД, а не из реплики
+    POSTGRES_REPLICA_MAX_LAG_SECONDS: float = 5
 
     @computed_field  # type: ignore[misc]
     @property
@@ -34,6 +39,18 @@ class PostgresSettings(BaseSettings):
             f'@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}'
         )
 
+    @computed_field  # type: ignore[misc]
+    @property
+    def replica_database_uri(self) -> str | None:
+        if self.POSTGRES_REPLICA_HOST is None:
+            return None
+
+        return (
+            f'postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}'
+            f'@{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT}'
+            f'/{self.POSTGRES_DB}'
+        )
+
 
 class JWTSettings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -80,6 +97,40 @@ class CommonSettings(BaseSettings):
     )
 
     TEACHER_SEARCH_SIMILARITY: float = 0.15
+    # Как часто воркер записывает в БД использование Refresh-токенов
+    REFRESH_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS: float = 5
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        env_file_encoding='utf-8',
+        frozen=True,
+        extra='allow',
+    )
+
+    # Кэши живут в памяти каждого воркера, поэтому TTL ограничивает
+    # время, в течение которого воркер может отдавать устаревшие данные
+    SCHEDULE_CACHE_MAX_SIZE: int = 4096
+    SCHEDULE_CACHE_TTL_SECONDS: int = 600
+    RESPONSE_CACHE_MAX_SIZE: int = 2048
+    RESPONSE_CACHE_TTL_SECONDS: int = 600
+    SERVICE_TOKEN_CACHE_MAX_SIZE: int = 64
+    SERVICE_TOKEN_CACHE_TTL_SECONDS: int = 60
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int = 16384
+    ACCESS_TOKEN_CACHE_TTL_SECONDS: int = 60
+    # Как часто воркер сверяет версию справочников с БД
+    REFERENCE_CATALOG_CHECK_INTERVAL_SECONDS: int = 10
+    # Как часто воркер перестраивает индекс занятости аудиторий
+    ROOM_OCCUPANCY_REFRESH_INTERVAL_SECONDS: int = 600
+
+    # Расписание обновления данных в database_updater_service,
+    # по нему считается время жизни HTTP кэша у клиентов
+    UPDATER_TIMEZONE: str = 'Europe/Moscow'
+    SCHEDULE_UPDATE_HOUR: int = 3
+    EXAMS_UPDATE_ISO_WEEKDAY: int = 7
+    EXAMS_UPDATE_HOUR: int = 4
+    HTTP_CACHE_UPDATE_MARGIN_MINUTES: int = 30
 
 
 class Settings(BaseModel):
@@ -87,6 +138,7 @@ class Settings(BaseModel):
     jwt: JWTSettings = JWTSettings()
     kai_parser: KaiParserSettings = KaiParserSettings()
     common: CommonSettings = CommonSettings()
+    cache: CacheSettings = CacheSettings()
 
 
 @lru_cache
@@ -0,0 +1,103 @@
+import datetime as dt
+import hashlib
+
+from zoneinfo import ZoneInfo
+
+from fastapi import Request, Response, status
+
+from pocket_kai.config import CacheSettings
+
+
+def make_etag(*parts) -> str:
+    """
+    Строгий ETag из версии данных (например, `schedule_parsed_at` группы)
+    и параметров запроса, от которых зависит ответ
+    """
+    digest = hashlib.sha1('|'.join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _is_etag_matched(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == '*':
+        return True
+
+    # Для If-None-Match используется слабое сравнение, поэтому префикс W/ не учитываем
+    return any(
+        candidate.strip().removeprefix('W/') == etag
+        for candidate in if_none_match.split(',')
+    )
+
+
+def _seconds_until(
+    now: dt.datetime,
+    hour: int,
+    iso_weekday: int | None = None,
+) -> int:
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if iso_weekday is not None:
+        next_run += dt.timedelta(days=(iso_weekday - now.isoweekday()) % 7)
+    if next_run <= now:
+        next_run += dt.timedelta(days=1 if iso_weekday is None else 7)
+
+    return int((next_run - now).total_seconds())
+
+
+def schedule_max_age(
+    cache_settings: CacheSettings,
+    depends_on_today: bool = False,
+) -> int:
+    """
+    Количество секунд до момента сразу после ближайшего обновления расписания.
+    Если ответ зависит от текущей даты (например, `date_from` не передан),
+    то не дольше, чем до полуночи: вчерашний ответ не должен отдаваться утром
+    """
+    now = dt.datetime.now(ZoneInfo(cache_settings.UPDATER_TIMEZONE))
+    max_age = (
+        _seconds_until(now, hour=cache_settings.SCHEDULE_UPDATE_HOUR)
+        + cache_settings.HTTP_CACHE_UPDATE_MARGIN_MINUTES * 60
+    )
+    if depends_on_today:
+        # Текущая дата в эндпоинтах берётся из date.today(), то есть по времени сервера
+        max_age = min(max_age, _seconds_until(dt.datetime.now(), hour=0))
+
+    return max_age
+
+
+def exams_max_age(cache_settings: CacheSettings) -> int:
+    """
+    Количество секунд до момента сразу после ближайшего обновления экзаменов
+    """
+    now = dt.datetime.now(ZoneInfo(cache_settings.UPDATER_TIMEZONE))
+    return (
+        _seconds_until(
+            now,
+            hour=cache_settings.EXAMS_UPDATE_HOUR,
+            iso_weekday=cache_settings.EXAMS_UPDATE_ISO_WEEKDAY,
+        )
+        + cache_settings.HTTP_CACHE_UPDATE_MARGIN_MINUTES * 60
+    )
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    max_age: int,
+) -> Response | None:
+    """
+    Возвращает ответ `304 Not Modified`, если клиент прислал актуальный ETag.
+    Иначе проставляет заголовки кэширования в ответ эндпоинта и возвращает None
+    """
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={max_age}',
+    }
+    if _is_etag_matched(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
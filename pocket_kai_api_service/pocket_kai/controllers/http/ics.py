@@ -0,0 +1,101 @@
+import datetime as dt
+
+from typing import Iterator
+
+from pocket_kai.application.dto.calendar import CalendarDTO, CalendarEventDTO
+
+
+ICS_MEDIA_TYPE = 'text/calendar'
+ICS_TIMEZONE = 'Europe/Moscow'
+
+# Московское время не переводится с 2014 года, поэтому достаточно одного периода
+_VTIMEZONE = (
+    'BEGIN:VTIMEZONE',
+    f'TZID:{ICS_TIMEZONE}',
+    'BEGIN:STANDARD',
+    'DTSTART:19700101T000000',
+    'TZOFFSETFROM:+0300',
+    'TZOFFSETTO:+0300',
+    'TZNAME:MSK',
+    'END:STANDARD',
+    'END:VTIMEZONE',
+)
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line: str) -> str:
+    """
+    Переносит строку длиннее 75 октетов, как требует RFC 5545
+    """
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+
+    parts = []
+    start = 0
+    limit = 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Не разрываем многобайтовый символ UTF-8
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start = end
+        limit = 74
+
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _event_lines(event: CalendarEventDTO, dtstamp: str) -> Iterator[str]:
+    yield 'BEGIN:VEVENT'
+    yield f'UID:{event.uid}'
+    yield f'DTSTAMP:{dtstamp}'
+    yield (
+        f'DTSTART;TZID={ICS_TIMEZONE}:'
+        f'{dt.datetime.combine(event.date, event.start_time):%Y%m%dT%H%M%S}'
+    )
+    yield (
+        f'DTEND;TZID={ICS_TIMEZONE}:'
+        f'{dt.datetime.combine(event.date, event.end_time):%Y%m%dT%H%M%S}'
+    )
+    yield f'SUMMARY:{_escape(event.summary)}'
+    if event.location:
+        yield f'LOCATION:{_escape(event.location)}'
+    if event.description:
+        yield f'DESCRIPTION:{_escape(event.description)}'
+    yield 'END:VEVENT'
+
+
+def iter_ics(calendar: CalendarDTO) -> Iterator[str]:
+    """
+    Генерирует календарь по частям: заголовок и далее по одному событию
+    """
+    stamp = calendar.parsed_at or dt.datetime.now(dt.timezone.utc)
+    if stamp.tzinfo is not None:
+        stamp = stamp.astimezone(dt.timezone.utc)
+    dtstamp = f'{stamp:%Y%m%dT%H%M%S}Z'
+
+    yield ''.join(
+        _fold(line)
+        for line in (
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//Pocket KAI//Schedule//RU',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
+            f'X-WR-CALNAME:{_escape(calendar.name)}',
+            f'X-WR-TIMEZONE:{ICS_TIMEZONE}',
+            *_VTIMEZONE,
+        )
+    )
+    for event in calendar.events:
+        yield ''.join(_fold(line) for line in _event_lines(event, dtstamp))
+    yield _fold('END:VCALENDAR')
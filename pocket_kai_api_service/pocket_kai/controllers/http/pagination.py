@@ -0,0 +1,47 @@
+import base64
+import binascii
+
+from typing import Any, Callable
+
+import orjson
+
+from fastapi import HTTPException, Response, status
+
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def encode_cursor(*values) -> str:
+    """
+    Непрозрачный курсор из значений ключа сортировки последней записи страницы
+    """
+    return base64.urlsafe_b64encode(
+        orjson.dumps([str(value) for value in values]),
+    ).decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> tuple:
+    """
+    Разбирает курсор, каждое значение ключа проверяется своим парсером
+    (например, `UUID`). Подделанный или устаревший курсор - ошибка 400
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError
+
+        return tuple(parser(value) for parser, value in zip(parsers, values))
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid cursor',
+        )
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """
+    Курсор следующей страницы передаётся в заголовке, чтобы не менять
+    формат ответа. Если заголовка нет, страница последняя
+    """
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,76 @@
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable
+
+import orjson
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from pocket_kai.application.interfaces.cache import ResponseCache
+
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+
+@lru_cache
+def _get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def render_json(response_model: Any, content: Any) -> bytes:
+    """
+    Сериализует ответ так же, как это делает FastAPI с `response_model`
+    и `ORJSONResponse`, чтобы закэшированные байты не отличались от обычного ответа
+    """
+    adapter = _get_type_adapter(response_model)
+    value = adapter.validate_python(content, from_attributes=True)
+    return orjson.dumps(
+        adapter.dump_python(value, mode='json', by_alias=True),
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def cache_json(
+    response_cache: ResponseCache,
+    key: str,
+    response_model: Any,
+    content: Any,
+) -> bytes:
+    rendered = render_json(response_model, content)
+    response_cache.set(key, rendered)
+    return rendered
+
+
+async def stream_and_cache(
+    response_cache: ResponseCache,
+    key: str,
+    chunks: Iterable[str],
+) -> AsyncIterator[bytes]:
+    """
+    Отдаёт части ответа по мере генерации и кэширует ответ целиком,
+    когда генерация завершилась
+    """
+    parts = []
+    for chunk in chunks:
+        encoded = chunk.encode()
+        parts.append(encoded)
+        yield encoded
+
+    response_cache.set(key, b''.join(parts))
+
+
+def bytes_response(content: bytes, response: Response, media_type: str) -> Response:
+    """
+    Готовый ответ из байтов. Заголовки, проставленные в ответ эндпоинта
+    (ETag, Cache-Control), переносятся, так как FastAPI не объединяет их
+    с возвращаемым `Response`
+    """
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers=dict(response.headers),
+    )
+
+
+def json_response(content: bytes, response: Response) -> Response:
+    return bytes_response(content, response, media_type='application/json')
@@ -0,0 +1,49 @@
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Depends, Header, status
+from typing import Annotated
+
+from pocket_kai.application.interactors.cache import GetCacheStatsInteractor
+from pocket_kai.application.interactors.service_token import (
+    InvalidateServiceTokenCacheInteractor,
+)
+from pocket_kai.controllers.http.dependencies import check_service_token
+from pocket_kai.controllers.schemas.cache import CacheStatsRead
+
+
+router = APIRouter(route_class=DishkaRoute)
+
+
+@router.get(
+    '/stats',
+    dependencies=[Depends(check_service_token)],
+    response_model=list[CacheStatsRead],
+    include_in_schema=False,
+)
+async def get_cache_stats(
+    *,
+    interactor: FromDishka[GetCacheStatsInteractor],
+):
+    """
+    Возвращает статистику попаданий и промахов in-memory кэшей текущего воркера.
+    """
+    return await interactor()
+
+
+@router.delete(
+    '/service_tokens',
+    dependencies=[Depends(check_service_token)],
+    status_code=status.HTTP_204_NO_CONTENT,
+    include_in_schema=False,
+)
+async def invalidate_service_token_cache(
+    x_revoked_token: Annotated[str | None, Header()] = None,
+    *,
+    interactor: FromDishka[InvalidateServiceTokenCacheInteractor],
+):
+    """
+    Убирает сервисный токен из заголовка `X-Revoked-Token` из кэша текущего
+    воркера, без заголовка кэш очищается полностью. Остальные воркеры перестают принимать удалённый
+    из БД токен по истечении SERVICE_TOKEN_CACHE_TTL_SECONDS.
+    """
+    await interactor(token=x_revoked_token)
@@ -0,0 +1,43 @@
+from typing import AsyncIterator
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from pocket_kai.application.dto.lesson import GroupWithLessonsDTO
+from pocket_kai.application.interactors.lesson import ExportGroupsWithLessonsInteractor
+from pocket_kai.controllers.http.dependencies import check_service_token
+from pocket_kai.controllers.http.response_cache import NDJSON_MEDIA_TYPE, render_json
+from pocket_kai.controllers.schemas.export import GroupWithLessonsRead
+
+
+router = APIRouter(route_class=DishkaRoute)
+
+
+async def _iter_ndjson(
+    groups_with_lessons: AsyncIterator[GroupWithLessonsDTO],
+) -> AsyncIterator[bytes]:
+    async for group_with_lessons in groups_with_lessons:
+        yield render_json(GroupWithLessonsRead, group_with_lessons) + b'\n'
+
+
+@router.get(
+    '/lessons.ndjson',
+    response_class=StreamingResponse,
+    dependencies=[Depends(check_service_token)],
+    include_in_schema=False,
+)
+async def export_groups_with_lessons(
+    *,
+    interactor: FromDishka[ExportGroupsWithLessonsInteractor],
+):
+    """
+    Выгрузка всех групп с парами для внутренних сервисов, по строке на группу.
+    Данные читаются из БД курсором по мере отправки, поэтому память
+    не зависит от объёма выгрузки
+    """
+    return StreamingResponse(
+        _iter_ndjson(interactor()),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -4,9 +4,15 @@ from dishka import FromDishka
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from pocket_kai.application.dto.group import NewGroupDTO
+from pocket_kai.application.dto.schedule_sync import (
+    GroupExamsSyncDTO,
+    GroupScheduleSyncDTO,
+    ParsedExamDTO,
+    ParsedLessonDTO,
+)
 from pocket_kai.application.interactors.discipline import (
     GetGroupDisciplinesWithTeachersInteractor,
 )
@@ -16,12 +22,31 @@ from pocket_kai.application.interactors.group import (
     GetAllGroupsInteractor,
     GetGroupByIdInteractor,
     GetGroupByNameInteractor,
+    GetShortGroupByIdInteractor,
     PatchGroupByIdInteractor,
     PatchGroupByNameInteractor,
     SuggestGroupsByNameInteractor,
 )
 from pocket_kai.application.interactors.lesson import GetLessonsByGroupIdInteractor
+from pocket_kai.application.interactors.schedule_sync import (
+    SyncGroupExamsInteractor,
+    SyncGroupScheduleInteractor,
+)
+from pocket_kai.application.interfaces.cache import ResponseCache
+from pocket_kai.config import Settings
+from pocket_kai.controllers.http.caching import (
+    check_not_modified,
+    exams_max_age,
+    make_etag,
+    schedule_max_age,
+)
 from pocket_kai.controllers.http.dependencies import check_service_token
+from pocket_kai.controllers.http.pagination import (
+    decode_cursor,
+    encode_cursor,
+    set_next_cursor,
+)
+from pocket_kai.controllers.http.response_cache import cache_json, json_response
 from pocket_kai.controllers.schemas.common import ErrorMessage
 from pocket_kai.controllers.schemas.discipline import DisciplineWithTypesResponse
 from pocket_kai.controllers.schemas.exam import ExamRead
@@ -32,6 +57,11 @@ from pocket_kai.controllers.schemas.group import (
     ShortGroupRead,
 )
 from pocket_kai.controllers.schemas.lesson import LessonRead
+from pocket_kai.controllers.schemas.schedule_sync import (
+    GroupExamsSync,
+    GroupScheduleSync,
+    ScheduleSyncResult,
+)
 from pocket_kai.domain.exceptions.group import (
     GroupAlreadyExistsError,
     GroupNotFoundError,
@@ -79,15 +109,40 @@ async def get_group_lessons_by_group_id(
     },
 )
 async def get_group_disciplines_with_teachers_by_group_id(
+    request: Request,
+    response: Response,
     group_id: UUID,
     *,
     interactor: FromDishka[GetGroupDisciplinesWithTeachersInteractor],
+    group_interactor: FromDishka[GetShortGroupByIdInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает список всех дисциплин вместе с типами и преподавателями для группы по её `ID` (ID из PocketKAI).
     """
     try:
-        return await interactor(group_id=str(group_id))
+        group = await group_interactor(group_id=str(group_id))
+        etag = make_etag('disciplines', group.id, group.schedule_parsed_at)
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(settings.cache),
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is None:
+            content = cache_json(
+                response_cache,
+                etag,
+                list[DisciplineWithTypesResponse],
+                await interactor(group_id=str(group_id)),
+            )
+
+        return json_response(content, response)
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -106,21 +161,48 @@ async def get_group_disciplines_with_teachers_by_group_id(
     },
 )
 async def get_group_exams_by_group_id(
+    request: Request,
+    response: Response,
     group_id: UUID,
     academic_year: str = None,
     academic_year_half: int = None,
     *,
     interactor: FromDishka[GetExamsByGroupIdInteractor],
+    group_interactor: FromDishka[GetShortGroupByIdInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает список всех экзаменов для группы по её `ID` (ID из PocketKAI).
     """
     try:
-        return await interactor(
-            group_id=str(group_id),
-            academic_year=academic_year,
-            academic_year_half=academic_year_half,
+        group = await group_interactor(group_id=str(group_id))
+        etag = make_etag(
+            'exams',
+            group.id,
+            group.exams_parsed_at,
+            academic_year,
+            academic_year_half,
+        )
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=exams_max_age(settings.cache),
         )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is None:
+            exams = await interactor(
+                group_id=str(group_id),
+                academic_year=academic_year,
+                academic_year_half=academic_year_half,
+            )
+            content = cache_json(response_cache, etag, list[ExamRead], exams)
+
+        return json_response(content, response)
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,8 +215,13 @@ async def get_group_exams_by_group_id(
     response_model=Union[list[FullGroupRead], list[ShortGroupRead]],
 )
 async def get_all_groups(
+    response: Response,
     limit: Annotated[int, Query(ge=1, le=100)] = 30,
     offset: Annotated[int, Query(ge=0)] = 0,
+    after: Annotated[
+        str | None,
+        Query(description='Значение заголовка `X-Next-Cursor` из предыдущего ответа'),
+    ] = None,
     is_short: Annotated[
         bool,
         Query(description='Если `true`, то вернется сокращённая модель группы'),
@@ -143,9 +230,29 @@ async def get_all_groups(
     interactor: FromDishka[GetAllGroupsInteractor],
 ):
     """
-    Возвращает список всех групп с краткой либо полной (зависит от параметра `short`) информацией о них
+    Возвращает список всех групп с краткой либо полной (зависит от параметра `short`) информацией о них.
+    Группы отсортированы по имени.
+
+    Для постраничного обхода передавайте в `after` значение заголовка `X-Next-Cursor`
+    из предыдущего ответа, в отличие от `offset` это не требует пропуска уже
+    прочитанных групп. Если заголовка нет, страница последняя.
     """
-    return await interactor(limit=limit, offset=offset, is_short=is_short)
+    if after is not None:
+        group_name, group_id = decode_cursor(after, str, UUID)
+        after_key = (group_name, str(group_id))
+    else:
+        after_key = None
+
+    groups = await interactor(
+        limit=limit,
+        offset=offset,
+        after=after_key,
+        is_short=is_short,
+    )
+    if len(groups) == limit:
+        set_next_cursor(response, encode_cursor(groups[-1].group_name, groups[-1].id))
+
+    return groups
 
 
 @router.get(
@@ -287,3 +394,71 @@ async def patch_group_by_id(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='Group not found',
         )
+
+
+@router.put(
+    '/by_id/{group_id}/schedule/sync',
+    dependencies=[Depends(check_service_token)],
+    response_model=ScheduleSyncResult,
+    include_in_schema=False,
+)
+async def sync_group_schedule_by_id(
+    group_id: UUID,
+    schedule: GroupScheduleSync,
+    *,
+    interactor: FromDishka[SyncGroupScheduleInteractor],
+):
+    """
+    Принимает полное распарсенное расписание группы, сравнивает его с сохранённым
+    и применяет изменения в одной транзакции. Возвращает количество изменений
+    """
+    try:
+        return await interactor(
+            group_id=str(group_id),
+            schedule=GroupScheduleSyncDTO(
+                parsed_at=schedule.parsed_at,
+                lessons=[
+                    ParsedLessonDTO(**lesson.model_dump())
+                    for lesson in schedule.lessons
+                ],
+            ),
+        )
+    except GroupNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Group not found',
+        )
+
+
+@router.put(
+    '/by_id/{group_id}/exam/sync',
+    dependencies=[Depends(check_service_token)],
+    response_model=ScheduleSyncResult,
+    include_in_schema=False,
+)
+async def sync_group_exams_by_id(
+    group_id: UUID,
+    exams: GroupExamsSync,
+    *,
+    interactor: FromDishka[SyncGroupExamsInteractor],
+):
+    """
+    То же для экзаменов за семестр. Если на сайте ещё экзамены прошлого
+    семестра, ничего не меняется и возвращается `skipped`
+    """
+    try:
+        return await interactor(
+            group_id=str(group_id),
+            exams=GroupExamsSyncDTO(
+                parsed_at=exams.parsed_at,
+                academic_year=exams.academic_year,
+                academic_year_half=exams.academic_year_half,
+                semester=exams.semester,
+                exams=[ParsedExamDTO(**exam.model_dump()) for exam in exams.exams],
+            ),
+        )
+    except GroupNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Group not found',
+        )
@@ -4,14 +4,21 @@ from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from pocket_kai.application.dto.lesson import NewLessonDTO
+from pocket_kai.application.dto.lesson import LessonChangesDTO, NewLessonDTO
 from pocket_kai.application.interactors.lesson import (
+    ApplyLessonChangesInteractor,
     CreateLessonInteractor,
     DeleteLessonInteractor,
     UpdateLessonInteractor,
 )
 from pocket_kai.controllers.http.dependencies import check_service_token
-from pocket_kai.controllers.schemas.lesson import LessonCreate, LessonRead, LessonUpdate
+from pocket_kai.controllers.schemas.lesson import (
+    LessonBulkRequest,
+    LessonBulkResult,
+    LessonCreate,
+    LessonRead,
+    LessonUpdate,
+)
 from pocket_kai.domain.entitites.lesson import LessonEntity
 from pocket_kai.domain.exceptions.base import BadRelatedEntityError
 from pocket_kai.domain.exceptions.lesson import LessonNotFoundError
@@ -59,6 +66,81 @@ async def create_lesson(
         )
 
 
+@router.post(
+    '/bulk',
+    dependencies=[Depends(check_service_token)],
+    response_model=LessonBulkResult,
+    include_in_schema=False,
+)
+async def apply_lesson_changes(
+    changes: LessonBulkRequest,
+    *,
+    interactor: FromDishka[ApplyLessonChangesInteractor],
+):
+    """
+    Создаёт, изменяет и удаляет пары в одной транзакции. Возвращает только id,
+    id созданных пар идут в порядке `create`
+    """
+    try:
+        return await interactor(
+            LessonChangesDTO(
+                create=[
+                    NewLessonDTO(
+                        number_of_day=lesson.number_of_day,
+                        original_dates=lesson.original_dates,
+                        parsed_parity=lesson.parsed_parity,
+                        parsed_dates=lesson.parsed_dates,
+                        parsed_dates_status=lesson.parsed_dates_status,
+                        audience_number=lesson.audience_number,
+                        building_number=lesson.building_number,
+                        original_lesson_type=lesson.original_lesson_type,
+                        parsed_lesson_type=lesson.parsed_lesson_type,
+                        start_time=lesson.start_time,
+                        end_time=lesson.end_time,
+                        discipline_id=lesson.discipline_id,
+                        teacher_id=lesson.teacher_id,
+                        department_id=lesson.department_id,
+                        group_id=lesson.group_id,
+                    )
+                    for lesson in changes.create
+                ],
+                update=[
+                    LessonEntity(
+                        id=lesson.id,
+                        created_at=lesson.created_at,
+                        number_of_day=lesson.number_of_day,
+                        original_dates=lesson.original_dates,
+                        parsed_parity=lesson.parsed_parity,
+                        parsed_dates=lesson.parsed_dates,
+                        parsed_dates_status=lesson.parsed_dates_status,
+                        start_time=lesson.start_time,
+                        end_time=lesson.end_time,
+                        audience_number=lesson.audience_number,
+                        building_number=lesson.building_number,
+                        original_lesson_type=lesson.original_lesson_type,
+                        parsed_lesson_type=lesson.parsed_lesson_type,
+                        group_id=lesson.group_id,
+                        discipline_id=lesson.discipline_id,
+                        department_id=lesson.department_id,
+                        teacher_id=lesson.teacher_id,
+                    )
+                    for lesson in changes.update
+                ],
+                delete=[str(lesson_id) for lesson_id in changes.delete],
+            ),
+        )
+    except LessonNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Lesson not found',
+        )
+    except BadRelatedEntityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Discipline, teacher, group or department does not exist',
+        )
+
+
 @router.put(
     '/{lesson_id}',
     dependencies=[Depends(check_service_token)],
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 
 from pocket_kai.controllers.http.routers import (
     auth,
+    cache,
     student,
     teacher,
     user,
@@ -14,6 +15,8 @@ from pocket_kai.controllers.http.routers import (
     schedule,
     task,
     exam,
+    room,
+    export,
 )
 
 
@@ -31,3 +34,6 @@ router.include_router(group.router, prefix='/group', tags=['Groups'])
 router.include_router(schedule.router, prefix='/group', tags=['Groups schedule'])
 router.include_router(task.router, prefix='/task', tags=['Background tasks'])
 router.include_router(exam.router, prefix='/exam', tags=['Exams'])
+router.include_router(cache.router, prefix='/cache', tags=['Cache'])
+router.include_router(room.router, prefix='/room', tags=['Rooms'])
+router.include_router(export.router, prefix='/export', tags=['Export'])
@@ -0,0 +1,104 @@
+from datetime import date
+
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Query
+
+from pocket_kai.application.interactors.room import (
+    GetDatesScheduleByRoomInteractor,
+    GetFreeRoomsInteractor,
+    GetLessonsByRoomInteractor,
+)
+from pocket_kai.controllers.schemas.lesson import RoomLessonRead
+from pocket_kai.controllers.schemas.room import FreeRoomsResponse, RoomScheduleResponse
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.room_occupancy import SLOTS_COUNT
+
+
+router = APIRouter(route_class=DishkaRoute)
+
+
+@router.get(
+    '/free',
+    response_model=FreeRoomsResponse,
+)
+async def get_free_rooms(
+    building_number: str,
+    pair_number: Annotated[int, Query(ge=1, le=SLOTS_COUNT)],
+    date_: Annotated[
+        date,
+        Query(
+            alias='date',
+            default_factory=date.today,
+            description='By default is today',
+        ),
+    ],
+    *,
+    interactor: FromDishka[GetFreeRoomsInteractor],
+):
+    """
+    Возвращает аудитории корпуса, свободные на паре с номером `pair_number` в дату `date`.
+    Учитываются только аудитории, которые встречаются в расписании
+    """
+    return FreeRoomsResponse(
+        building_number=building_number,
+        date=date_,
+        pair_number=pair_number,
+        audience_numbers=await interactor(
+            building_number=building_number,
+            date=date_,
+            pair_number=pair_number,
+        ),
+    )
+
+
+@router.get(
+    '/{building_number}/{audience_number}/schedule',
+    response_model=list[RoomLessonRead],
+)
+async def get_room_schedule(
+    building_number: str,
+    audience_number: str,
+    week_parity: WeekParity = WeekParity.ANY,
+    *,
+    interactor: FromDishka[GetLessonsByRoomInteractor],
+):
+    """
+    Возвращает расписание аудитории `audience_number` в корпусе `building_number`.
+    Если занятие проходит у нескольких групп, то оно объединяется в одно занятие. Все группы доступны в поле `groups`
+    """
+    return await interactor(
+        building_number=building_number,
+        audience_number=audience_number,
+        week_parity=week_parity,
+    )
+
+
+@router.get(
+    '/{building_number}/{audience_number}/schedule/dates',
+    response_model=RoomScheduleResponse,
+)
+async def get_room_schedule_with_dates(
+    date_from: Annotated[
+        date,
+        Query(default_factory=date.today, description='By default is today'),
+    ],
+    building_number: str,
+    audience_number: str,
+    days_count: Annotated[int, Query(ge=1, le=186)] = 7,
+    *,
+    interactor: FromDishka[GetDatesScheduleByRoomInteractor],
+):
+    """
+    Возвращает список дней с занятиями в аудитории `audience_number` в корпусе `building_number`.
+    Дни начинаются с дня переданного в параметре `date_from` (по умолчанию это будет текущий день),
+    количество дней в списке зависит от параметра `days_count`.
+    """
+    return await interactor(
+        building_number=building_number,
+        audience_number=audience_number,
+        date_from=date_from,
+        days_count=days_count,
+    )
@@ -1,27 +1,60 @@
 from datetime import date
+from functools import partial
 from dishka import FromDishka
 
 from uuid import UUID
 
-from typing import Annotated
+from typing import Annotated, AsyncIterator, Awaitable, Callable
 
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from pocket_kai.application.interactors.calendar import GetGroupCalendarInteractor
+from pocket_kai.application.interactors.group import (
+    GetShortGroupByIdInteractor,
+    GetShortGroupByNameInteractor,
+)
 from pocket_kai.application.interactors.schedule import (
+    GetDatesScheduleBatchInteractor,
     GetDatesScheduleByGroupIdInteractor,
     GetDatesScheduleByGroupNameInteractor,
+    GetWeekScheduleBatchInteractor,
     GetWeekScheduleByGroupIdInteractor,
     GetWeekScheduleByGroupNameInteractor,
 )
+from pocket_kai.application.interfaces.cache import ResponseCache
+from pocket_kai.config import Settings
+from pocket_kai.controllers.http.caching import (
+    check_not_modified,
+    make_etag,
+    schedule_max_age,
+)
+from pocket_kai.controllers.http.ics import ICS_MEDIA_TYPE, iter_ics
+from pocket_kai.controllers.http.response_cache import (
+    NDJSON_MEDIA_TYPE,
+    bytes_response,
+    cache_json,
+    json_response,
+    render_json,
+    stream_and_cache,
+)
 from pocket_kai.controllers.schemas.common import ErrorMessage
-from pocket_kai.controllers.schemas.schedule import ScheduleResponse, WeekDaysResponse
-from pocket_kai.domain.common import WeekParity
+from pocket_kai.controllers.schemas.schedule import (
+    GroupScheduleBatchRequest,
+    GroupScheduleRead,
+    GroupWeekScheduleRead,
+    ScheduleResponse,
+    WeekDaysResponse,
+)
+from pocket_kai.domain.common import WeekParity, get_semester_bounds
 from pocket_kai.domain.exceptions.group import GroupNotFoundError
 
 
 router = APIRouter(route_class=DishkaRoute)
 
+NDJSON_CHUNK_SIZE = 50
+
 
 @router.get(
     '/by_name/{group_name}/schedule/week',
@@ -34,20 +67,42 @@ router = APIRouter(route_class=DishkaRoute)
     },
 )
 async def get_week_schedule_by_group_name(
+    request: Request,
+    response: Response,
     group_name: str,
     week_parity: Annotated[WeekParity, Query()] = WeekParity.ANY,
     *,
     interactor: FromDishka[GetWeekScheduleByGroupNameInteractor],
+    group_interactor: FromDishka[GetShortGroupByNameInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает расписание по дням недели без конкретных дат для группы по её имени (номеру).
     Можно передать чётность недели. Пары, у которых чётность определилась как чёт/неч, возвращаются *всегда*
     """
     try:
-        return await interactor(
-            group_name,
-            week_parity=week_parity,
+        group = await group_interactor(group_name)
+        etag = make_etag('week', group.id, group.schedule_parsed_at, week_parity)
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(settings.cache),
         )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        # ETag уже включает маршрут, параметры и версию данных, поэтому служит ключом
+        content = response_cache.get(etag)
+        if content is None:
+            schedule = await interactor(
+                group_name,
+                week_parity=week_parity,
+            )
+            content = cache_json(response_cache, etag, WeekDaysResponse, schedule)
+
+        return json_response(content, response)
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,20 +121,42 @@ async def get_week_schedule_by_group_name(
     },
 )
 async def get_week_schedule_by_group_id(
+    request: Request,
+    response: Response,
     group_id: UUID,
     week_parity: Annotated[WeekParity, Query()] = WeekParity.ANY,
     *,
     interactor: FromDishka[GetWeekScheduleByGroupIdInteractor],
+    group_interactor: FromDishka[GetShortGroupByIdInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает расписание по дням недели без конкретных дат для группы по её имени (номеру).
     Можно передать чётность недели. Пары, у которых чётность определилась как чёт/неч, возвращаются *всегда*
     """
     try:
-        return await interactor(
-            group_id,
-            week_parity=week_parity,
+        group = await group_interactor(group_id)
+        etag = make_etag('week', group.id, group.schedule_parsed_at, week_parity)
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(settings.cache),
         )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        # ETag уже включает маршрут, параметры и версию данных, поэтому служит ключом
+        content = response_cache.get(etag)
+        if content is None:
+            schedule = await interactor(
+                group_id,
+                week_parity=week_parity,
+            )
+            content = cache_json(response_cache, etag, WeekDaysResponse, schedule)
+
+        return json_response(content, response)
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,9 +180,14 @@ async def get_schedule_with_dates_by_group_id(
         Query(default_factory=date.today, description='By default is today'),
     ],
     group_id: UUID,
-    days_count: Annotated[int, Query(ge=1, le=31)] = 7,
+    request: Request,
+    response: Response,
+    days_count: Annotated[int, Query(ge=1, le=186)] = 7,
     *,
     interactor: FromDishka[GetDatesScheduleByGroupIdInteractor],
+    group_interactor: FromDishka[GetShortGroupByIdInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает список дней с парами для группы по её ID (ID из PocketKAI).
@@ -114,11 +196,36 @@ async def get_schedule_with_dates_by_group_id(
     Если у пары есть список `parsed_dates`, то пара вернётся только если день с парой попадает в этот список.
     """
     try:
-        return await interactor(
-            group_id=group_id,
-            date_from=date_from,
-            days_count=days_count,
+        group = await group_interactor(group_id)
+        etag = make_etag(
+            'dates',
+            group.id,
+            group.schedule_parsed_at,
+            date_from,
+            days_count,
         )
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(
+                settings.cache,
+                depends_on_today='date_from' not in request.query_params,
+            ),
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is None:
+            schedule = await interactor(
+                group_id=group_id,
+                date_from=date_from,
+                days_count=days_count,
+            )
+            content = cache_json(response_cache, etag, ScheduleResponse, schedule)
+
+        return json_response(content, response)
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -142,9 +249,14 @@ async def get_schedule_with_dates_by_group_name(
         Query(default_factory=date.today, description='By default is today'),
     ],
     group_name: str,
-    days_count: Annotated[int, Query(ge=1, le=31)] = 7,
+    request: Request,
+    response: Response,
+    days_count: Annotated[int, Query(ge=1, le=186)] = 7,
     *,
     interactor: FromDishka[GetDatesScheduleByGroupNameInteractor],
+    group_interactor: FromDishka[GetShortGroupByNameInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
 ):
     """
     Возвращает список дней с парами для группы по её имени (номеру).
@@ -153,13 +265,187 @@ async def get_schedule_with_dates_by_group_name(
     Если у пары есть список `parsed_dates`, то пара вернётся только если день с парой попадает в этот список.
     """
     try:
-        return await interactor(
-            group_name=group_name,
+        group = await group_interactor(group_name)
+        etag = make_etag(
+            'dates',
+            group.id,
+            group.schedule_parsed_at,
+            date_from,
+            days_count,
+        )
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(
+                settings.cache,
+                depends_on_today='date_from' not in request.query_params,
+            ),
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is None:
+            schedule = await interactor(
+                group_name=group_name,
+                date_from=date_from,
+                days_count=days_count,
+            )
+            content = cache_json(response_cache, etag, ScheduleResponse, schedule)
+
+        return json_response(content, response)
+    except GroupNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Group not found',
+        )
+
+
+async def _stream_schedules_ndjson(
+    get_schedules: Callable[..., Awaitable[list]],
+    response_model: type,
+    group_ids: list[UUID],
+    group_names: list[str],
+) -> AsyncIterator[bytes]:
+    """
+    Группы читаются частями, чтобы клиент начал обрабатывать первые группы,
+    пока следующие ещё читаются из базы
+    """
+    chunks = [
+        *(
+            (group_ids[i : i + NDJSON_CHUNK_SIZE], [])
+            for i in range(0, len(group_ids), NDJSON_CHUNK_SIZE)
+        ),
+        *(
+            ([], group_names[i : i + NDJSON_CHUNK_SIZE])
+            for i in range(0, len(group_names), NDJSON_CHUNK_SIZE)
+        ),
+    ]
+
+    # Группа может быть запрошена и по ID, и по имени, отдаём её один раз
+    sent_group_ids = set()
+    for chunk_group_ids, chunk_group_names in chunks:
+        schedules = await get_schedules(
+            group_ids=chunk_group_ids,
+            group_names=chunk_group_names,
+        )
+        for schedule in schedules:
+            if schedule.group_id in sent_group_ids:
+                continue
+
+            sent_group_ids.add(schedule.group_id)
+            yield render_json(response_model, schedule) + b'\n'
+
+
+@router.post(
+    '/schedule/batch',
+    response_model=list[GroupWeekScheduleRead] | list[GroupScheduleRead],
+)
+async def get_schedule_batch(
+    request: Request,
+    schedule_batch: GroupScheduleBatchRequest,
+    *,
+    week_interactor: FromDishka[GetWeekScheduleBatchInteractor],
+    dates_interactor: FromDishka[GetDatesScheduleBatchInteractor],
+):
+    """
+    Возвращает расписание сразу для нескольких групп по их ID и/или именам (номерам).
+    Если передан `date_from`, то возвращается расписание по датам, иначе - по дням недели
+    с учётом `week_parity`. Ненайденные группы в ответ не попадают.
+    С заголовком `Accept: application/x-ndjson` ответ отдаётся потоком, по строке на группу
+    """
+    if schedule_batch.date_from is None:
+        response_model = GroupWeekScheduleRead
+        get_schedules = partial(
+            week_interactor,
+            week_parity=schedule_batch.week_parity,
+        )
+    else:
+        response_model = GroupScheduleRead
+        get_schedules = partial(
+            dates_interactor,
+            date_from=schedule_batch.date_from,
+            days_count=schedule_batch.days_count,
+        )
+
+    if NDJSON_MEDIA_TYPE in request.headers.get('accept', ''):
+        return StreamingResponse(
+            _stream_schedules_ndjson(
+                get_schedules,
+                response_model=response_model,
+                group_ids=schedule_batch.group_ids,
+                group_names=schedule_batch.group_names,
+            ),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
+    schedules = await get_schedules(
+        group_ids=schedule_batch.group_ids,
+        group_names=schedule_batch.group_names,
+    )
+    # Модель ответа известна заранее, поэтому не валидируем по объединению моделей
+    return Response(
+        content=render_json(list[response_model], schedules),
+        media_type='application/json',
+    )
+
+
+@router.get(
+    '/by_id/{group_id}/schedule.ics',
+    response_class=Response,
+    responses={
+        200: {'content': {ICS_MEDIA_TYPE: {}}},
+        404: {
+            'description': 'Группа не найдена',
+            'model': ErrorMessage,
+        },
+    },
+)
+async def get_group_schedule_ics(
+    request: Request,
+    response: Response,
+    group_id: UUID,
+    *,
+    interactor: FromDishka[GetGroupCalendarInteractor],
+    group_interactor: FromDishka[GetShortGroupByIdInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
+):
+    """
+    Возвращает расписание группы на текущий семестр в формате iCalendar
+    для подписки в приложениях календаря.
+    """
+    date_from, date_to = get_semester_bounds(date.today())
+    try:
+        group = await group_interactor(group_id)
+        etag = make_etag('ics', group.id, group.schedule_parsed_at, date_from)
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(settings.cache, depends_on_today=True),
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is not None:
+            return bytes_response(content, response, media_type=ICS_MEDIA_TYPE)
+
+        calendar = await interactor(
+            group_id=group.id,
             date_from=date_from,
-            days_count=days_count,
+            date_to=date_to,
         )
     except GroupNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='Group not found',
         )
+
+    return StreamingResponse(
+        stream_and_cache(response_cache, etag, iter_ics(calendar)),
+        media_type=ICS_MEDIA_TYPE,
+        headers=dict(response.headers),
+    )
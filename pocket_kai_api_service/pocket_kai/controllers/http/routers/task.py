@@ -2,9 +2,10 @@ from dishka import FromDishka
 from typing import Annotated
 
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
 
 from pocket_kai.application.interactors.task import GetTasksInteractor
+from pocket_kai.controllers.http.pagination import set_next_cursor
 from pocket_kai.controllers.schemas.common import ErrorMessage
 from pocket_kai.controllers.schemas.task import TaskRead
 from pocket_kai.domain.exceptions.kai_parser import KaiParserApiError
@@ -25,8 +26,16 @@ router = APIRouter(route_class=DishkaRoute)
     },
 )
 async def get_tasks(
+    response: Response,
     limit: int = 10,
     offset: int = 0,
+    after: Annotated[
+        str | None,
+        Query(
+            title='Курсор',
+            description='Значение заголовка `X-Next-Cursor` из предыдущего ответа',
+        ),
+    ] = None,
     group_name: Annotated[
         str | None,
         Query(title='Номер группы', description='Номер группы для поиска задач'),
@@ -49,18 +58,25 @@ async def get_tasks(
     """
     Возвращает список фоновых задач с заданными параметрами.
     Сортируются по времени создания - от самой последней до самой первой.
+
+    Для постраничного обхода передавайте в `after` значение заголовка
+    `X-Next-Cursor` из предыдущего ответа. Если заголовка нет, страница последняя.
     """
     try:
-        return await interactor(
+        task_page = await interactor(
             limit=limit,
             offset=offset,
             group_name=group_name,
             login=login,
             task_type=task_type,
             task_status=task_status,
+            after=after,
         )
     except KaiParserApiError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail='KAI parser service unavailable',
         )
+
+    set_next_cursor(response, task_page.next_cursor)
+    return task_page.tasks
@@ -1,23 +1,42 @@
+from datetime import date
 from uuid import UUID
 
 from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from pocket_kai.application.dto.teacher import NewTeacherDTO
+from pocket_kai.application.interactors.calendar import (
+    GetTeacherCalendarInteractor,
+    GetTeacherCalendarVersionInteractor,
+)
 from pocket_kai.application.interactors.lesson import GetLessonsByTeacherIdInteractor
+from pocket_kai.application.interactors.schedule import (
+    GetDatesScheduleByTeacherIdInteractor,
+)
 from pocket_kai.application.interactors.teacher import (
     CreateTeacherInteractor,
     GetTeacherByLoginInteractor,
     SuggestTeachersByNameInteractor,
 )
+from pocket_kai.application.interfaces.cache import ResponseCache
+from pocket_kai.config import Settings
+from pocket_kai.controllers.http.caching import (
+    check_not_modified,
+    make_etag,
+    schedule_max_age,
+)
 from pocket_kai.controllers.http.dependencies import check_service_token
+from pocket_kai.controllers.http.ics import ICS_MEDIA_TYPE, iter_ics
+from pocket_kai.controllers.http.response_cache import bytes_response, stream_and_cache
 from pocket_kai.controllers.schemas.common import ErrorMessage
 from pocket_kai.controllers.schemas.lesson import TeacherLessonRead
+from pocket_kai.controllers.schemas.schedule import TeacherScheduleResponse
 from pocket_kai.controllers.schemas.teacher import TeacherCreate, TeacherRead
-from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.common import WeekParity, get_semester_bounds
 from pocket_kai.domain.exceptions.teacher import (
     TeacherAlreadyExistsError,
     TeacherNotFoundError,
@@ -84,6 +103,106 @@ async def get_teacher_schedule(
         )
 
 
+@router.get(
+    '/by_id/{teacher_id}/schedule/dates',
+    response_model=TeacherScheduleResponse,
+    responses={
+        404: {
+            'description': 'Преподаватель не найден',
+            'model': ErrorMessage,
+        },
+    },
+)
+async def get_teacher_schedule_with_dates(
+    date_from: Annotated[
+        date,
+        Query(default_factory=date.today, description='By default is today'),
+    ],
+    teacher_id: UUID,
+    days_count: Annotated[int, Query(ge=1, le=186)] = 7,
+    *,
+    interactor: FromDishka[GetDatesScheduleByTeacherIdInteractor],
+):
+    """
+    Возвращает список дней с занятиями преподавателя по его ID.
+    Дни начинаются с дня переданного в параметре `date_from` (по умолчанию это будет текущий день),
+    количество дней в списке зависит от параметра `days_count`.
+    Если занятия дублируются для нескольких групп, то они объединяются в одно занятие. Все группы доступны в поле `groups`
+    """
+    try:
+        return await interactor(
+            teacher_id=str(teacher_id),
+            date_from=date_from,
+            days_count=days_count,
+        )
+    except TeacherNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Teacher with id "{teacher_id}" not found',
+        )
+
+
+@router.get(
+    '/by_id/{teacher_id}/schedule.ics',
+    response_class=Response,
+    responses={
+        200: {'content': {ICS_MEDIA_TYPE: {}}},
+        404: {
+            'description': 'Преподаватель не найден',
+            'model': ErrorMessage,
+        },
+    },
+)
+async def get_teacher_schedule_ics(
+    request: Request,
+    response: Response,
+    teacher_id: UUID,
+    *,
+    interactor: FromDishka[GetTeacherCalendarInteractor],
+    version_interactor: FromDishka[GetTeacherCalendarVersionInteractor],
+    settings: FromDishka[Settings],
+    response_cache: FromDishka[ResponseCache],
+):
+    """
+    Возвращает расписание преподавателя на текущий семестр в формате iCalendar
+    для подписки в приложениях календаря.
+    Если занятие проходит у нескольких групп, то оно будет одним событием
+    """
+    date_from, date_to = get_semester_bounds(date.today())
+    try:
+        schedule_parsed_at = await version_interactor(teacher_id=str(teacher_id))
+        etag = make_etag('ics_teacher', teacher_id, schedule_parsed_at, date_from)
+        not_modified_response = check_not_modified(
+            request,
+            response,
+            etag=etag,
+            max_age=schedule_max_age(settings.cache, depends_on_today=True),
+        )
+        if not_modified_response is not None:
+            return not_modified_response
+
+        content = response_cache.get(etag)
+        if content is not None:
+            return bytes_response(content, response, media_type=ICS_MEDIA_TYPE)
+
+        calendar = await interactor(
+            teacher_id=str(teacher_id),
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except TeacherNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'Teacher with id "{teacher_id}" not found',
+        )
+
+    return StreamingResponse(
+        stream_and_cache(response_cache, etag, iter_ics(calendar)),
+        media_type=ICS_MEDIA_TYPE,
+        headers=dict(response.headers),
+    )
+
+
 @router.get(
     '/suggest_by_name',
     response_model=list[TeacherRead],
@@ -3,17 +3,23 @@ from typing import Annotated
 
 from dishka import FromDishka
 from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
 
 from pocket_kai.application.interactors.student import (
     GetGroupMembersByUserIdInteractor,
     GetStudentByUserIdInteractor,
 )
-from pocket_kai.controllers.http.dependencies import get_current_active_user
+from pocket_kai.application.interactors.user import SetUserBlockedInteractor
+from pocket_kai.controllers.http.dependencies import (
+    check_service_token,
+    get_current_active_user,
+)
 from pocket_kai.controllers.schemas.common import ErrorMessage
 from pocket_kai.controllers.schemas.student import GroupMemberRead, StudentRead
 from pocket_kai.controllers.schemas.user import UserRead
 from pocket_kai.domain.entitites.user import UserEntity
 from pocket_kai.domain.exceptions.student import StudentNotFoundError
+from pocket_kai.domain.exceptions.user import UserNotFoundError
 
 
 router = APIRouter(route_class=DishkaRoute)
@@ -78,3 +84,29 @@ async def get_group_members_for_current_student(
             status_code=status.HTTP_404_NOT_FOUND,
             detail='No linked KAI user found',
         )
+
+
+@router.put(
+    '/by_id/{user_id}/blocked',
+    response_model=UserRead,
+    dependencies=[Depends(check_service_token)],
+    include_in_schema=False,
+)
+async def set_user_blocked(
+    user_id: UUID,
+    is_blocked: bool,
+    *,
+    interactor: FromDishka[SetUserBlockedInteractor],
+):
+    """
+    Блокирует или разблокирует пользователя. Закэшированные Access-токены
+    пользователя сбрасываются сразу только в текущем воркере, остальные воркеры
+    перестают их принимать по истечении ACCESS_TOKEN_CACHE_TTL_SECONDS.
+    """
+    try:
+        return await interactor(user_id=str(user_id), is_blocked=is_blocked)
+    except UserNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='User not found',
+        )
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class CacheStatsRead(BaseModel):
+    name: str
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
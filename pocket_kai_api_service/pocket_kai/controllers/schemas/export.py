@@ -0,0 +1,38 @@
+from uuid import UUID
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from pocket_kai.controllers.schemas.lesson import LessonRead
+
+
+class ExportGroupRead(BaseModel):
+    id: UUID
+    kai_id: int
+
+    group_leader_id: UUID | None
+    pinned_text: str | None
+    group_name: str
+
+    is_verified: bool
+    verified_at: datetime | None
+    created_at: datetime
+    parsed_at: datetime | None
+
+    schedule_parsed_at: datetime | None
+    exams_parsed_at: datetime | None
+
+    syllabus_url: str | None
+    educational_program_url: str | None
+    study_schedule_url: str | None
+
+    speciality_id: UUID | None
+    profile_id: UUID | None
+    department_id: UUID | None
+    institute_id: UUID | None
+
+
+class GroupWithLessonsRead(BaseModel):
+    group: ExportGroupRead
+    lessons: list[LessonRead]
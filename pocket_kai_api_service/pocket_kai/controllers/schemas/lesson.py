@@ -48,6 +48,17 @@ class TeacherLessonRead(LessonBase):
     discipline: DisciplineRead
 
 
+class RoomLessonRead(LessonBase):
+    id: UUID
+    created_at: datetime
+    group_id: UUID
+
+    teacher: TeacherRead | None
+    groups: list[ShortGroupRead]
+    department: DepartmentRead | None
+    discipline: DisciplineRead
+
+
 class LessonCreate(LessonBase):
     discipline_id: UUID
     teacher_id: str | None
@@ -61,3 +72,19 @@ class LessonUpdate(LessonBase):
     teacher_id: UUID | None
     department_id: UUID | None
     group_id: UUID
+
+
+class LessonBulkUpdate(LessonUpdate):
+    id: UUID
+
+
+class LessonBulkRequest(BaseModel):
+    create: list[LessonCreate] = []
+    update: list[LessonBulkUpdate] = []
+    delete: list[UUID] = []
+
+
+class LessonBulkResult(BaseModel):
+    created: list[UUID]
+    updated: list[UUID]
+    deleted: list[UUID]
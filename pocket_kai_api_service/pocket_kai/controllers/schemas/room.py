@@ -0,0 +1,23 @@
+import datetime as dt
+
+from pydantic import BaseModel
+
+from pocket_kai.controllers.schemas.lesson import RoomLessonRead
+from pocket_kai.domain.common import WeekParity
+
+
+class FreeRoomsResponse(BaseModel):
+    building_number: str
+    date: dt.date
+    pair_number: int
+    audience_numbers: list[str]
+
+
+class RoomDayResponse(BaseModel):
+    date: dt.date
+    parity: WeekParity = WeekParity.ANY
+    lessons: list[RoomLessonRead]
+
+
+class RoomScheduleResponse(BaseModel):
+    days: list[RoomDayResponse]
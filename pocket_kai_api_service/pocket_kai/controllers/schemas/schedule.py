@@ -1,7 +1,9 @@
 import datetime as dt
-from pydantic import BaseModel
+from uuid import UUID
 
-from pocket_kai.controllers.schemas.lesson import LessonRead
+from pydantic import BaseModel, Field, model_validator
+
+from pocket_kai.controllers.schemas.lesson import LessonRead, TeacherLessonRead
 from pocket_kai.domain.common import WeekParity
 
 
@@ -30,3 +32,61 @@ class WeekDaysResponse(BaseModel):
     parsed_at: dt.datetime | None
     week_parity: WeekParity
     week_days: Week
+
+
+# Сколько дней расписания можно запросить за раз для всех групп вместе
+MAX_BATCH_GROUP_DAYS = 500 * 31
+
+
+class GroupScheduleBatchRequest(BaseModel):
+    group_ids: list[UUID] = Field(default_factory=list, max_length=500)
+    group_names: list[str] = Field(default_factory=list, max_length=500)
+    week_parity: WeekParity = WeekParity.ANY
+    date_from: dt.date | None = Field(
+        default=None,
+        description='Если передана, то вернётся расписание по датам',
+    )
+    days_count: int = Field(
+        default=7,
+        ge=1,
+        le=186,
+        description=(
+            'Количество дней, как у расписания одной группы. Число групп, '
+            f'умноженное на `days_count`, не больше {MAX_BATCH_GROUP_DAYS}'
+        ),
+    )
+
+    @model_validator(mode='after')
+    def check_group_days(self) -> 'GroupScheduleBatchRequest':
+        if self.date_from is None:
+            return self
+
+        groups_count = len(self.group_ids) + len(self.group_names)
+        if groups_count * self.days_count > MAX_BATCH_GROUP_DAYS:
+            raise ValueError(
+                f'groups count * days_count must not exceed {MAX_BATCH_GROUP_DAYS}',
+            )
+
+        return self
+
+
+class GroupWeekScheduleRead(BaseModel):
+    group_id: UUID
+    group_name: str
+    schedule: WeekDaysResponse
+
+
+class GroupScheduleRead(BaseModel):
+    group_id: UUID
+    group_name: str
+    schedule: ScheduleResponse
+
+
+class TeacherDayResponse(BaseModel):
+    date: dt.date
+    parity: WeekParity = WeekParity.ANY
+    lessons: list[TeacherLessonRead]
+
+
+class TeacherScheduleResponse(BaseModel):
+    days: list[TeacherDayResponse]
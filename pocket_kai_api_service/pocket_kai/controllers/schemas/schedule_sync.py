@@ -0,0 +1,62 @@
+import datetime as dt
+
+from pydantic import BaseModel
+
+from pocket_kai.domain.common import LessonType, ParsedDatesStatus, WeekParity
+
+
+class ParsedLesson(BaseModel):
+    day_number: int
+    start_time: dt.time | None
+    end_time: dt.time | None
+    dates: str | None
+    parsed_dates: list[dt.date] | None
+    parsed_dates_status: ParsedDatesStatus
+    parsed_parity: WeekParity
+    parsed_lesson_type: LessonType
+
+    discipline_name: str
+    discipline_type: str
+    discipline_number: int
+
+    audience_number: str | None
+    building_number: str | None
+
+    department_id: int | None
+    department_name: str | None
+
+    teacher_name: str
+    teacher_login: str | None
+
+
+class ParsedExam(BaseModel):
+    date: str
+    parsed_date: dt.date | None
+    time: dt.time
+    discipline_name: str
+    discipline_number: int
+    audience_number: str | None
+    building_number: str | None
+    teacher_name: str
+    teacher_login: str | None
+
+
+class GroupScheduleSync(BaseModel):
+    parsed_at: dt.datetime
+    lessons: list[ParsedLesson]
+
+
+class GroupExamsSync(BaseModel):
+    parsed_at: dt.datetime
+    academic_year: str
+    academic_year_half: int
+    semester: int | None
+    exams: list[ParsedExam]
+
+
+class ScheduleSyncResult(BaseModel):
+    unchanged: int
+    created: int
+    updated: int
+    deleted: int
+    skipped: bool
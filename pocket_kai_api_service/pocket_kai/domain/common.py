@@ -46,3 +46,28 @@ class WeekParity(str, Enum):
 class ParsedDatesStatus(str, Enum):
     GOOD = 'good'
     NEED_CHECK = 'need_check'
+
+
+def get_semester_bounds(date: dt.date) -> tuple[dt.date, dt.date]:
+    """
+    Возвращает первый и последний день семестра, в который попадает дата.
+    Осенний семестр - с 1 сентября по 31 января, весенний - с 1 февраля по 31 августа
+    """
+    if date.month >= 9:
+        return dt.date(date.year, 9, 1), dt.date(date.year + 1, 1, 31)
+    if date.month == 1:
+        return dt.date(date.year - 1, 9, 1), dt.date(date.year, 1, 31)
+
+    return dt.date(date.year, 2, 1), dt.date(date.year, 8, 31)
+
+
+def get_lesson_occurrences_window(date: dt.date) -> tuple[dt.date, dt.date]:
+    """
+    Возвращает период, на который материализуются даты проведения пар:
+    текущий и следующий семестры. Следующий семестр нужен, чтобы даты
+    не пропали при смене семестра до очередного обновления расписания
+    """
+    semester_start, semester_end = get_semester_bounds(date)
+    _, next_semester_end = get_semester_bounds(semester_end + dt.timedelta(days=1))
+
+    return semester_start, next_semester_end
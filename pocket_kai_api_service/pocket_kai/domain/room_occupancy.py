@@ -0,0 +1,181 @@
+import datetime as dt
+
+import dataclasses
+
+from collections import defaultdict
+from typing import Iterable
+
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.schedule import get_week_parity
+
+
+# Расписание звонков КАИ: начало и конец каждой пары
+PAIR_TIMES: tuple[tuple[dt.time, dt.time], ...] = (
+    (dt.time(8, 0), dt.time(9, 30)),
+    (dt.time(9, 40), dt.time(11, 10)),
+    (dt.time(11, 20), dt.time(12, 50)),
+    (dt.time(13, 30), dt.time(15, 0)),
+    (dt.time(15, 10), dt.time(16, 40)),
+    (dt.time(16, 50), dt.time(18, 20)),
+    (dt.time(18, 25), dt.time(19, 55)),
+    (dt.time(20, 0), dt.time(21, 30)),
+)
+SLOTS_COUNT = len(PAIR_TIMES)
+
+_PARITY_OFFSETS = {WeekParity.ODD: 0, WeekParity.EVEN: 1}
+
+RoomKey = tuple[str, str]
+
+
+def get_slots_mask(start_time: dt.time | None, end_time: dt.time | None) -> int:
+    """
+    Битовая маска пар, которые пересекаются с занятием. Занятие может занимать
+    несколько пар подряд, например лабораторная работа на две пары
+    """
+    if start_time is None:
+        return 0
+
+    mask = 0
+    for slot, (pair_start, pair_end) in enumerate(PAIR_TIMES):
+        if end_time is None:
+            if pair_start <= start_time < pair_end:
+                mask |= 1 << slot
+        elif start_time < pair_end and end_time > pair_start:
+            mask |= 1 << slot
+
+    return mask
+
+
+def _weekly_shift(number_of_day: int, parity: WeekParity) -> int:
+    return ((number_of_day - 1) * 2 + _PARITY_OFFSETS[parity]) * SLOTS_COUNT
+
+
+@dataclasses.dataclass(slots=True)
+class RoomOccupancy:
+    """
+    Занятость аудитории. `weekly` - одно число, в котором на каждый день недели
+    и чётность отведено по биту на пару; `dates` - маски пар для занятий,
+    которые проходят только в конкретные даты
+    """
+
+    weekly: int = 0
+    dates: dict[dt.date, int] = dataclasses.field(default_factory=dict)
+
+    def add(self, other: 'RoomOccupancy') -> None:
+        self.weekly |= other.weekly
+        for date, mask in other.dates.items():
+            self.dates[date] = self.dates.get(date, 0) | mask
+
+    def is_occupied(self, date: dt.date, parity: WeekParity, slot_bit: int) -> bool:
+        weekly_bits = self.weekly >> _weekly_shift(date.isoweekday(), parity)
+        return bool((weekly_bits | self.dates.get(date, 0)) & slot_bit)
+
+
+def get_lesson_occupancy(lesson: LessonEntity) -> RoomOccupancy:
+    occupancy = RoomOccupancy()
+    slots_mask = get_slots_mask(lesson.start_time, lesson.end_time)
+    if not slots_mask:
+        return occupancy
+
+    if lesson.parsed_dates:
+        for date in lesson.parsed_dates:
+            occupancy.dates[date] = occupancy.dates.get(date, 0) | slots_mask
+        return occupancy
+
+    if lesson.parsed_parity == WeekParity.ANY:
+        parities = (WeekParity.ODD, WeekParity.EVEN)
+    else:
+        parities = (lesson.parsed_parity,)
+    for parity in parities:
+        occupancy.weekly |= slots_mask << _weekly_shift(lesson.number_of_day, parity)
+
+    return occupancy
+
+
+def normalize_room_number(number: str) -> str:
+    """
+    Номера корпусов и аудиторий в расписании КАИ бывают с пробелами по краям.
+    Пробелы убираются так же, как `trim()` в запросах к БД
+    """
+    return number.strip(' ')
+
+
+def get_room_key(lesson: LessonEntity) -> RoomKey | None:
+    building_number = normalize_room_number(lesson.building_number or '')
+    audience_number = normalize_room_number(lesson.audience_number or '')
+    if not building_number or not audience_number:
+        return None
+
+    return building_number, audience_number
+
+
+class RoomOccupancyIndex:
+    """
+    Индекс занятости аудиторий. Хранит вклад каждого занятия, поэтому
+    при изменении занятия пересчитывается только его аудитория
+    """
+
+    def __init__(self, lessons: Iterable[LessonEntity] = ()):
+        self._lessons: dict[str, tuple[RoomKey, RoomOccupancy]] = dict()
+        self._room_lessons: dict[RoomKey, set[str]] = defaultdict(set)
+        self._buildings: dict[str, dict[str, RoomOccupancy]] = defaultdict(dict)
+
+        for lesson in lessons:
+            self._add_lesson(lesson)
+
+    def __len__(self) -> int:
+        return len(self._lessons)
+
+    def _add_lesson(self, lesson: LessonEntity) -> None:
+        room_key = get_room_key(lesson)
+        if room_key is None:
+            return
+
+        lesson_id = str(lesson.id)
+        occupancy = get_lesson_occupancy(lesson)
+        self._lessons[lesson_id] = (room_key, occupancy)
+        self._room_lessons[room_key].add(lesson_id)
+
+        building_number, audience_number = room_key
+        rooms = self._buildings[building_number]
+        rooms.setdefault(audience_number, RoomOccupancy()).add(occupancy)
+
+    def remove_lesson(self, lesson_id: str) -> None:
+        item = self._lessons.pop(str(lesson_id), None)
+        if item is None:
+            return
+
+        room_key, _ = item
+        room_lessons = self._room_lessons[room_key]
+        room_lessons.discard(str(lesson_id))
+
+        building_number, audience_number = room_key
+        room_occupancy = RoomOccupancy()
+        for room_lesson_id in room_lessons:
+            room_occupancy.add(self._lessons[room_lesson_id][1])
+        self._buildings[building_number][audience_number] = room_occupancy
+
+    def upsert_lesson(self, lesson: LessonEntity) -> None:
+        self.remove_lesson(lesson.id)
+        self._add_lesson(lesson)
+
+    def get_free_rooms(
+        self,
+        building_number: str,
+        date: dt.date,
+        pair_number: int,
+    ) -> list[str]:
+        """
+        Аудитории корпуса, свободные на паре `pair_number` (с 1) в указанную дату.
+        Известны только аудитории, которые встречаются в расписании
+        """
+        slot_bit = 1 << (pair_number - 1)
+        parity = get_week_parity(date)
+        rooms = self._buildings.get(normalize_room_number(building_number), {})
+
+        return sorted(
+            audience_number
+            for audience_number, occupancy in rooms.items()
+            if not occupancy.is_occupied(date, parity, slot_bit)
+        )
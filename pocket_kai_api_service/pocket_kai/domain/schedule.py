@@ -0,0 +1,95 @@
+import datetime as dt
+
+from collections import defaultdict
+from functools import lru_cache
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+
+
+L = TypeVar('L', bound=LessonEntity)
+
+
+@lru_cache(maxsize=8)
+def _get_year_parities(year: int) -> tuple[int, tuple[WeekParity, ...]]:
+    """
+    Таблица чётности ISO-недели для каждого дня года и ординал 1 января
+    """
+    year_start = dt.date(year, 1, 1)
+    days_in_year = (dt.date(year + 1, 1, 1) - year_start).days
+    parities = tuple(
+        WeekParity.ODD
+        if (year_start + dt.timedelta(days=day)).isocalendar().week % 2 == 1
+        else WeekParity.EVEN
+        for day in range(days_in_year)
+    )
+
+    return year_start.toordinal(), parities
+
+
+def get_week_parity(date: dt.date) -> WeekParity:
+    """
+    То же, что `WeekParity.get_parity_for_date`, но по заранее посчитанной таблице
+    """
+    year_start_ordinal, parities = _get_year_parities(date.year)
+    return parities[date.toordinal() - year_start_ordinal]
+
+
+class ScheduleExpander(Generic[L]):
+    """
+    Раскладывает пары по датам. Индексы по дню недели с чётностью и по конкретным
+    датам строятся один раз для набора пар, после чего пары дня берутся из словарей
+    без перебора всех пар
+    """
+
+    def __init__(self, lessons: Iterable[L]):
+        self._positions: dict[int, int] = dict()
+        self._by_weekday: dict[tuple[int, WeekParity], list[L]] = defaultdict(list)
+        self._by_date: dict[dt.date, list[L]] = defaultdict(list)
+
+        for position, lesson in enumerate(lessons):
+            self._positions[id(lesson)] = position
+
+            # Пары с распознанными датами проходят только в эти даты
+            if lesson.parsed_dates:
+                for date in set(lesson.parsed_dates):
+                    self._by_date[date].append(lesson)
+            elif lesson.parsed_parity == WeekParity.ANY:
+                for parity in (WeekParity.ODD, WeekParity.EVEN):
+                    self._by_weekday[(lesson.number_of_day, parity)].append(lesson)
+            else:
+                self._by_weekday[(lesson.number_of_day, lesson.parsed_parity)].append(
+                    lesson,
+                )
+
+    def get_lessons(
+        self,
+        date: dt.date,
+        parity: WeekParity | None = None,
+    ) -> list[L]:
+        if parity is None:
+            parity = get_week_parity(date)
+
+        dated_lessons = self._by_date.get(date)
+        weekly_lessons = self._by_weekday.get((date.isoweekday(), parity))
+        if not dated_lessons:
+            return list(weekly_lessons) if weekly_lessons else []
+        if not weekly_lessons:
+            return list(dated_lessons)
+
+        # Сохраняем исходный порядок пар (по времени начала)
+        return sorted(
+            [*dated_lessons, *weekly_lessons],
+            key=lambda lesson: self._positions[id(lesson)],
+        )
+
+    def expand(
+        self,
+        date_from: dt.date,
+        days_count: int,
+    ) -> Iterator[tuple[dt.date, WeekParity, list[L]]]:
+        for days in range(days_count):
+            date = date_from + dt.timedelta(days=days)
+            parity = get_week_parity(date)
+            yield date, parity, self.get_lessons(date, parity)
@@ -0,0 +1,139 @@
+import dataclasses
+
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+from pocket_kai.domain.entitites.exam import ExamEntity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+
+
+T = TypeVar('T')
+
+
+@dataclasses.dataclass(slots=True)
+class ScheduleDiff(Generic[T]):
+    unchanged: list[T]
+    # Пары (сохранённая запись, новая запись)
+    changed: list[tuple[T, T]]
+    added: list[T]
+    deleted: list[T]
+
+
+def _str_or_none(value) -> str | None:
+    return str(value) if value is not None else None
+
+
+def lesson_sync_key(lesson: LessonEntity) -> tuple:
+    """
+    Ключ пары для сравнения расписаний. Совпадает с ключом, по которому
+    сравнивал расписания database_updater_service, только вместо kai_id
+    и логинов используются id записей в БД
+    """
+    return (
+        lesson.number_of_day,
+        lesson.start_time,
+        lesson.end_time,
+        lesson.original_dates,
+        tuple(lesson.parsed_dates) if lesson.parsed_dates else None,
+        lesson.parsed_dates_status,
+        lesson.parsed_parity,
+        lesson.parsed_lesson_type,
+        lesson.original_lesson_type,
+        str(lesson.discipline_id),
+        lesson.audience_number,
+        lesson.building_number,
+        _str_or_none(lesson.department_id),
+        _str_or_none(lesson.teacher_id),
+    )
+
+
+def lesson_match_key(lesson: LessonEntity) -> tuple:
+    # Изменённой считается пара той же дисциплины и того же типа
+    return str(lesson.discipline_id), lesson.original_lesson_type
+
+
+def exam_sync_key(exam: ExamEntity) -> tuple:
+    return (
+        exam.original_date,
+        exam.parsed_date,
+        exam.time,
+        str(exam.discipline_id),
+        exam.audience_number,
+        exam.building_number,
+        _str_or_none(exam.teacher_id),
+    )
+
+
+def exam_match_key(exam: ExamEntity) -> str:
+    return str(exam.discipline_id)
+
+
+def get_previous_semester(
+    academic_year: str,
+    academic_year_half: int,
+) -> tuple[str, int]:
+    if academic_year_half == 2:
+        return academic_year, 1
+
+    first_year = int(academic_year.split('-')[0])
+    return f'{first_year - 1}-{first_year}', 2
+
+
+def diff_schedule(
+    new_items: Iterable[T],
+    saved_items: Iterable[T],
+    key: Callable[[T], tuple],
+    match_key: Callable[[T], Hashable],
+    unique_match_only: bool = False,
+) -> ScheduleDiff[T]:
+    """
+    Сопоставляет новое расписание с сохранённым.
+
+    Записи с одинаковым ключом остаются без изменений. Оставшейся новой записи
+    в пару подбирается сохранённая с тем же `match_key` и наименьшим числом
+    отличающихся полей ключа. Если `unique_match_only`, пара подбирается,
+    только когда подходящая сохранённая запись одна. Новые записи без пары
+    добавляются, сохранённые без пары (и дубликаты по ключу) удаляются
+    """
+    new_by_key = {key(item): item for item in new_items}
+
+    saved_by_key = dict()
+    deleted = list()
+    for item in saved_items:
+        item_key = key(item)
+        if item_key in saved_by_key:
+            deleted.append(item)
+        else:
+            saved_by_key[item_key] = item
+
+    unchanged = list()
+    for item_key in list(new_by_key):
+        if item_key in saved_by_key:
+            new_by_key.pop(item_key)
+            unchanged.append(saved_by_key.pop(item_key))
+
+    changed = list()
+    for item_key, item in list(new_by_key.items()):
+        item_match_key = match_key(item)
+        candidates = [
+            saved_key
+            for saved_key, saved_item in saved_by_key.items()
+            if match_key(saved_item) == item_match_key
+        ]
+        if not candidates or (unique_match_only and len(candidates) > 1):
+            continue
+
+        saved_key = min(
+            candidates,
+            key=lambda candidate: sum(
+                saved_value != new_value
+                for saved_value, new_value in zip(candidate, item_key)
+            ),
+        )
+        changed.append((saved_by_key.pop(saved_key), new_by_key.pop(item_key)))
+
+    return ScheduleDiff(
+        unchanged=unchanged,
+        changed=changed,
+        added=list(new_by_key.values()),
+        deleted=deleted + list(saved_by_key.values()),
+    )
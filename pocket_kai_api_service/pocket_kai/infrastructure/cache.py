@@ -0,0 +1,333 @@
+import hashlib
+import time
+
+from collections import OrderedDict, defaultdict
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+from pocket_kai.application.dto.cache import CacheStatsDTO
+from pocket_kai.application.dto.lesson import TeacherLessonExtendedDTO
+from pocket_kai.application.dto.schedule import WeekDaysDTO
+from pocket_kai.application.interfaces.jwt import AccessJWTPayload
+from pocket_kai.application.interfaces.cache import (
+    AccessTokenCache,
+    R,
+    ReferenceCatalog,
+    ReferenceEntity,
+    ResponseCache,
+    RoomOccupancyCache,
+    ScheduleCache,
+    ServiceTokenCache,
+)
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.entitites.user import UserEntity
+from pocket_kai.domain.room_occupancy import RoomOccupancyIndex
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Ограниченный по размеру LRU кэш с временем жизни записей.
+
+    Кэш живёт в памяти процесса, поэтому у каждого воркера он свой.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        if self._max_size <= 0:
+            return
+
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> None:
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def delete_values_where(self, predicate: Callable[[V], bool]) -> None:
+        for key in [key for key, (_, value) in self._data.items() if predicate(value)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> CacheStatsDTO:
+        return CacheStatsDTO(
+            name=self.name,
+            size=len(self._data),
+            max_size=self._max_size,
+            ttl=self._ttl,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+class InMemoryScheduleCache(ScheduleCache):
+    def __init__(self, max_size: int, ttl: float):
+        self._week_schedules: LRUCache[tuple[str, WeekParity], WeekDaysDTO] = (
+            LRUCache(name='week_schedule', max_size=max_size, ttl=ttl)
+        )
+        self._teacher_schedules: LRUCache[
+            tuple[str, WeekParity],
+            list[TeacherLessonExtendedDTO],
+        ] = LRUCache(name='teacher_schedule', max_size=max_size, ttl=ttl)
+
+    def get_week_schedule(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+    ) -> WeekDaysDTO | None:
+        return self._week_schedules.get((str(group_id), week_parity))
+
+    def set_week_schedule(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+        schedule: WeekDaysDTO,
+    ) -> None:
+        self._week_schedules.set((str(group_id), week_parity), schedule)
+
+    def invalidate_group(self, group_id: str) -> None:
+        for week_parity in WeekParity:
+            self._week_schedules.delete((str(group_id), week_parity))
+
+    def get_teacher_schedule(
+        self,
+        teacher_id: str,
+        week_parity: WeekParity,
+    ) -> list[TeacherLessonExtendedDTO] | None:
+        return self._teacher_schedules.get((str(teacher_id), week_parity))
+
+    def set_teacher_schedule(
+        self,
+        teacher_id: str,
+        week_parity: WeekParity,
+        schedule: list[TeacherLessonExtendedDTO],
+    ) -> None:
+        self._teacher_schedules.set((str(teacher_id), week_parity), schedule)
+
+    def invalidate_teacher(self, teacher_id: str) -> None:
+        for week_parity in WeekParity:
+            self._teacher_schedules.delete((str(teacher_id), week_parity))
+
+    def stats(self) -> list[CacheStatsDTO]:
+        return [self._week_schedules.stats(), self._teacher_schedules.stats()]
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Готовые байты JSON ответов. Версия данных входит в ключ,
+    поэтому после обновления устаревшие записи просто вытесняются
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._responses: LRUCache[str, bytes] = LRUCache(
+            name='response',
+            max_size=max_size,
+            ttl=ttl,
+        )
+
+    def get(self, key: str) -> bytes | None:
+        return self._responses.get(key)
+
+    def set(self, key: str, content: bytes) -> None:
+        self._responses.set(key, content)
+
+    def stats(self) -> list[CacheStatsDTO]:
+        return [self._responses.stats()]
+
+
+class InMemoryRoomOccupancyCache(RoomOccupancyCache):
+    """
+    Индекс занятости аудиторий текущего воркера. Изменения занятий через этот
+    воркер применяются к индексу сразу, а изменения через другие воркеры
+    подхватываются при перестройке в RoomOccupancyRefresher
+    """
+
+    def __init__(self):
+        self._index: RoomOccupancyIndex | None = None
+
+    def get_index(self) -> RoomOccupancyIndex | None:
+        return self._index
+
+    def set_index(self, index: RoomOccupancyIndex) -> None:
+        self._index = index
+
+    def upsert_lesson(self, lesson: LessonEntity) -> None:
+        if self._index is not None:
+            self._index.upsert_lesson(lesson)
+
+    def remove_lesson(self, lesson_id: str) -> None:
+        if self._index is not None:
+            self._index.remove_lesson(lesson_id)
+
+
+class InMemoryServiceTokenCache(ServiceTokenCache):
+    """
+    Проверенные сервисные токены. Хранятся только хэши токенов, а TTL
+    ограничивает время, в течение которого удалённый из БД токен ещё принимается
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._tokens: LRUCache[bytes, bool] = LRUCache(
+            name='service_token',
+            max_size=max_size,
+            ttl=ttl,
+        )
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def is_valid(self, token: str) -> bool:
+        return self._tokens.get(self._get_key(token)) is not None
+
+    def add(self, token: str) -> None:
+        self._tokens.set(self._get_key(token), True)
+
+    def invalidate(self, token: str) -> None:
+        self._tokens.delete(self._get_key(token))
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+    def stats(self) -> list[CacheStatsDTO]:
+        return [self._tokens.stats()]
+
+
+class InMemoryAccessTokenCache(AccessTokenCache):
+    """
+    Проверенные Access-токены вместе с пользователем. Ключ - хэш токена,
+    запись живёт не дольше самого токена
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._tokens: LRUCache[bytes, tuple[AccessJWTPayload, UserEntity]] = (
+            LRUCache(name='access_token', max_size=max_size, ttl=ttl)
+        )
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> tuple[AccessJWTPayload, UserEntity] | None:
+        return self._tokens.get(self._get_key(token))
+
+    def set(
+        self,
+        token: str,
+        payload: AccessJWTPayload,
+        user: UserEntity,
+        ttl: float,
+    ) -> None:
+        if ttl > 0:
+            self._tokens.set(self._get_key(token), (payload, user), ttl=ttl)
+
+    def invalidate_user(self, user_id: str) -> None:
+        # Блокировка пользователя - редкая операция, поэтому
+        # отдельный индекс по пользователям не ведётся
+        self._tokens.delete_values_where(lambda item: str(item[1].id) == str(user_id))
+
+    def stats(self) -> list[CacheStatsDTO]:
+        return [self._tokens.stats()]
+
+
+class InMemoryReferenceCatalog(ReferenceCatalog):
+    """
+    Справочники целиком в памяти воркера, записи хранятся по типу и id.
+
+    Версия - число строк и время последней вставки в таблицах справочников,
+    при её изменении каталог загружается заново. Новые записи попадают
+    в каталог при перезагрузке или при первом чтении через `get_reference`
+    """
+
+    name = 'reference_catalog'
+
+    def __init__(self):
+        self._entities: dict[type, dict[str, ReferenceEntity]] = defaultdict(dict)
+        self._version: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, entity_type: type[R], id: str) -> R | None:
+        entity = self._entities[entity_type].get(str(id))
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return entity
+
+    def add(self, entity: ReferenceEntity) -> None:
+        self._entities[type(entity)][str(entity.id)] = entity
+
+    def remove(self, entity_type: type[ReferenceEntity], id: str) -> None:
+        self._entities[entity_type].pop(str(id), None)
+
+    def get_version(self) -> str | None:
+        return self._version
+
+    def load(self, entities: Iterable[ReferenceEntity], version: str | None) -> None:
+        loaded_entities = defaultdict(dict)
+        for entity in entities:
+            loaded_entities[type(entity)][str(entity.id)] = entity
+
+        self._entities = loaded_entities
+        self._version = version
+
+    def stats(self) -> list[CacheStatsDTO]:
+        # Каталог не ограничен по размеру и не устаревает по времени
+        return [
+            CacheStatsDTO(
+                name=self.name,
+                size=sum(len(entities) for entities in self._entities.values()),
+                max_size=0,
+                ttl=0,
+                hits=self.hits,
+                misses=self.misses,
+            ),
+        ]
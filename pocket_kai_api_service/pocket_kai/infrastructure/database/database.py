@@ -1,14 +1,106 @@
+import time
+
+from typing import Callable, NewType
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from pocket_kai.config import PostgresSettings
 
 
+# Сессия для чтения: в запросах без записи - к реплике, если она настроена,
+# иначе та же сессия, что и для записи
+ReplicaSession = NewType('ReplicaSession', AsyncSession)
+
+# Ключ в `Session.info`: в текущей транзакции сессии были изменения
+_HAS_WRITES_KEY = 'has_writes'
+
+
+class ReplicaSessionMaker:
+    """
+    Открывает сессии для чтения: к реплике, если она настроена и с последней
+    записи в этом воркере прошло не меньше `max_lag` секунд, иначе - к основной БД.
+
+    Запись сбрасывает кэши воркера, и чтения сразу после неё заново их
+    заполняют. Пока реплика может отставать, эти чтения идут в основную БД,
+    чтобы в кэши не попали данные до записи
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None,
+        max_lag: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._primary = primary
+        self._replica = replica
+        self._max_lag = max_lag
+        self._clock = clock
+
+        self._last_write_at: float | None = None
+
+    def mark_write(self) -> None:
+        self._last_write_at = self._clock()
+
+    def track_writes(self, session: Session) -> None:
+        """
+        Отмечает запись после коммита транзакции сессии, в которой были
+        изменения. Транзакции только с чтением и откаченные транзакции
+        реплику не отключают
+        """
+        event.listen(session, 'do_orm_execute', self._on_execute)
+        event.listen(session, 'after_flush', self._on_flush)
+        event.listen(session, 'after_commit', self._on_commit)
+        event.listen(session, 'after_rollback', self._on_rollback)
+
+    @staticmethod
+    def _on_execute(orm_execute_state: ORMExecuteState) -> None:
+        if (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            orm_execute_state.session.info[_HAS_WRITES_KEY] = True
+
+    @staticmethod
+    def _on_flush(session: Session, flush_context) -> None:
+        session.info[_HAS_WRITES_KEY] = True
+
+    def _on_commit(self, session: Session) -> None:
+        if session.info.pop(_HAS_WRITES_KEY, False):
+            self.mark_write()
+
+    @staticmethod
+    def _on_rollback(session: Session) -> None:
+        session.info.pop(_HAS_WRITES_KEY, None)
+
+    def is_replica_available(self) -> bool:
+        if self._replica is None:
+            return False
+
+        return (
+            self._last_write_at is None
+            or self._clock() - self._last_write_at >= self._max_lag
+        )
+
+    def __call__(self) -> AsyncSession:
+        if self.is_replica_available():
+            return self._replica()
+
+        return self._primary()
+
+
 def new_session_maker(
     postgres_settings: PostgresSettings,
+    replica: bool = False,
 ) -> async_sessionmaker[AsyncSession]:
     engine = create_async_engine(
-        postgres_settings.database_uri,
+        postgres_settings.replica_database_uri
+        if replica
+        else postgres_settings.database_uri,
         pool_size=15,
         max_overflow=15,
     )
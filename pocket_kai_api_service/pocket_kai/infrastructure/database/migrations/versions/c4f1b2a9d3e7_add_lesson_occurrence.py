@@ -0,0 +1,151 @@
+"""Add lesson_occurrence
+
+Revision ID: c4f1b2a9d3e7
+Revises: 745a17df7f34
+Create Date: 2026-10-18 12:04:31.518204
+
+"""
+
+import datetime as dt
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1b2a9d3e7'
+down_revision: Union[str, None] = '745a17df7f34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Даты проведения пар на момент создания ревизии: пары с parsed_dates попадают
+# только в эти даты, остальные - в каждый подходящий по дню недели и чётности день
+INSERT_OCCURRENCES = sa.text(
+    """
+    INSERT INTO lesson_occurrence (
+        lesson_id,
+        group_id,
+        teacher_id,
+        audience_number,
+        building_number,
+        date,
+        created_at
+    )
+    SELECT
+        lesson.id,
+        lesson.group_id,
+        lesson.teacher_id,
+        lesson.audience_number,
+        lesson.building_number,
+        CAST(day AS date),
+        timezone('utc', now())
+    FROM
+        lesson,
+        generate_series(
+            CAST(:date_from AS date),
+            CAST(:date_to AS date),
+            interval '1 day'
+        ) AS day
+    WHERE
+        coalesce(cardinality(lesson.parsed_dates), 0) = 0
+        AND extract(isodow FROM day) = lesson.number_of_day
+        AND lesson.parsed_parity IN (
+            'any',
+            CASE
+                WHEN CAST(extract(week FROM day) AS integer) % 2 = 1 THEN 'odd'
+                ELSE 'even'
+            END
+        )
+    UNION ALL
+    SELECT DISTINCT
+        lesson.id,
+        lesson.group_id,
+        lesson.teacher_id,
+        lesson.audience_number,
+        lesson.building_number,
+        parsed_date,
+        timezone('utc', now())
+    FROM lesson, unnest(lesson.parsed_dates) AS parsed_date
+    WHERE parsed_date BETWEEN CAST(:date_from AS date) AND CAST(:date_to AS date)
+    """,
+)
+
+
+def get_occurrences_window(date: dt.date) -> tuple[dt.date, dt.date]:
+    # Текущий и следующий семестры: осенний - с 1 сентября по 31 января,
+    # весенний - с 1 февраля по 31 августа
+    if date.month >= 9:
+        semester_start = dt.date(date.year, 9, 1)
+    elif date.month == 1:
+        semester_start = dt.date(date.year - 1, 9, 1)
+    else:
+        semester_start = dt.date(date.year, 2, 1)
+
+    window_end = semester_start.replace(year=semester_start.year + 1)
+    return semester_start, window_end - dt.timedelta(days=1)
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table(
+        'lesson_occurrence',
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('audience_number', sa.String(), nullable=True),
+        sa.Column('building_number', sa.String(), nullable=True),
+        sa.Column('lesson_id', sa.Uuid(), nullable=False),
+        sa.Column('group_id', sa.Uuid(), nullable=False),
+        sa.Column('teacher_id', sa.Uuid(), nullable=True),
+        sa.Column(
+            'id',
+            sa.Uuid(),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['group_id'], ['group.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['lesson_id'], ['lesson.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['teacher_id'], ['teacher.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_lesson_occurrence_group_id_date',
+        'lesson_occurrence',
+        ['group_id', 'date'],
+        unique=False,
+    )
+    op.create_index(
+        op.f('ix_lesson_occurrence_lesson_id'),
+        'lesson_occurrence',
+        ['lesson_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_lesson_occurrence_teacher_id_date',
+        'lesson_occurrence',
+        ['teacher_id', 'date'],
+        unique=False,
+    )
+    # ### end Alembic commands ###
+
+    date_from, date_to = get_occurrences_window(dt.date.today())
+    op.execute(
+        INSERT_OCCURRENCES.bindparams(
+            sa.bindparam('date_from', date_from, type_=sa.Date),
+            sa.bindparam('date_to', date_to, type_=sa.Date),
+        ),
+    )
+
+
+def downgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index('ix_lesson_occurrence_teacher_id_date', table_name='lesson_occurrence')
+    op.drop_index(
+        op.f('ix_lesson_occurrence_lesson_id'),
+        table_name='lesson_occurrence',
+    )
+    op.drop_index('ix_lesson_occurrence_group_id_date', table_name='lesson_occurrence')
+    op.drop_table('lesson_occurrence')
+    # ### end Alembic commands ###
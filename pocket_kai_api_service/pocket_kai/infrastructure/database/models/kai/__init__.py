@@ -1,5 +1,6 @@
 from .group import GroupModel
 from .lesson import LessonModel
+from .lesson_occurrence import LessonOccurrenceModel
 from .institute import InstituteModel
 from .profile import ProfileModel
 from .department import DepartmentModel
@@ -13,6 +14,7 @@ from .exam import ExamModel
 __all__ = [
     'GroupModel',
     'LessonModel',
+    'LessonOccurrenceModel',
     'InstituteModel',
     'ProfileModel',
     'DepartmentModel',
@@ -1,7 +1,7 @@
 from typing import Optional, TYPE_CHECKING
 import datetime as dt
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from uuid import UUID
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -19,6 +19,14 @@ if TYPE_CHECKING:
 
 class ExamModel(BaseModel):
     __tablename__ = 'exam'
+    __table_args__ = (
+        Index(
+            'ix_exam_group_id_academic_year',
+            'group_id',
+            'academic_year',
+            'academic_year_half',
+        ),
+    )
 
     original_date: Mapped[str] = mapped_column()
     time: Mapped[dt.time] = mapped_column()
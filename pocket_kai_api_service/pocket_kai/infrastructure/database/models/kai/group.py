@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 import sqlalchemy as sa
 
@@ -21,6 +21,17 @@ if TYPE_CHECKING:
 
 class GroupModel(BaseModel):
     __tablename__ = 'group'
+    __table_args__ = (
+        # text_pattern_ops позволяет использовать индекс для поиска по префиксу
+        # (LIKE 'abc%') независимо от локали БД, а также для точного совпадения
+        Index(
+            'ix_group_group_name_pattern',
+            'group_name',
+            postgresql_ops={'group_name': 'text_pattern_ops'},
+        ),
+        # Постраничный обход всех групп по ключу (group_name, id)
+        Index('ix_group_group_name_id', 'group_name', 'id'),
+    )
 
     kai_id: Mapped[int] = mapped_column(sa.BigInteger, unique=True)
     group_leader_id: Mapped[UUID | None] = mapped_column(ForeignKey('student.id'))
@@ -2,7 +2,7 @@ from datetime import date, time
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ARRAY, ForeignKey, Date
+from sqlalchemy import ARRAY, ForeignKey, Date, Index, text
 from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -20,6 +20,31 @@ if TYPE_CHECKING:
 
 class LessonModel(BaseModel):
     __tablename__ = 'lesson'
+    __table_args__ = (
+        # Расписание аудитории читается по корпусу и номеру аудитории
+        # без пробелов по краям в порядке дня недели и времени начала
+        Index(
+            'ix_lesson_room_day_start_time',
+            text('trim(building_number)'),
+            text('trim(audience_number)'),
+            'number_of_day',
+            'start_time',
+        ),
+        # Расписания группы и преподавателя читаются в порядке дня недели
+        # и времени начала
+        Index(
+            'ix_lesson_group_id_day_start_time',
+            'group_id',
+            'number_of_day',
+            'start_time',
+        ),
+        Index(
+            'ix_lesson_teacher_id_day_start_time',
+            'teacher_id',
+            'number_of_day',
+            'start_time',
+        ),
+    )
 
     number_of_day: Mapped[int] = mapped_column()
     original_dates: Mapped[str | None] = mapped_column()
@@ -0,0 +1,42 @@
+from datetime import date
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+
+from pocket_kai.infrastructure.database.models.base import BaseModel
+
+
+if TYPE_CHECKING:
+    from pocket_kai.infrastructure.database.models.kai import LessonModel
+
+
+class LessonOccurrenceModel(BaseModel):
+    """
+    Материализованные даты проведения пар.
+    Пересоздаются при изменении пар группы, см. LessonOccurrenceGateway
+    """
+
+    __tablename__ = 'lesson_occurrence'
+    __table_args__ = (
+        Index('ix_lesson_occurrence_group_id_date', 'group_id', 'date'),
+        Index('ix_lesson_occurrence_teacher_id_date', 'teacher_id', 'date'),
+    )
+
+    date: Mapped[date] = mapped_column()
+    audience_number: Mapped[str | None] = mapped_column()
+    building_number: Mapped[str | None] = mapped_column()
+
+    lesson_id: Mapped[UUID] = mapped_column(
+        ForeignKey('lesson.id', ondelete='CASCADE'),
+        index=True,
+    )
+    group_id: Mapped[UUID] = mapped_column(
+        ForeignKey('group.id', ondelete='CASCADE'),
+    )
+    # Как у lesson.teacher_id: удаление преподавателя не должно молча удалять
+    # даты пар, которые остаются в таблице lesson
+    teacher_id: Mapped[UUID | None] = mapped_column(ForeignKey('teacher.id'))
+
+    lesson: Mapped['LessonModel'] = relationship()
@@ -2,7 +2,7 @@ from datetime import date
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy_utils import StringEncryptedType
 import sqlalchemy as sa
@@ -21,6 +21,7 @@ settings = get_settings()
 
 class StudentModel(BaseModel):
     __tablename__ = 'student'
+    __table_args__ = (Index('ix_student_group_id_position', 'group_id', 'position'),)
 
     kai_id: Mapped[int | None] = mapped_column(sa.BigInteger, unique=True)
 
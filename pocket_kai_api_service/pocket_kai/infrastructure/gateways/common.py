@@ -0,0 +1,57 @@
+import dataclasses
+
+from typing import Any, Sequence
+
+from sqlalchemy import Column, Row, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pocket_kai.infrastructure.database.models.base import BaseModel
+
+
+async def get_or_create_many(
+    session: AsyncSession,
+    model: type[BaseModel],
+    key_column: Column,
+    entities: Sequence[Any],
+) -> list[Row]:
+    """
+    Сохраняет записи, которых ещё нет в таблице (по уникальному `key_column`),
+    и возвращает строки всех записей с переданными ключами. Существующие
+    записи не изменяются
+    """
+    if not entities:
+        return []
+
+    values = [dataclasses.asdict(entity) for entity in entities]
+    keys = list({value[key_column.key] for value in values})
+    columns = model.__table__.columns
+
+    inserted = (
+        pg_insert(model)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=[key_column])
+        .returning(*columns)
+        .cte('inserted')
+    )
+    # Строки, вставленные в CTE, не видны остальной части запроса,
+    # поэтому каждая запись попадает в результат ровно один раз
+    existing = select(*columns).where(
+        key_column == any_(literal(keys, ARRAY(key_column.type))),
+    )
+    result = await session.execute(select(inserted).union_all(existing))
+    records = list(result.all())
+
+    found_keys = {getattr(record, key_column.key) for record in records}
+    missing_keys = [key for key in keys if key not in found_keys]
+    if missing_keys:
+        # Запись вставила параллельная транзакция уже после снимка запроса
+        result = await session.execute(
+            select(*columns).where(
+                key_column == any_(literal(missing_keys, ARRAY(key_column.type))),
+            ),
+        )
+        records.extend(result.all())
+
+    return records
@@ -7,6 +7,7 @@ from pocket_kai.application.interfaces.entities.department import (
 )
 from pocket_kai.domain.entitites.department import DepartmentEntity
 from pocket_kai.infrastructure.database.models.kai import DepartmentModel
+from pocket_kai.infrastructure.gateways.common import get_or_create_many
 
 
 class DepartmentGateway(DepartmentReader, DepartmentSaver):
@@ -48,3 +49,16 @@ class DepartmentGateway(DepartmentReader, DepartmentSaver):
                 name=department.name,
             ),
         )
+
+    async def get_or_create_many(
+        self,
+        departments: list[DepartmentEntity],
+    ) -> list[DepartmentEntity]:
+        department_records = await get_or_create_many(
+            self._session,
+            DepartmentModel,
+            DepartmentModel.kai_id,
+            departments,
+        )
+
+        return [self.db_to_entity(record) for record in department_records]
@@ -16,6 +16,7 @@ from pocket_kai.infrastructure.database.models.kai import (
     LessonModel,
     TeacherModel,
 )
+from pocket_kai.infrastructure.gateways.common import get_or_create_many
 
 
 class DisciplineGateway(DisciplineReader, DisciplineSaver):
@@ -126,3 +127,16 @@ class DisciplineGateway(DisciplineReader, DisciplineSaver):
                 name=discipline.name,
             ),
         )
+
+    async def get_or_create_many(
+        self,
+        disciplines: list[DisciplineEntity],
+    ) -> list[DisciplineEntity]:
+        discipline_records = await get_or_create_many(
+            self._session,
+            DisciplineModel,
+            DisciplineModel.kai_id,
+            disciplines,
+        )
+
+        return [self._db_to_entity(record) for record in discipline_records]
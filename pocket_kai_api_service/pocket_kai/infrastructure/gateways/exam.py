@@ -1,6 +1,10 @@
 import dataclasses
 
-from sqlalchemy import delete, insert, select, update
+from uuid import UUID
+
+from sqlalchemy import Uuid, any_, delete, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,6 +16,7 @@ from pocket_kai.application.interfaces.entities.exam import (
     ExamUpdater,
 )
 from pocket_kai.domain.entitites.exam import ExamEntity
+from pocket_kai.domain.exceptions.base import BadRelatedEntityError
 from pocket_kai.infrastructure.database.models.kai.exam import ExamModel
 from pocket_kai.infrastructure.gateways.discipline import DisciplineGateway
 from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
@@ -70,6 +75,18 @@ class ExamGateway(ExamSaver, ExamReader, ExamDeleter, ExamUpdater):
             insert(ExamModel).values(**dataclasses.asdict(exam)),
         )
 
+    async def save_many(self, exams: list[ExamEntity]) -> None:
+        if not exams:
+            return
+
+        try:
+            await self._session.execute(
+                insert(ExamModel),
+                [dataclasses.asdict(exam) for exam in exams],
+            )
+        except IntegrityError:
+            raise BadRelatedEntityError
+
     async def get_by_id(self, exam_id: str) -> ExamEntity:
         exam = await self._session.get(ExamModel, exam_id)
         return self.db_to_entity(exam)
@@ -96,6 +113,7 @@ class ExamGateway(ExamSaver, ExamReader, ExamDeleter, ExamUpdater):
             stmt = stmt.where(ExamModel.academic_year == academic_year)
         if academic_year_half is not None:
             stmt = stmt.where(ExamModel.academic_year_half == academic_year_half)
+        stmt = stmt.order_by(ExamModel.parsed_date, ExamModel.time, ExamModel.id)
         exams = await self._session.scalars(stmt)
 
         return [self.db_to_entity(exam) for exam in exams]
@@ -111,6 +129,7 @@ class ExamGateway(ExamSaver, ExamReader, ExamDeleter, ExamUpdater):
             stmt = stmt.where(ExamModel.academic_year == academic_year)
         if academic_year_half is not None:
             stmt = stmt.where(ExamModel.academic_year_half == academic_year_half)
+        stmt = stmt.order_by(ExamModel.parsed_date, ExamModel.time, ExamModel.id)
 
         stmt = stmt.options(
             selectinload(ExamModel.teacher),
@@ -132,3 +151,27 @@ class ExamGateway(ExamSaver, ExamReader, ExamDeleter, ExamUpdater):
             .where(ExamModel.id == exam.id)
             .values(**dataclasses.asdict(exam)),
         )
+
+    async def update_many(self, exams: list[ExamEntity]) -> None:
+        if not exams:
+            return
+
+        # ORM bulk UPDATE по первичному ключу выполняется одним executemany
+        try:
+            await self._session.execute(
+                update(ExamModel),
+                [dataclasses.asdict(exam) for exam in exams],
+            )
+        except IntegrityError:
+            raise BadRelatedEntityError
+
+    async def delete_many(self, exam_ids: list[str]) -> None:
+        if not exam_ids:
+            return
+
+        await self._session.execute(
+            delete(ExamModel).where(
+                ExamModel.id
+                == any_(literal([UUID(str(id)) for id in exam_ids], ARRAY(Uuid))),
+            ),
+        )
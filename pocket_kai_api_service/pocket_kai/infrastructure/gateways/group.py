@@ -1,29 +1,81 @@
 import dataclasses
 
-from sqlalchemy import insert, select, update
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    CTE,
+    Select,
+    String,
+    Uuid,
+    any_,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from pocket_kai.application.dto.group import GroupExtendedDTO, GroupPatchDTO
+from pocket_kai.application.interfaces.cache import ReferenceCatalog
 from pocket_kai.application.interfaces.entities.group import (
     GroupReader,
     GroupSaver,
     GroupUpdater,
 )
+from pocket_kai.domain.entitites.department import DepartmentEntity
 from pocket_kai.domain.entitites.group import GroupEntity
+from pocket_kai.domain.entitites.institute import InstituteEntity
+from pocket_kai.domain.entitites.profile import ProfileEntity
+from pocket_kai.domain.entitites.speciality import SpecialityEntity
 from pocket_kai.domain.exceptions.base import BadRelatedEntityError
-from pocket_kai.domain.exceptions.group import GroupAlreadyExistsError
-from pocket_kai.infrastructure.database.models.kai import GroupModel
+from pocket_kai.domain.exceptions.group import (
+    GroupAlreadyExistsError,
+    GroupNotFoundError,
+)
+from pocket_kai.infrastructure.database.models.kai import (
+    DepartmentModel,
+    GroupModel,
+    InstituteModel,
+    ProfileModel,
+    SpecialityModel,
+)
 from pocket_kai.infrastructure.gateways.department import DepartmentGateway
 from pocket_kai.infrastructure.gateways.institute import InstituteGateway
 from pocket_kai.infrastructure.gateways.profile import ProfileGateway
 from pocket_kai.infrastructure.gateways.speciality import SpecialityGateway
 
 
+def _upsert_by_kai_id_cte(model, entity, name: str) -> CTE:
+    # При конфликте обновляются все поля, кроме id и даты создания,
+    # иначе RETURNING не вернёт id уже существующей записи
+    values = dataclasses.asdict(entity)
+    insert_stmt = pg_insert(model).values(**values)
+
+    return (
+        insert_stmt.on_conflict_do_update(
+            index_elements=[model.kai_id],
+            set_={
+                column: insert_stmt.excluded[column]
+                for column in values
+                if column not in ('id', 'created_at', 'kai_id')
+            },
+        )
+        .returning(model.id)
+        .cte(name)
+    )
+
+
 class GroupGateway(GroupReader, GroupSaver, GroupUpdater):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, reference_catalog: ReferenceCatalog):
         self._session = session
+        self._reference_catalog = reference_catalog
 
     @staticmethod
     def _db_to_entity(group_record: GroupModel | None) -> GroupEntity | None:
@@ -88,6 +140,33 @@ class GroupGateway(GroupReader, GroupSaver, GroupUpdater):
             await self._session.get(GroupModel, id),
         )
 
+    async def get_by_ids_and_names(
+        self,
+        group_ids: list[str],
+        group_names: list[str],
+    ) -> list[GroupEntity]:
+        # Списки передаются одним параметром-массивом, а не раскрываются в IN,
+        # поэтому текст запроса не зависит от количества групп
+        groups = await self._session.scalars(
+            select(GroupModel)
+            .where(
+                or_(
+                    GroupModel.id
+                    == any_(
+                        literal(
+                            [UUID(str(group_id)) for group_id in group_ids],
+                            ARRAY(Uuid),
+                        ),
+                    ),
+                    GroupModel.group_name
+                    == any_(literal(list(group_names), ARRAY(String))),
+                ),
+            )
+            .order_by(GroupModel.group_name),
+        )
+
+        return [self._db_to_entity(group) for group in groups.all()]
+
     async def suggest_by_name(
         self,
         group_name: str,
@@ -104,19 +183,44 @@ class GroupGateway(GroupReader, GroupSaver, GroupUpdater):
 
         return [self._db_to_entity(group) for group in groups.all()]
 
-    async def get_all(self, limit: int, offset: int) -> list[GroupEntity]:
-        groups = await self._session.scalars(
-            select(GroupModel).limit(limit).offset(offset),
+    @staticmethod
+    def _page_stmt(
+        limit: int,
+        offset: int,
+        after: tuple[str, str] | None,
+    ) -> Select:
+        stmt = select(GroupModel)
+        if after is not None:
+            group_name, group_id = after
+            stmt = stmt.where(
+                tuple_(GroupModel.group_name, GroupModel.id)
+                > tuple_(literal(group_name), literal(UUID(group_id), Uuid)),
+            )
+
+        return (
+            stmt.order_by(GroupModel.group_name, GroupModel.id)
+            .limit(limit)
+            .offset(offset)
         )
 
+    async def get_all(
+        self,
+        limit: int,
+        offset: int,
+        after: tuple[str, str] | None = None,
+    ) -> list[GroupEntity]:
+        groups = await self._session.scalars(self._page_stmt(limit, offset, after))
+
         return [self._db_to_entity(group) for group in groups.all()]
 
-    async def get_all_extended(self, limit: int, offset: int) -> list[GroupExtendedDTO]:
+    async def get_all_extended(
+        self,
+        limit: int,
+        offset: int,
+        after: tuple[str, str] | None = None,
+    ) -> list[GroupExtendedDTO]:
         groups = await self._session.scalars(
-            select(GroupModel)
-            .limit(limit)
-            .offset(offset)
-            .options(
+            self._page_stmt(limit, offset, after).options(
                 selectinload(GroupModel.profile),
                 selectinload(GroupModel.speciality),
                 selectinload(GroupModel.department),
@@ -173,3 +277,71 @@ class GroupGateway(GroupReader, GroupSaver, GroupUpdater):
             )
         except IntegrityError:
             raise BadRelatedEntityError
+
+    async def touch_schedule(
+        self,
+        group_ids: list[str],
+        schedule_parsed_at: datetime,
+    ) -> None:
+        if not group_ids:
+            return
+
+        await self._session.execute(
+            update(GroupModel)
+            .where(
+                GroupModel.id
+                == any_(
+                    literal(
+                        [UUID(str(group_id)) for group_id in group_ids],
+                        ARRAY(Uuid),
+                    ),
+                ),
+            )
+            .values(schedule_parsed_at=schedule_parsed_at)
+            .execution_options(synchronize_session=False),
+        )
+
+    async def verify_with_references(
+        self,
+        group_name: str,
+        speciality: SpecialityEntity,
+        institute: InstituteEntity,
+        profile: ProfileEntity,
+        department: DepartmentEntity,
+        verified_at: datetime,
+    ) -> GroupEntity:
+        # Все upsert выполняются в CTE одного UPDATE - один запрос к БД
+        speciality_cte = _upsert_by_kai_id_cte(SpecialityModel, speciality, 'spec')
+        institute_cte = _upsert_by_kai_id_cte(InstituteModel, institute, 'inst')
+        profile_cte = _upsert_by_kai_id_cte(ProfileModel, profile, 'prof')
+        department_cte = _upsert_by_kai_id_cte(DepartmentModel, department, 'dep')
+
+        try:
+            group_record = await self._session.scalar(
+                update(GroupModel)
+                .where(GroupModel.group_name == group_name)
+                .values(
+                    speciality_id=select(speciality_cte.c.id).scalar_subquery(),
+                    institute_id=select(institute_cte.c.id).scalar_subquery(),
+                    profile_id=select(profile_cte.c.id).scalar_subquery(),
+                    department_id=select(department_cte.c.id).scalar_subquery(),
+                    is_verified=True,
+                    verified_at=verified_at,
+                    parsed_at=verified_at,
+                )
+                .returning(GroupModel)
+                .execution_options(synchronize_session=False),
+            )
+        except IntegrityError:
+            raise BadRelatedEntityError
+
+        if group_record is None:
+            raise GroupNotFoundError
+
+        # Upsert мог изменить названия, актуальные записи прочитаются из БД
+        self._reference_catalog.remove(SpecialityEntity, group_record.speciality_id)
+        self._reference_catalog.remove(InstituteEntity, group_record.institute_id)
+        self._reference_catalog.remove(ProfileEntity, group_record.profile_id)
+        self._reference_catalog.remove(DepartmentEntity, group_record.department_id)
+
+        return self._db_to_entity(group_record)
@@ -1,15 +1,35 @@
-from typing import Iterable
+import datetime as dt
+
+from collections import defaultdict
+from typing import AsyncIterator, Iterable, Sequence
+from uuid import UUID
 
 import dataclasses
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Uuid,
+    and_,
+    any_,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array_agg
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from pocket_kai.application.dto.lesson import (
+    GroupWithLessonsDTO,
     LessonExtendedDTO,
     LessonPatchDTO,
+    RoomLessonExtendedDTO,
     TeacherLessonExtendedDTO,
 )
 from pocket_kai.application.interfaces.entities.lesson import (
@@ -19,15 +39,111 @@ from pocket_kai.application.interfaces.entities.lesson import (
     LessonUpdater,
 )
 from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.department import DepartmentEntity
+from pocket_kai.domain.entitites.discipline import DisciplineEntity
+from pocket_kai.domain.entitites.group import GroupEntity
 from pocket_kai.domain.entitites.lesson import LessonEntity
+from pocket_kai.domain.entitites.teacher import TeacherEntity
 from pocket_kai.domain.exceptions.base import BadRelatedEntityError
-from pocket_kai.infrastructure.database.models.kai import LessonModel
+from pocket_kai.domain.room_occupancy import normalize_room_number
+from pocket_kai.infrastructure.database.models.kai import (
+    DepartmentModel,
+    DisciplineModel,
+    GroupModel,
+    LessonModel,
+    TeacherModel,
+)
 from pocket_kai.infrastructure.gateways.department import DepartmentGateway
 from pocket_kai.infrastructure.gateways.discipline import DisciplineGateway
 from pocket_kai.infrastructure.gateways.group import GroupGateway
 from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
 
 
+def _entity_columns(model, entity) -> list:
+    return [getattr(model, field.name) for field in dataclasses.fields(entity)]
+
+
+# Колонки для чтения расписания одним запросом. Порядок колонок совпадает
+# с порядком полей сущностей, поэтому сущности собираются из срезов строки
+_LESSON_COLUMNS = _entity_columns(LessonModel, LessonEntity)
+_DISCIPLINE_COLUMNS = _entity_columns(DisciplineModel, DisciplineEntity)
+_DEPARTMENT_COLUMNS = _entity_columns(DepartmentModel, DepartmentEntity)
+_TEACHER_COLUMNS = _entity_columns(TeacherModel, TeacherEntity)
+_GROUP_COLUMNS = _entity_columns(GroupModel, GroupEntity)
+
+_LESSON_SLICE = slice(0, len(_LESSON_COLUMNS))
+_DISCIPLINE_SLICE = slice(
+    _LESSON_SLICE.stop,
+    _LESSON_SLICE.stop + len(_DISCIPLINE_COLUMNS),
+)
+_DEPARTMENT_SLICE = slice(
+    _DISCIPLINE_SLICE.stop,
+    _DISCIPLINE_SLICE.stop + len(_DEPARTMENT_COLUMNS),
+)
+_TEACHER_SLICE = slice(
+    _DEPARTMENT_SLICE.stop,
+    _DEPARTMENT_SLICE.stop + len(_TEACHER_COLUMNS),
+)
+_GROUP_SLICE = slice(
+    _TEACHER_SLICE.stop,
+    _TEACHER_SLICE.stop + len(_GROUP_COLUMNS),
+)
+
+_LESSONS_WITH_RELATIONS = (
+    LessonModel.__table__.join(
+        DisciplineModel.__table__,
+        LessonModel.discipline_id == DisciplineModel.id,
+    )
+    .outerjoin(
+        DepartmentModel.__table__,
+        LessonModel.department_id == DepartmentModel.id,
+    )
+    .outerjoin(
+        TeacherModel.__table__,
+        LessonModel.teacher_id == TeacherModel.id,
+    )
+)
+
+
+# Занятия преподавателя с совпадающими полями из этого списка проходят
+# у нескольких групп одновременно (поток) и объединяются в одно
+_TEACHER_LESSON_KEY = (
+    LessonModel.number_of_day,
+    LessonModel.start_time,
+    LessonModel.parsed_lesson_type,
+    LessonModel.original_dates,
+    LessonModel.audience_number,
+    LessonModel.building_number,
+    LessonModel.discipline_id,
+)
+
+
+# То же для занятий в одной аудитории
+_ROOM_LESSON_KEY = (
+    LessonModel.number_of_day,
+    LessonModel.start_time,
+    LessonModel.parsed_lesson_type,
+    LessonModel.original_dates,
+    LessonModel.teacher_id,
+    LessonModel.discipline_id,
+)
+
+
+# Сколько строк за раз забирается из серверного курсора при выгрузке
+_STREAM_YIELD_PER = 1000
+
+
+def _uuid_array(ids: Iterable[str]):
+    return literal([UUID(str(id)) for id in ids], ARRAY(Uuid))
+
+
+def _get_parities(week_parity: WeekParity) -> set[WeekParity]:
+    if week_parity == WeekParity.ANY:
+        return {WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN}
+
+    return {WeekParity.ANY, week_parity}
+
+
 class LessonGateway(LessonReader, LessonSaver, LessonUpdater, LessonDeleter):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -87,6 +203,30 @@ class LessonGateway(LessonReader, LessonSaver, LessonUpdater, LessonDeleter):
             discipline=DisciplineGateway._db_to_entity(lesson_record.discipline),
         )
 
+    @staticmethod
+    def _row_to_extended_dto(row: Sequence) -> LessonExtendedDTO:
+        department_id = row[_DEPARTMENT_SLICE.start]
+        teacher_id = row[_TEACHER_SLICE.start]
+
+        return LessonExtendedDTO(
+            *row[_LESSON_SLICE],
+            teacher=TeacherEntity(*row[_TEACHER_SLICE]) if teacher_id else None,
+            department=DepartmentEntity(*row[_DEPARTMENT_SLICE])
+            if department_id
+            else None,
+            discipline=DisciplineEntity(*row[_DISCIPLINE_SLICE]),
+        )
+
+    @staticmethod
+    def _extended_lessons_select(*columns) -> Select:
+        return select(
+            *_LESSON_COLUMNS,
+            *_DISCIPLINE_COLUMNS,
+            *_DEPARTMENT_COLUMNS,
+            *_TEACHER_COLUMNS,
+            *columns,
+        ).order_by(LessonModel.number_of_day, LessonModel.start_time)
+
     @staticmethod
     def db_to_teacher_extended_dto(
         lesson_records: Iterable[LessonModel],
@@ -162,6 +302,26 @@ class LessonGateway(LessonReader, LessonSaver, LessonUpdater, LessonDeleter):
 
         return [self._db_to_entity(lesson) for lesson in lessons.all()]
 
+    async def get_all_with_room(self) -> list[LessonEntity]:
+        result = await self._session.execute(
+            select(*_LESSON_COLUMNS).where(
+                LessonModel.building_number.is_not(None),
+                LessonModel.audience_number.is_not(None),
+            ),
+        )
+
+        return [LessonEntity(*row) for row in result.all()]
+
+    async def get_by_ids(self, lesson_ids: list[str]) -> list[LessonEntity]:
+        if not lesson_ids:
+            return []
+
+        lesson_records = await self._session.scalars(
+            select(LessonModel).where(LessonModel.id == any_(_uuid_array(lesson_ids))),
+        )
+
+        return [self._db_to_entity(record) for record in lesson_records.all()]
+
     async def get_by_id_extended(self, lesson_id: str) -> LessonExtendedDTO:
         stmt = (
             select(LessonModel)
@@ -174,65 +334,257 @@ class LessonGateway(LessonReader, LessonSaver, LessonUpdater, LessonDeleter):
         )
         return self._db_to_extended_dto(await self._session.scalar(stmt))
 
+    async def get_schedule_parsed_at_by_teacher_id(
+        self,
+        teacher_id: str,
+    ) -> dt.datetime | None:
+        # Расписание преподавателя собирается из расписаний групп,
+        # поэтому его версия - время последнего обновления одной из них
+        return await self._session.scalar(
+            select(func.max(GroupModel.schedule_parsed_at))
+            .join(LessonModel, LessonModel.group_id == GroupModel.id)
+            .where(LessonModel.teacher_id == teacher_id),
+        )
+
+    async def _get_merged_lessons(
+        self,
+        merge_key: Sequence,
+        *where: ColumnElement[bool],
+    ) -> tuple[list[Row], dict[str, GroupEntity]]:
+        """
+        Объединяет занятия, проходящие у нескольких групп одновременно, в БД:
+        на каждое объединённое занятие одна строка с ID групп, упорядоченных
+        по названию. Группы читаются отдельно, каждая по одному разу
+        """
+        merged_lessons = (
+            select(
+                array_agg(
+                    aggregate_order_by(LessonModel.id, GroupModel.group_name),
+                )[1].label('lesson_id'),
+                array_agg(
+                    aggregate_order_by(LessonModel.group_id, GroupModel.group_name),
+                ).label('group_ids'),
+            )
+            .select_from(LessonModel)
+            .join(GroupModel, LessonModel.group_id == GroupModel.id)
+            .where(*where)
+            .group_by(*merge_key)
+            .subquery()
+        )
+        stmt = self._extended_lessons_select(merged_lessons.c.group_ids).select_from(
+            merged_lessons.join(
+                _LESSONS_WITH_RELATIONS,
+                LessonModel.id == merged_lessons.c.lesson_id,
+            ),
+        )
+        rows = (await self._session.execute(stmt)).all()
+        if not rows:
+            return [], {}
+
+        group_ids = {group_id for row in rows for group_id in row.group_ids}
+        group_rows = await self._session.execute(
+            select(*_GROUP_COLUMNS).where(
+                GroupModel.id == any_(_uuid_array(group_ids)),
+            ),
+        )
+        groups = {row[0]: GroupEntity(*row) for row in group_rows.all()}
+
+        return rows, groups
+
     async def get_by_teacher_id_extended(
         self,
         teacher_id: str,
         week_parity: WeekParity,
     ) -> list[TeacherLessonExtendedDTO]:
-        if week_parity == WeekParity.ANY:
-            parities = {WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN}
-        else:
-            parities = {WeekParity.ANY, week_parity}
+        rows, groups = await self._get_merged_lessons(
+            _TEACHER_LESSON_KEY,
+            LessonModel.teacher_id == teacher_id,
+            LessonModel.parsed_parity.in_(_get_parities(week_parity)),
+        )
 
-        stmt = (
-            select(LessonModel)
-            .where(
-                LessonModel.teacher_id == teacher_id,
-                LessonModel.parsed_parity.in_(parities),
-            )
-            .order_by(LessonModel.number_of_day, LessonModel.start_time)
-            .options(
-                selectinload(LessonModel.discipline),
-                selectinload(LessonModel.department),
-                selectinload(LessonModel.group),
+        return [
+            TeacherLessonExtendedDTO(
+                *row[_LESSON_SLICE],
+                department=DepartmentEntity(*row[_DEPARTMENT_SLICE])
+                if row[_DEPARTMENT_SLICE.start]
+                else None,
+                discipline=DisciplineEntity(*row[_DISCIPLINE_SLICE]),
+                groups=[groups[group_id] for group_id in row.group_ids],
             )
+            for row in rows
+        ]
+
+    async def get_by_room_extended(
+        self,
+        building_number: str,
+        audience_number: str,
+        week_parity: WeekParity,
+    ) -> list[RoomLessonExtendedDTO]:
+        rows, groups = await self._get_merged_lessons(
+            _ROOM_LESSON_KEY,
+            func.trim(LessonModel.building_number)
+            == normalize_room_number(building_number),
+            func.trim(LessonModel.audience_number)
+            == normalize_room_number(audience_number),
+            LessonModel.parsed_parity.in_(_get_parities(week_parity)),
         )
-        lessons = await self._session.scalars(stmt)
 
-        return self.db_to_teacher_extended_dto(lessons)
+        return [
+            RoomLessonExtendedDTO(
+                *row[_LESSON_SLICE],
+                teacher=TeacherEntity(*row[_TEACHER_SLICE])
+                if row[_TEACHER_SLICE.start]
+                else None,
+                department=DepartmentEntity(*row[_DEPARTMENT_SLICE])
+                if row[_DEPARTMENT_SLICE.start]
+                else None,
+                discipline=DisciplineEntity(*row[_DISCIPLINE_SLICE]),
+                groups=[groups[group_id] for group_id in row.group_ids],
+            )
+            for row in rows
+        ]
 
     async def get_by_group_id_extended(
         self,
         group_id: str,
         week_parity: WeekParity,
     ) -> list[LessonExtendedDTO]:
-        if week_parity == WeekParity.ANY:
-            parities = {WeekParity.ANY, WeekParity.ODD, WeekParity.EVEN}
-        else:
-            parities = {WeekParity.ANY, week_parity}
-
         stmt = (
-            select(LessonModel)
+            self._extended_lessons_select()
+            .select_from(_LESSONS_WITH_RELATIONS)
             .where(
                 LessonModel.group_id == group_id,
-                LessonModel.parsed_parity.in_(parities),
+                LessonModel.parsed_parity.in_(_get_parities(week_parity)),
             )
-            .order_by(LessonModel.number_of_day, LessonModel.start_time)
-            .options(
-                selectinload(LessonModel.discipline),
-                selectinload(LessonModel.department),
-                selectinload(LessonModel.teacher),
+        )
+        result = await self._session.execute(stmt)
+
+        return [self._row_to_extended_dto(row) for row in result.all()]
+
+    async def get_by_group_ids_extended(
+        self,
+        group_ids: list[str],
+        week_parity: WeekParity,
+    ) -> dict[str, list[LessonExtendedDTO]]:
+        stmt = (
+            self._extended_lessons_select()
+            .select_from(_LESSONS_WITH_RELATIONS)
+            .where(
+                LessonModel.group_id == any_(_uuid_array(group_ids)),
+                LessonModel.parsed_parity.in_(_get_parities(week_parity)),
             )
         )
-        lessons = await self._session.scalars(stmt)
+        result = await self._session.execute(stmt)
+
+        lessons_by_group = defaultdict(list)
+        for row in result.all():
+            lesson = self._row_to_extended_dto(row)
+            lessons_by_group[lesson.group_id].append(lesson)
 
-        return [self._db_to_extended_dto(lesson) for lesson in lessons.all()]
+        return lessons_by_group
+
+    async def get_group_schedule_by_group_id(
+        self,
+        group_id: str,
+        week_parity: WeekParity,
+    ) -> tuple[GroupEntity, list[LessonExtendedDTO]] | None:
+        # Группа присоединяется внешним соединением, чтобы отличать группу
+        # без пар от несуществующей группы
+        stmt = (
+            self._extended_lessons_select(*_GROUP_COLUMNS)
+            .select_from(
+                GroupModel.__table__.outerjoin(
+                    _LESSONS_WITH_RELATIONS,
+                    and_(
+                        LessonModel.group_id == GroupModel.id,
+                        LessonModel.parsed_parity.in_(_get_parities(week_parity)),
+                    ),
+                ),
+            )
+            .where(GroupModel.id == group_id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        if not rows:
+            return None
+
+        group = GroupEntity(*rows[0][_GROUP_SLICE])
+        lessons = [
+            self._row_to_extended_dto(row)
+            for row in rows
+            if row[_LESSON_SLICE.start] is not None
+        ]
+
+        return group, lessons
+
+    async def stream_groups_with_lessons(self) -> AsyncIterator[GroupWithLessonsDTO]:
+        # Строки упорядочены по группе, поэтому группа собирается из идущих
+        # подряд строк и в памяти держится только она
+        stmt = (
+            self._extended_lessons_select(*_GROUP_COLUMNS)
+            .select_from(
+                GroupModel.__table__.outerjoin(
+                    _LESSONS_WITH_RELATIONS,
+                    LessonModel.group_id == GroupModel.id,
+                ),
+            )
+            .order_by(None)
+            .order_by(
+                GroupModel.group_name,
+                GroupModel.id,
+                LessonModel.number_of_day,
+                LessonModel.start_time,
+            )
+            .execution_options(yield_per=_STREAM_YIELD_PER)
+        )
+        result = await self._session.stream(stmt)
+
+        group_with_lessons = None
+        async for row in result:
+            group_id = row[_GROUP_SLICE.start]
+            if group_with_lessons is None or group_with_lessons.group.id != group_id:
+                if group_with_lessons is not None:
+                    yield group_with_lessons
+                group_with_lessons = GroupWithLessonsDTO(
+                    group=GroupEntity(*row[_GROUP_SLICE]),
+                    lessons=[],
+                )
+
+            if row[_LESSON_SLICE.start] is not None:
+                group_with_lessons.lessons.append(self._row_to_extended_dto(row))
+
+        if group_with_lessons is not None:
+            yield group_with_lessons
 
     async def save(self, lesson: LessonEntity) -> None:
         await self._session.execute(
             insert(LessonModel).values(**dataclasses.asdict(lesson)),
         )
 
+    async def save_many(self, lessons: list[LessonEntity]) -> None:
+        if not lessons:
+            return
+
+        try:
+            await self._session.execute(
+                insert(LessonModel),
+                [dataclasses.asdict(lesson) for lesson in lessons],
+            )
+        except IntegrityError:
+            raise BadRelatedEntityError
+
+    async def update_many(self, lessons: list[LessonEntity]) -> None:
+        if not lessons:
+            return
+
+        # ORM bulk UPDATE по первичному ключу выполняется одним executemany
+        try:
+            await self._session.execute(
+                update(LessonModel),
+                [dataclasses.asdict(lesson) for lesson in lessons],
+            )
+        except IntegrityError:
+            raise BadRelatedEntityError
+
     async def update(self, lesson: LessonEntity) -> None:
         update_dict = dataclasses.asdict(lesson)
         update_dict.pop('id')
@@ -256,7 +608,23 @@ class LessonGateway(LessonReader, LessonSaver, LessonUpdater, LessonDeleter):
         except IntegrityError:
             raise BadRelatedEntityError
 
-    async def delete(self, lesson_id: str) -> None:
-        await self._session.execute(
-            delete(LessonModel).where(LessonModel.id == lesson_id),
+    async def delete(self, lesson_id: str) -> LessonEntity | None:
+        lesson_record = await self._session.scalar(
+            delete(LessonModel)
+            .where(LessonModel.id == lesson_id)
+            .returning(LessonModel),
+        )
+
+        return self._db_to_entity(lesson_record)
+
+    async def delete_many(self, lesson_ids: list[str]) -> list[LessonEntity]:
+        if not lesson_ids:
+            return []
+
+        lesson_records = await self._session.scalars(
+            delete(LessonModel)
+            .where(LessonModel.id == any_(_uuid_array(lesson_ids)))
+            .returning(LessonModel),
         )
+
+        return [self._db_to_entity(record) for record in lesson_records.all()]
@@ -0,0 +1,256 @@
+import datetime as dt
+
+from itertools import groupby
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Insert,
+    Integer,
+    Interval,
+    Uuid,
+    any_,
+    case,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from pocket_kai.application.dto.lesson import (
+    LessonOccurrenceDTO,
+    TeacherLessonOccurrenceDTO,
+)
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceReader,
+    LessonOccurrenceUpdater,
+)
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.infrastructure.database.models.kai import (
+    LessonModel,
+    LessonOccurrenceModel,
+)
+from pocket_kai.infrastructure.gateways.lesson import LessonGateway
+
+
+class LessonOccurrenceGateway(LessonOccurrenceReader, LessonOccurrenceUpdater):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def insert_occurrences_stmt(
+        date_from: dt.date,
+        date_to: dt.date,
+        *where: ColumnElement[bool],
+    ) -> Insert:
+        """
+        Разворачивает пары в даты на стороне БД, повторяя логику фильтрации по датам:
+        пары с `parsed_dates` попадают только в эти даты,
+        остальные - в каждый подходящий по дню недели и чётности день
+        """
+        day = func.generate_series(
+            literal(date_from, Date),
+            literal(date_to, Date),
+            literal(dt.timedelta(days=1), Interval),
+        ).column_valued('day')
+        day_parity = case(
+            (cast(extract('week', day), Integer) % 2 == 1, WeekParity.ODD.value),
+            else_=WeekParity.EVEN.value,
+        )
+        parsed_date = func.unnest(LessonModel.parsed_dates).column_valued('parsed_date')
+        created_at = func.timezone('utc', func.now())
+
+        weekly_occurrences = select(
+            LessonModel.id,
+            LessonModel.group_id,
+            LessonModel.teacher_id,
+            LessonModel.audience_number,
+            LessonModel.building_number,
+            cast(day, Date),
+            created_at,
+        ).where(
+            *where,
+            func.coalesce(func.cardinality(LessonModel.parsed_dates), 0) == 0,
+            extract('isodow', day) == LessonModel.number_of_day,
+            or_(
+                LessonModel.parsed_parity == WeekParity.ANY,
+                LessonModel.parsed_parity == day_parity,
+            ),
+        )
+        dated_occurrences = (
+            select(
+                LessonModel.id,
+                LessonModel.group_id,
+                LessonModel.teacher_id,
+                LessonModel.audience_number,
+                LessonModel.building_number,
+                parsed_date,
+                created_at,
+            )
+            .distinct()
+            .where(*where, parsed_date.between(date_from, date_to))
+        )
+
+        return insert(LessonOccurrenceModel).from_select(
+            [
+                LessonOccurrenceModel.lesson_id,
+                LessonOccurrenceModel.group_id,
+                LessonOccurrenceModel.teacher_id,
+                LessonOccurrenceModel.audience_number,
+                LessonOccurrenceModel.building_number,
+                LessonOccurrenceModel.date,
+                LessonOccurrenceModel.created_at,
+            ],
+            union_all(weekly_occurrences, dated_occurrences),
+        )
+
+    async def get_by_group_id_extended(
+        self,
+        group_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> list[LessonOccurrenceDTO]:
+        stmt = (
+            select(LessonOccurrenceModel.date, LessonModel)
+            .join(LessonOccurrenceModel.lesson)
+            .where(
+                LessonOccurrenceModel.group_id == group_id,
+                LessonOccurrenceModel.date.between(date_from, date_to),
+            )
+            .order_by(
+                LessonOccurrenceModel.date,
+                LessonModel.number_of_day,
+                LessonModel.start_time,
+            )
+            .options(
+                joinedload(LessonModel.discipline),
+                joinedload(LessonModel.department),
+                joinedload(LessonModel.teacher),
+            )
+        )
+        result = await self._session.execute(stmt)
+
+        lessons = dict()
+        occurrences = list()
+        for date, lesson_record in result.all():
+            if lesson_record.id not in lessons:
+                lessons[lesson_record.id] = LessonGateway._db_to_extended_dto(
+                    lesson_record,
+                )
+            occurrences.append(
+                LessonOccurrenceDTO(date=date, lesson=lessons[lesson_record.id]),
+            )
+
+        return occurrences
+
+    async def get_by_teacher_id_extended(
+        self,
+        teacher_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> list[TeacherLessonOccurrenceDTO]:
+        stmt = (
+            select(LessonOccurrenceModel.date, LessonModel)
+            .join(LessonOccurrenceModel.lesson)
+            .where(
+                LessonOccurrenceModel.teacher_id == teacher_id,
+                LessonOccurrenceModel.date.between(date_from, date_to),
+            )
+            .order_by(
+                LessonOccurrenceModel.date,
+                LessonModel.number_of_day,
+                LessonModel.start_time,
+            )
+            .options(
+                joinedload(LessonModel.discipline),
+                joinedload(LessonModel.department),
+                joinedload(LessonModel.group),
+            )
+        )
+        result = await self._session.execute(stmt)
+
+        # Одно занятие у нескольких групп объединяется в рамках каждой даты
+        occurrences = list()
+        for date, rows in groupby(result.all(), key=lambda row: row[0]):
+            lessons = LessonGateway.db_to_teacher_extended_dto(
+                lesson_record for _, lesson_record in rows
+            )
+            occurrences.extend(
+                TeacherLessonOccurrenceDTO(date=date, lesson=lesson)
+                for lesson in lessons
+            )
+
+        return occurrences
+
+    async def regenerate_for_group(
+        self,
+        group_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        await self._session.execute(
+            delete(LessonOccurrenceModel).where(
+                LessonOccurrenceModel.group_id == group_id,
+            ),
+        )
+        await self._session.execute(
+            self.insert_occurrences_stmt(
+                date_from,
+                date_to,
+                LessonModel.group_id == group_id,
+            ),
+        )
+
+    async def regenerate_for_lesson(
+        self,
+        lesson_id: str,
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        await self._session.execute(
+            delete(LessonOccurrenceModel).where(
+                LessonOccurrenceModel.lesson_id == lesson_id,
+            ),
+        )
+        await self._session.execute(
+            self.insert_occurrences_stmt(
+                date_from,
+                date_to,
+                LessonModel.id == lesson_id,
+            ),
+        )
+
+    async def regenerate_for_lessons(
+        self,
+        lesson_ids: list[str],
+        date_from: dt.date,
+        date_to: dt.date,
+    ) -> None:
+        if not lesson_ids:
+            return
+
+        lesson_ids_array = literal(
+            [UUID(str(lesson_id)) for lesson_id in lesson_ids],
+            ARRAY(Uuid),
+        )
+        await self._session.execute(
+            delete(LessonOccurrenceModel).where(
+                LessonOccurrenceModel.lesson_id == any_(lesson_ids_array),
+            ),
+        )
+        await self._session.execute(
+            self.insert_occurrences_stmt(
+                date_from,
+                date_to,
+                LessonModel.id == any_(lesson_ids_array),
+            ),
+        )
@@ -3,6 +3,7 @@ import dataclasses
 from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pocket_kai.application.dto.refresh_token import RefreshTokenUsageDTO
 from pocket_kai.application.interfaces.entities.refresh_token import (
     RefreshTokenReader,
     RefreshTokenSaver,
@@ -61,3 +62,13 @@ class RefreshTokenGateway(RefreshTokenReader, RefreshTokenSaver, RefreshTokenUpd
             .where(RefreshTokenModel.id == refresh_token.id)
             .values(**update_dict),
         )
+
+    async def update_usages(self, usages: list[RefreshTokenUsageDTO]) -> None:
+        if not usages:
+            return
+
+        # ORM bulk UPDATE по первичному ключу: один executemany на весь пакет
+        await self._session.execute(
+            update(RefreshTokenModel),
+            [dataclasses.asdict(usage) for usage in usages],
+        )
@@ -1,6 +1,8 @@
 import dataclasses
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import String, all_, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,37 @@ from pocket_kai.domain.exceptions.student import StudentAlreadyExistsError
 from pocket_kai.infrastructure.database.models.kai import StudentModel
 
 
+# Поля из личного кабинета КАИ. Позиция в группе, староста и пользователь
+# заполняются другими процессами и при входе не меняются
+_STUDENT_UPSERT_COLUMNS = (
+    'kai_id',
+    'login',
+    'password',
+    'full_name',
+    'phone',
+    'sex',
+    'birthday',
+    'zach_number',
+    'competition_type',
+    'contract_number',
+    'edu_level',
+    'edu_cycle',
+    'edu_qualification',
+    'program_form',
+    'status',
+    'group_id',
+)
+
+# Поля из списка группы в личном кабинете старосты
+_GROUP_MEMBER_UPSERT_COLUMNS = (
+    'full_name',
+    'phone',
+    'position',
+    'is_leader',
+    'group_id',
+)
+
+
 class StudentGateway(StudentReader, StudentSaver, StudentUpdater):
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -80,6 +113,56 @@ class StudentGateway(StudentReader, StudentSaver, StudentUpdater):
         except IntegrityError:
             raise StudentAlreadyExistsError
 
+    async def upsert_by_email(self, student: StudentEntity) -> StudentEntity:
+        insert_stmt = pg_insert(StudentModel).values(**dataclasses.asdict(student))
+        student_record = await self._session.scalar(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[StudentModel.email],
+                set_={
+                    column: insert_stmt.excluded[column]
+                    for column in _STUDENT_UPSERT_COLUMNS
+                },
+            )
+            .returning(StudentModel)
+            .execution_options(populate_existing=True),
+        )
+
+        return self._db_to_entity(student_record)
+
+    async def upsert_group_members(
+        self,
+        students: list[StudentEntity],
+    ) -> list[StudentEntity]:
+        if not students:
+            return []
+
+        insert_stmt = pg_insert(StudentModel).values(
+            [dataclasses.asdict(student) for student in students],
+        )
+        student_records = await self._session.scalars(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[StudentModel.email],
+                set_={
+                    column: insert_stmt.excluded[column]
+                    for column in _GROUP_MEMBER_UPSERT_COLUMNS
+                },
+            )
+            .returning(StudentModel)
+            .execution_options(populate_existing=True),
+        )
+
+        return [self._db_to_entity(record) for record in student_records.all()]
+
+    async def unlink_from_group(self, group_id: str, keep_emails: list[str]) -> None:
+        await self._session.execute(
+            update(StudentModel)
+            .where(
+                StudentModel.group_id == group_id,
+                StudentModel.email != all_(literal(keep_emails, ARRAY(String))),
+            )
+            .values(group_id=None, position=None, is_leader=False),
+        )
+
     async def update(self, student: StudentEntity) -> None:
         update_dict = dataclasses.asdict(student)
         update_dict.pop('id')
@@ -1,3 +1,4 @@
+from pocket_kai.application.dto.task import TaskPageDTO
 from pocket_kai.application.interfaces.entities.task import TaskReader
 from pocket_kai.application.interfaces.kai_parser_api import KaiParserApiProtocol
 from pocket_kai.infrastructure.kai_parser_api.schemas import TaskStatus, TaskType
@@ -15,12 +16,16 @@ class TaskGateway(TaskReader):
         group_name: str | None,
         task_type: TaskType | None,
         task_status: TaskStatus | None,
-    ):
-        return await self._kai_parser_api.get_tasks(
+        after: str | None,
+    ) -> TaskPageDTO:
+        tasks, next_cursor = await self._kai_parser_api.get_tasks(
             limit=limit,
             offset=offset,
             login=login,
             group_name=group_name,
             type=task_type,
             status=task_status,
+            after=after,
         )
+
+        return TaskPageDTO(tasks=tasks, next_cursor=next_cursor)
@@ -1,7 +1,6 @@
-from sqlalchemy import func, insert, or_, select, text
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased
 
 from pocket_kai.application.interfaces.entities.teacher import (
     TeacherReader,
@@ -10,12 +9,20 @@ from pocket_kai.application.interfaces.entities.teacher import (
 from pocket_kai.domain.entitites.teacher import TeacherEntity
 from pocket_kai.domain.exceptions.teacher import TeacherAlreadyExistsError
 from pocket_kai.infrastructure.database.models.kai import TeacherModel
+from pocket_kai.infrastructure.gateways.common import get_or_create_many
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
 
 
 class TeacherGateway(TeacherReader, TeacherSaver):
-    def __init__(self, session: AsyncSession, search_similarity_threshold: float):
+    def __init__(
+        self,
+        session: AsyncSession,
+        search_similarity_threshold: float,
+        search_index: TeacherSearchIndex,
+    ):
         self._session = session
         self._search_similarity_threshold = search_similarity_threshold
+        self._search_index = search_index
 
     @staticmethod
     def _db_to_entity(teacher_record: TeacherModel | None) -> TeacherEntity | None:
@@ -36,55 +43,25 @@ class TeacherGateway(TeacherReader, TeacherSaver):
 
         return self._db_to_entity(teacher_record)
 
-    async def suggest_by_name(self, name: str, limit: int) -> list[TeacherEntity]:
-        name = name.replace('ё', 'е').lower()
-
-        name_parts_subq = select(
-            TeacherModel.id,
-            func.unnest(func.string_to_array(func.lower(TeacherModel.name), ' ')).label(
-                'name_part',
-            ),
-        ).cte('name_parts')
-        search_query_subq = select(
-            func.unnest(func.string_to_array(name.lower(), ' ')).label('query_part'),
-        ).cte('search_query')
-        similarities_subq = (
-            select(
-                TeacherModel,
-                func.avg(
-                    func.similarity(
-                        search_query_subq.c.query_part,
-                        name_parts_subq.c.name_part,
-                    ),
-                ).label('avg_similarity'),
+    async def _get_search_index(self) -> TeacherSearchIndex:
+        # Индекс загружается при старте приложения, здесь - только если
+        # при старте его не удалось загрузить
+        if not self._search_index.is_loaded():
+            records = await self._session.scalars(select(TeacherModel))
+            self._search_index.load(
+                self._db_to_entity(teacher_record) for teacher_record in records
             )
-            .join(name_parts_subq, TeacherModel.id == name_parts_subq.c.id)
-            .join(search_query_subq, text('True'))
-            .group_by(TeacherModel.id, TeacherModel.name)
-            .cte('similarities')
-        )
 
-        similarities_alias = aliased(TeacherModel, similarities_subq)
+        return self._search_index
 
-        stmt = (
-            select(similarities_alias)
-            .where(
-                or_(
-                    similarities_subq.c.avg_similarity
-                    >= self._search_similarity_threshold,
-                    similarities_subq.c.name.ilike(f'%{name}%'),
-                ),
-            )
-            .order_by(
-                similarities_subq.c.avg_similarity.desc(),
-                similarities_subq.c.name,
-            )
-            .limit(limit)
+    async def suggest_by_name(self, name: str, limit: int) -> list[TeacherEntity]:
+        search_index = await self._get_search_index()
+        return search_index.search(
+            name=name,
+            limit=limit,
+            similarity_threshold=self._search_similarity_threshold,
         )
 
-        records = await self._session.scalars(stmt)
-        return [self._db_to_entity(teacher_record) for teacher_record in records]
-
     async def get_by_id(self, id: str) -> TeacherEntity | None:
         teacher_record = await self._session.scalar(
             select(TeacherModel).where(TeacherModel.id == id),
@@ -104,3 +81,16 @@ class TeacherGateway(TeacherReader, TeacherSaver):
             )
         except IntegrityError:
             raise TeacherAlreadyExistsError
+
+    async def get_or_create_many(
+        self,
+        teachers: list[TeacherEntity],
+    ) -> list[TeacherEntity]:
+        teacher_records = await get_or_create_many(
+            self._session,
+            TeacherModel,
+            TeacherModel.login,
+            teachers,
+        )
+
+        return [self._db_to_entity(record) for record in teacher_records]
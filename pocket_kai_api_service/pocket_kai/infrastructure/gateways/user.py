@@ -1,12 +1,17 @@
-from sqlalchemy import insert
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pocket_kai.application.interfaces.entities.user import UserReader, UserSaver
+from pocket_kai.application.interfaces.entities.user import (
+    UserReader,
+    UserSaver,
+    UserUpdater,
+)
 from pocket_kai.domain.entitites.user import UserEntity
+from pocket_kai.domain.exceptions.user import UserNotFoundError
 from pocket_kai.infrastructure.database.models import UserModel
 
 
-class UserGateway(UserReader, UserSaver):
+class UserGateway(UserReader, UserSaver, UserUpdater):
     def __init__(self, session: AsyncSession):
         self._session = session
 
@@ -38,3 +43,16 @@ class UserGateway(UserReader, UserSaver):
                 is_blocked=user.is_blocked,
             ),
         )
+
+    async def set_is_blocked(self, id: str, is_blocked: bool) -> UserEntity:
+        user_record = await self._session.scalar(
+            update(UserModel)
+            .where(UserModel.id == id)
+            .values(is_blocked=is_blocked)
+            .returning(UserModel),
+        )
+
+        if user_record is None:
+            raise UserNotFoundError
+
+        return self._db_to_entity(user_record)
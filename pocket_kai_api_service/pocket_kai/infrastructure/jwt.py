@@ -8,6 +8,7 @@ from pocket_kai.application.interfaces.common import DateTimeManager
 from pocket_kai.application.interfaces.jwt import (
     AccessJWTPayload,
     JWTManagerProtocol,
+    JWTPayload,
     JWTTokenType,
     RefreshJWTPayload,
 )
@@ -38,7 +39,7 @@ class PyJWTManager(JWTManagerProtocol):
         self._datetime_manager = datetime_manager
 
     @staticmethod
-    def _validate_payload(to_encode: dict) -> None:
+    def _validate_payload(to_encode: dict) -> JWTPayload:
         if to_encode.get('type') == JWTTokenType.REFRESH_TOKEN:
             payload_entity = RefreshJWTPayload
         elif to_encode.get('type') == JWTTokenType.ACCESS_TOKEN:
@@ -49,7 +50,7 @@ class PyJWTManager(JWTManagerProtocol):
             )
 
         try:
-            payload_entity(**to_encode)
+            return payload_entity(**to_encode)
         except ValidationError as e:
             raise InvalidTokenPayloadError(message=str(e))
 
@@ -58,7 +59,7 @@ class PyJWTManager(JWTManagerProtocol):
         payload: dict,
         expires_at: datetime,
         jti: str | None = None,
-    ) -> str:
+    ) -> tuple[str, JWTPayload]:
         to_encode = payload.copy()
 
         if jti is not None:
@@ -69,14 +70,16 @@ class PyJWTManager(JWTManagerProtocol):
             iat=time.time(),  # Так мы исключаем вероятность создать одинаковые токены
         )
 
-        self._validate_payload(to_encode)
+        validated_payload = self._validate_payload(to_encode)
 
-        return jwt.encode(
+        token = jwt.encode(
             payload=to_encode,
             key=self._PRIVATE_KEY,
             algorithm=self._ALGORITHM,
         )
 
+        return token, validated_payload
+
     def _decode_jwt(
         self,
         token: str | bytes,
@@ -126,17 +129,33 @@ class PyJWTManager(JWTManagerProtocol):
             minutes=self._ACCESS_TOKEN_EXPIRE_MINUTES,
         )
 
-        return self._encode_jwt(
+        token, _ = self._encode_jwt(
             payload=jwt_payload,
             expires_at=expires_at,
         )
 
+        return token
+
     def create_refresh_token(
         self,
         jti: str,
         user_id: str,
         expires_at: datetime | None = None,
     ) -> str:
+        token, _ = self.issue_refresh_token(
+            jti=jti,
+            user_id=user_id,
+            expires_at=expires_at,
+        )
+
+        return token
+
+    def issue_refresh_token(
+        self,
+        jti: str,
+        user_id: str,
+        expires_at: datetime | None = None,
+    ) -> tuple[str, RefreshJWTPayload]:
         jwt_payload = {
             'sub': user_id,
             'type': JWTTokenType.REFRESH_TOKEN,
@@ -147,7 +166,7 @@ class PyJWTManager(JWTManagerProtocol):
                 minutes=self._REFRESH_TOKEN_EXPIRE_MINUTES,
             )
 
-        return self._encode_jwt(
+        return self._encode_jwt(  # type: ignore[return-value]
             payload=jwt_payload,
             expires_at=expires_at,
             jti=jti,
@@ -61,7 +61,8 @@ class KaiParserApi(KaiParserApiProtocol):
         login: str | None,
         type: TaskType | None = None,
         status: TaskStatus | None = None,
-    ) -> list[TaskSchema]:
+        after: str | None = None,
+    ) -> tuple[list[TaskSchema], str | None]:
         params = {
             'limit': limit,
             'offset': offset,
@@ -74,6 +75,8 @@ class KaiParserApi(KaiParserApiProtocol):
             params['type'] = type.value
         if status is not None:
             params['status'] = status.value
+        if after is not None:
+            params['after'] = after
 
         async with self.session.get(
             url=self.base_url + '/task',
@@ -85,5 +88,6 @@ class KaiParserApi(KaiParserApiProtocol):
                 )
 
             result = await response.json()
+            next_cursor = response.headers.get('X-Next-Cursor')
 
-        return [TaskSchema.model_validate(task) for task in result]
+        return [TaskSchema.model_validate(task) for task in result], next_cursor
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+from sqlalchemy import func, select
+
+from pocket_kai.application.interfaces.cache import ReferenceCatalog
+from pocket_kai.domain.entitites.teacher import TeacherEntity
+from pocket_kai.infrastructure.database.database import ReplicaSessionMaker
+from pocket_kai.infrastructure.database.models.kai import (
+    DepartmentModel,
+    DisciplineModel,
+    InstituteModel,
+    ProfileModel,
+    SpecialityModel,
+    TeacherModel,
+)
+from pocket_kai.infrastructure.gateways.department import DepartmentGateway
+from pocket_kai.infrastructure.gateways.discipline import DisciplineGateway
+from pocket_kai.infrastructure.gateways.institute import InstituteGateway
+from pocket_kai.infrastructure.gateways.profile import ProfileGateway
+from pocket_kai.infrastructure.gateways.speciality import SpecialityGateway
+from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
+
+
+_REFERENCE_MODELS = (
+    (DepartmentModel, DepartmentGateway.db_to_entity),
+    (DisciplineModel, DisciplineGateway._db_to_entity),
+    (InstituteModel, InstituteGateway.db_to_entity),
+    (ProfileModel, ProfileGateway.db_to_entity),
+    (SpecialityModel, SpecialityGateway.db_to_entity),
+    (TeacherModel, TeacherGateway._db_to_entity),
+)
+
+
+def _get_version_stmt():
+    # Справочники только пополняются и удаляются целиком, строки в них
+    # не изменяются. Поэтому для версии хватает числа строк и времени
+    # последней вставки в каждой таблице, без чтения самих строк
+    columns = list()
+    for model, _ in _REFERENCE_MODELS:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.created_at)).scalar_subquery())
+
+    return select(func.concat_ws('|', *columns))
+
+
+class ReferenceCatalogRefresher:
+    """
+    Загружает справочники в каталог при старте приложения и раз в
+    `check_interval` секунд сверяет версию каталога с БД. Так изменения,
+    сделанные другими воркерами, доходят до каталога этого воркера.
+    Вместе с каталогом перестраивается индекс поиска преподавателей
+    """
+
+    def __init__(
+        self,
+        catalog: ReferenceCatalog,
+        teacher_search_index: TeacherSearchIndex,
+        session_maker: ReplicaSessionMaker,
+        check_interval: float,
+    ):
+        self._catalog = catalog
+        self._teacher_search_index = teacher_search_index
+        self._session_maker = session_maker
+        self._check_interval = check_interval
+
+        self._version_stmt = _get_version_stmt()
+        self._task: asyncio.Task | None = None
+
+    async def refresh(self) -> None:
+        async with self._session_maker() as session:
+            version = await session.scalar(self._version_stmt)
+            if version == self._catalog.get_version():
+                return
+
+            entities = list()
+            for model, db_to_entity in _REFERENCE_MODELS:
+                records = await session.scalars(select(model))
+                entities.extend(db_to_entity(record) for record in records)
+
+        self._catalog.load(entities, version)
+        self._teacher_search_index.load(
+            entity for entity in entities if isinstance(entity, TeacherEntity)
+        )
+        logging.info(f'Reference catalog loaded: {len(entities)} entities')
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._check_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logging.exception('Failed to refresh reference catalog')
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
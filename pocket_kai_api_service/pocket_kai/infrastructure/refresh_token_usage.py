@@ -0,0 +1,111 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from pocket_kai.application.dto.refresh_token import RefreshTokenUsageDTO
+from pocket_kai.application.interfaces.entities.refresh_token import (
+    RefreshTokenUsageWriter,
+)
+from pocket_kai.infrastructure.gateways.refresh_token import RefreshTokenGateway
+
+
+class RefreshTokenUsageBuffer(RefreshTokenUsageWriter):
+    """
+    Буфер записей об использовании Refresh-токенов в памяти воркера.
+
+    Обновления копятся по id токена (остаётся последнее) и раз в
+    `flush_interval` секунд записываются в БД одним пакетом. При остановке
+    приложения буфер сбрасывается.
+
+    При ошибке записи пакет возвращается в буфер. Строки, которые не удалось
+    записать `max_attempts` раз подряд, записываются по одной, чтобы ошибка
+    в одной строке не мешала остальным, а не записанные и так - отбрасываются
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        flush_interval: float,
+        max_attempts: int = 3,
+    ):
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._max_attempts = max_attempts
+
+        self._pending: dict[str, RefreshTokenUsageDTO] = dict()
+        self._attempts: dict[str, int] = dict()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add_usage(self, usage: RefreshTokenUsageDTO) -> None:
+        self._pending[str(usage.id)] = usage
+
+    async def _write(self, usages: list[RefreshTokenUsageDTO]) -> None:
+        async with self._session_maker() as session:
+            await RefreshTokenGateway(session).update_usages(usages)
+            await session.commit()
+
+    async def _write_one_or_drop(
+        self,
+        token_id: str,
+        usage: RefreshTokenUsageDTO,
+    ) -> None:
+        try:
+            await self._write([usage])
+        except Exception:
+            logging.exception(f'Dropped refresh token usage {token_id}')
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, dict()
+        try:
+            await self._write(list(batch.values()))
+        except Exception:
+            logging.exception(f'Failed to flush {len(batch)} refresh token usages')
+        else:
+            for token_id in batch:
+                self._attempts.pop(token_id, None)
+            return
+
+        for token_id in list(batch):
+            attempts = self._attempts.get(token_id, 0) + 1
+            if attempts < self._max_attempts:
+                self._attempts[token_id] = attempts
+                continue
+
+            usage = batch.pop(token_id)
+            self._attempts.pop(token_id, None)
+            # Более свежую запись, добавленную во время сброса, запишет следующий сброс
+            if token_id not in self._pending:
+                await self._write_one_or_drop(token_id, usage)
+
+        # Более свежие записи, добавленные во время сброса, не перезаписываются
+        self._pending = batch | self._pending
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logging.exception('Failed to flush refresh token usages')
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+
+from pocket_kai.application.interfaces.cache import RoomOccupancyCache
+from pocket_kai.domain.room_occupancy import RoomOccupancyIndex
+from pocket_kai.infrastructure.database.database import ReplicaSessionMaker
+from pocket_kai.infrastructure.gateways.lesson import LessonGateway
+
+
+class RoomOccupancyRefresher:
+    """
+    Строит индекс занятости аудиторий при старте приложения и перестраивает
+    его раз в `refresh_interval` секунд. Так изменения занятий, сделанные
+    другими воркерами, доходят до индекса этого воркера, а запросы
+    не ждут загрузки всей таблицы занятий
+    """
+
+    def __init__(
+        self,
+        cache: RoomOccupancyCache,
+        session_maker: ReplicaSessionMaker,
+        refresh_interval: float,
+    ):
+        self._cache = cache
+        self._session_maker = session_maker
+        self._refresh_interval = refresh_interval
+
+        self._task: asyncio.Task | None = None
+
+    async def refresh(self) -> None:
+        async with self._session_maker() as session:
+            lessons = await LessonGateway(session).get_all_with_room()
+
+        self._cache.set_index(RoomOccupancyIndex(lessons))
+        logging.info(f'Room occupancy index loaded: {len(lessons)} lessons')
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logging.exception('Failed to refresh room occupancy index')
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,167 @@
+import re
+
+from collections import defaultdict
+from typing import Iterable
+
+from pocket_kai.domain.entitites.teacher import TeacherEntity
+
+
+# Как и в pg_trgm, словом считается последовательность букв и цифр
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def normalize_name(name: str) -> str:
+    return name.replace('ё', 'е').replace('Ё', 'Е').lower()
+
+
+def get_trigrams(text: str) -> frozenset[str]:
+    """
+    Триграммы строки по правилам pg_trgm: каждое слово дополняется
+    двумя пробелами в начале и одним в конце
+    """
+    trigrams = set()
+    for word in _WORD_RE.findall(text):
+        padded_word = f'  {word} '
+        trigrams.update(
+            padded_word[i : i + 3] for i in range(len(padded_word) - 2)
+        )
+
+    return frozenset(trigrams)
+
+
+def get_substring_trigrams(text: str) -> frozenset[str]:
+    """
+    Триграммы без дополнения пробелами: они есть у любой строки,
+    в которую `text` входит как подстрока
+    """
+    return frozenset(
+        word[i : i + 3]
+        for word in _WORD_RE.findall(text)
+        for i in range(len(word) - 2)
+    )
+
+
+def similarity(first: frozenset[str], second: frozenset[str]) -> float:
+    """
+    То же, что `similarity()` из pg_trgm
+    """
+    if not first or not second:
+        return 0.0
+
+    return len(first & second) / len(first | second)
+
+
+class TeacherSearchIndex:
+    """
+    Триграммный индекс по ФИО преподавателей в памяти воркера.
+
+    Ранжирование повторяет прежний SQL запрос: ФИО и запрос разбиваются
+    по пробелам, похожесть преподавателя - среднее `similarity` по всем парам
+    (часть запроса, часть ФИО). Преподаватель подходит, если похожесть
+    не меньше порога или запрос входит в ФИО как подстрока.
+
+    Индекс загружается вместе с каталогом справочников
+    в ReferenceCatalogRefresher и в запросах не изменяется
+    """
+
+    def __init__(self):
+        self._is_loaded = False
+
+        self._teachers: list[TeacherEntity] = []
+        self._normalized_names: list[str] = []
+        self._name_parts: list[list[frozenset[str]]] = []
+        self._postings: dict[str, set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._teachers)
+
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    def load(self, teachers: Iterable[TeacherEntity]) -> None:
+        self._teachers = []
+        self._normalized_names = []
+        self._name_parts = []
+        self._postings = defaultdict(set)
+
+        for teacher in teachers:
+            self._add(teacher)
+
+        self._is_loaded = True
+
+    def _add(self, teacher: TeacherEntity) -> None:
+        position = len(self._teachers)
+        normalized_name = normalize_name(teacher.name)
+        name_parts = [get_trigrams(part) for part in normalized_name.split(' ')]
+
+        self._teachers.append(teacher)
+        self._normalized_names.append(normalized_name)
+        self._name_parts.append(name_parts)
+        for part_trigrams in name_parts:
+            for trigram in part_trigrams:
+                self._postings[trigram].add(position)
+
+    def _get_score(
+        self,
+        position: int,
+        query_parts: list[frozenset[str]],
+    ) -> float:
+        name_parts = self._name_parts[position]
+        total = sum(
+            similarity(query_part, name_part)
+            for query_part in query_parts
+            for name_part in name_parts
+        )
+
+        return total / (len(query_parts) * len(name_parts))
+
+    def _get_substring_matches(self, query: str) -> set[int]:
+        trigrams = get_substring_trigrams(query)
+        if not trigrams:
+            # В запросе нет слов из трёх букв, отобрать ФИО по триграммам нельзя
+            return {
+                position
+                for position, normalized_name in enumerate(self._normalized_names)
+                if query in normalized_name
+            }
+
+        postings = sorted(
+            (self._postings.get(trigram, set()) for trigram in trigrams),
+            key=len,
+        )
+        return {
+            position
+            for position in postings[0].intersection(*postings[1:])
+            if query in self._normalized_names[position]
+        }
+
+    def search(
+        self,
+        name: str,
+        limit: int,
+        similarity_threshold: float,
+    ) -> list[TeacherEntity]:
+        query = normalize_name(name)
+        query_parts = [get_trigrams(part) for part in query.split(' ')]
+
+        # Ненулевую похожесть имеют только преподаватели с общими триграммами
+        candidates = set()
+        for query_part in query_parts:
+            for trigram in query_part:
+                candidates.update(self._postings.get(trigram, ()))
+
+        substring_matches = self._get_substring_matches(query)
+
+        results = []
+        for position in candidates:
+            score = self._get_score(position, query_parts)
+            if score >= similarity_threshold or position in substring_matches:
+                results.append((score, position))
+
+        # Запрос может входить в ФИО как подстрока и без общих триграмм
+        for position in substring_matches - candidates:
+            results.append((0.0, position))
+
+        results.sort(key=lambda item: (-item[0], self._teachers[item[1]].name))
+
+        return [self._teachers[position] for _, position in results[:limit]]
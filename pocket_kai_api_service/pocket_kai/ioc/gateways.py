@@ -1,6 +1,7 @@
 from dishka import AnyOf, Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pocket_kai.application.interfaces.cache import ReferenceCatalog
 from pocket_kai.application.interfaces.entities.department import (
     DepartmentGatewayProtocol,
     DepartmentReader,
@@ -36,6 +37,11 @@ from pocket_kai.application.interfaces.entities.lesson import (
     LessonSaver,
     LessonUpdater,
 )
+from pocket_kai.application.interfaces.entities.lesson_occurrence import (
+    LessonOccurrenceGatewayProtocol,
+    LessonOccurrenceReader,
+    LessonOccurrenceUpdater,
+)
 from pocket_kai.application.interfaces.entities.profile import (
     ProfileGatewayProtocol,
     ProfileReader,
@@ -64,14 +70,22 @@ from pocket_kai.application.interfaces.entities.teacher import (
     TeacherReader,
     TeacherSaver,
 )
-from pocket_kai.application.interfaces.entities.user import UserReader, UserSaver
+from pocket_kai.application.interfaces.entities.user import (
+    UserReader,
+    UserSaver,
+    UserUpdater,
+)
 from pocket_kai.config import Settings
+from pocket_kai.infrastructure.database.database import ReplicaSession
 from pocket_kai.infrastructure.gateways.department import DepartmentGateway
 from pocket_kai.infrastructure.gateways.discipline import DisciplineGateway
 from pocket_kai.infrastructure.gateways.exam import ExamGateway
 from pocket_kai.infrastructure.gateways.group import GroupGateway
 from pocket_kai.infrastructure.gateways.institute import InstituteGateway
 from pocket_kai.infrastructure.gateways.lesson import LessonGateway
+from pocket_kai.infrastructure.gateways.lesson_occurrence import (
+    LessonOccurrenceGateway,
+)
 from pocket_kai.infrastructure.gateways.profile import ProfileGateway
 from pocket_kai.infrastructure.gateways.refresh_token import RefreshTokenGateway
 from pocket_kai.infrastructure.gateways.service_token import ServiceTokenGateway
@@ -80,6 +94,7 @@ from pocket_kai.infrastructure.gateways.student import StudentGateway
 from pocket_kai.infrastructure.gateways.task import TaskGateway
 from pocket_kai.infrastructure.gateways.teacher import TeacherGateway
 from pocket_kai.infrastructure.gateways.user import UserGateway
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
 
 
 class GatewaysProvider(Provider):
@@ -90,12 +105,74 @@ class GatewaysProvider(Provider):
         self,
         session: AsyncSession,
         config: Settings,
-    ) -> AnyOf[TeacherReader, TeacherSaver]:
+        search_index: TeacherSearchIndex,
+    ) -> TeacherSaver:
         return TeacherGateway(
             session=session,
             search_similarity_threshold=config.common.TEACHER_SEARCH_SIMILARITY,
+            search_index=search_index,
         )
 
+    @provide
+    def get_teacher_reader(
+        self,
+        session: ReplicaSession,
+        config: Settings,
+        search_index: TeacherSearchIndex,
+    ) -> TeacherReader:
+        return TeacherGateway(
+            session=session,
+            search_similarity_threshold=config.common.TEACHER_SEARCH_SIMILARITY,
+            search_index=search_index,
+        )
+
+    # Reader-ы данных расписания работают через ReplicaSession. Пользователи,
+    # студенты и токены читаются из основной БД: их читают сразу после записи
+    # в предыдущем запросе, и отставание реплики здесь заметно
+
+    @provide
+    def get_department_reader(self, session: ReplicaSession) -> DepartmentReader:
+        return DepartmentGateway(session)
+
+    @provide
+    def get_discipline_reader(self, session: ReplicaSession) -> DisciplineReader:
+        return DisciplineGateway(session)
+
+    @provide
+    def get_exam_reader(self, session: ReplicaSession) -> ExamReader:
+        return ExamGateway(session)
+
+    @provide
+    def get_group_reader(
+        self,
+        session: ReplicaSession,
+        reference_catalog: ReferenceCatalog,
+    ) -> GroupReader:
+        return GroupGateway(session, reference_catalog)
+
+    @provide
+    def get_institute_reader(self, session: ReplicaSession) -> InstituteReader:
+        return InstituteGateway(session)
+
+    @provide
+    def get_lesson_reader(self, session: ReplicaSession) -> LessonReader:
+        return LessonGateway(session)
+
+    @provide
+    def get_lesson_occurrence_reader(
+        self,
+        session: ReplicaSession,
+    ) -> LessonOccurrenceReader:
+        return LessonOccurrenceGateway(session)
+
+    @provide
+    def get_profile_reader(self, session: ReplicaSession) -> ProfileReader:
+        return ProfileGateway(session)
+
+    @provide
+    def get_speciality_reader(self, session: ReplicaSession) -> SpecialityReader:
+        return SpecialityGateway(session)
+
     service_token_gateway = provide(
         ServiceTokenGateway,
         provides=ServiceTokenReader,
@@ -103,28 +180,27 @@ class GatewaysProvider(Provider):
 
     department_gateway = provide(
         DepartmentGateway,
-        provides=AnyOf[DepartmentReader, DepartmentSaver, DepartmentGatewayProtocol],
+        provides=AnyOf[DepartmentSaver, DepartmentGatewayProtocol],
     )
 
     discipline_gateway = provide(
         DisciplineGateway,
-        provides=AnyOf[DisciplineReader, DisciplineSaver, DisciplineGatewayProtocol],
+        provides=AnyOf[DisciplineSaver, DisciplineGatewayProtocol],
     )
 
     group_gateway = provide(
         GroupGateway,
-        provides=AnyOf[GroupReader, GroupSaver, GroupUpdater, GroupGatewayProtocol],
+        provides=AnyOf[GroupSaver, GroupUpdater, GroupGatewayProtocol],
     )
 
     institute_gateway = provide(
         InstituteGateway,
-        provides=AnyOf[InstituteReader, InstituteSaver, InstituteGatewayProtocol],
+        provides=AnyOf[InstituteSaver, InstituteGatewayProtocol],
     )
 
     lesson_gateway = provide(
         LessonGateway,
         provides=AnyOf[
-            LessonReader,
             LessonSaver,
             LessonUpdater,
             LessonDeleter,
@@ -132,9 +208,14 @@ class GatewaysProvider(Provider):
         ],
     )
 
+    lesson_occurrence_gateway = provide(
+        LessonOccurrenceGateway,
+        provides=AnyOf[LessonOccurrenceUpdater, LessonOccurrenceGatewayProtocol],
+    )
+
     profile_gateway = provide(
         ProfileGateway,
-        provides=AnyOf[ProfileReader, ProfileSaver, ProfileGatewayProtocol],
+        provides=AnyOf[ProfileSaver, ProfileGatewayProtocol],
     )
 
     refresh_token_gateway = provide(
@@ -149,7 +230,7 @@ class GatewaysProvider(Provider):
 
     speciality_gateway = provide(
         SpecialityGateway,
-        provides=AnyOf[SpecialityReader, SpecialitySaver, SpecialityGatewayProtocol],
+        provides=AnyOf[SpecialitySaver, SpecialityGatewayProtocol],
     )
 
     student_gateway = provide(
@@ -164,7 +245,7 @@ class GatewaysProvider(Provider):
 
     user_gateway = provide(
         UserGateway,
-        provides=AnyOf[UserReader, UserSaver],
+        provides=AnyOf[UserReader, UserSaver, UserUpdater],
     )
 
     task_gateway = provide(
@@ -176,7 +257,6 @@ class GatewaysProvider(Provider):
         ExamGateway,
         provides=AnyOf[
             ExamSaver,
-            ExamReader,
             ExamUpdater,
             ExamDeleter,
             ExamGatewayProtocol,
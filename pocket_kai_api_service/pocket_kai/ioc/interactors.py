@@ -1,5 +1,11 @@
 from dishka import Provider, Scope, provide, provide_all
 
+from pocket_kai.application.interactors.cache import GetCacheStatsInteractor
+from pocket_kai.application.interactors.calendar import (
+    GetGroupCalendarInteractor,
+    GetTeacherCalendarInteractor,
+    GetTeacherCalendarVersionInteractor,
+)
 from pocket_kai.application.interactors.department import (
     CreateDepartmentInteractor,
     GetDepartmentByKaiIdInteractor,
@@ -19,6 +25,8 @@ from pocket_kai.application.interactors.group import (
     GetAllGroupsInteractor,
     GetGroupByIdInteractor,
     GetGroupByNameInteractor,
+    GetShortGroupByIdInteractor,
+    GetShortGroupByNameInteractor,
     GroupExtendedDTOConverter,
     PatchGroupByIdInteractor,
     PatchGroupByNameInteractor,
@@ -26,21 +34,39 @@ from pocket_kai.application.interactors.group import (
 )
 from pocket_kai.application.interactors.kai_login import KaiLoginInteractor
 from pocket_kai.application.interactors.lesson import (
+    ApplyLessonChangesInteractor,
     CreateLessonInteractor,
     DeleteLessonInteractor,
+    ExportGroupsWithLessonsInteractor,
     ExtendedLessonConverter,
     GetLessonsByGroupIdInteractor,
     GetLessonsByTeacherIdInteractor,
     UpdateLessonInteractor,
 )
+from pocket_kai.application.interactors.room import (
+    GetDatesScheduleByRoomInteractor,
+    GetFreeRoomsInteractor,
+    GetLessonsByRoomInteractor,
+)
 from pocket_kai.application.interactors.refresh_token import RefreshTokenPairInteractor
 from pocket_kai.application.interactors.schedule import (
+    GetDatesScheduleBatchInteractor,
     GetDatesScheduleByGroupIdInteractor,
     GetDatesScheduleByGroupNameInteractor,
+    GetDatesScheduleByTeacherIdInteractor,
+    GetWeekScheduleBatchInteractor,
     GetWeekScheduleByGroupIdInteractor,
     GetWeekScheduleByGroupNameInteractor,
 )
-from pocket_kai.application.interactors.service_token import CheckServiceTokenInteractor
+from pocket_kai.application.interactors.schedule_sync import (
+    ScheduleReferencesResolver,
+    SyncGroupExamsInteractor,
+    SyncGroupScheduleInteractor,
+)
+from pocket_kai.application.interactors.service_token import (
+    CheckServiceTokenInteractor,
+    InvalidateServiceTokenCacheInteractor,
+)
 from pocket_kai.application.interactors.student import (
     AddGroupMembersInteractor,
     GetGroupMembersByUserIdInteractor,
@@ -52,7 +78,10 @@ from pocket_kai.application.interactors.teacher import (
     GetTeacherByLoginInteractor,
     SuggestTeachersByNameInteractor,
 )
-from pocket_kai.application.interactors.user import GetUserByAccessTokenInteractor
+from pocket_kai.application.interactors.user import (
+    GetUserByAccessTokenInteractor,
+    SetUserBlockedInteractor,
+)
 
 
 class InteractorsProvider(Provider):
@@ -66,8 +95,13 @@ class InteractorsProvider(Provider):
         ExtendedLessonConverter,
     )
 
+    schedule_references_resolver = provide(
+        ScheduleReferencesResolver,
+    )
+
     interactors = provide_all(
         CheckServiceTokenInteractor,
+        InvalidateServiceTokenCacheInteractor,
         GetTeacherByLoginInteractor,
         CreateTeacherInteractor,
         GetDepartmentByKaiIdInteractor,
@@ -78,22 +112,32 @@ class InteractorsProvider(Provider):
         GetAllGroupsInteractor,
         GetGroupByNameInteractor,
         GetGroupByIdInteractor,
+        GetShortGroupByNameInteractor,
+        GetShortGroupByIdInteractor,
         CreateGroupInteractor,
         PatchGroupByNameInteractor,
         PatchGroupByIdInteractor,
         KaiLoginInteractor,
         GetLessonsByGroupIdInteractor,
+        ExportGroupsWithLessonsInteractor,
         CreateLessonInteractor,
+        ApplyLessonChangesInteractor,
         DeleteLessonInteractor,
         UpdateLessonInteractor,
+        SyncGroupScheduleInteractor,
+        SyncGroupExamsInteractor,
         RefreshTokenPairInteractor,
         GetWeekScheduleByGroupNameInteractor,
         GetWeekScheduleByGroupIdInteractor,
         GetDatesScheduleByGroupNameInteractor,
         GetDatesScheduleByGroupIdInteractor,
+        GetWeekScheduleBatchInteractor,
+        GetDatesScheduleBatchInteractor,
+        GetDatesScheduleByTeacherIdInteractor,
         AddGroupMembersInteractor,
         GetStudentByUserIdInteractor,
         GetUserByAccessTokenInteractor,
+        SetUserBlockedInteractor,
         GetTasksInteractor,
         CreateExamInteractor,
         GetExamsByGroupIdInteractor,
@@ -102,5 +146,12 @@ class InteractorsProvider(Provider):
         GetGroupMembersByUserIdInteractor,
         SuggestTeachersByNameInteractor,
         GetLessonsByTeacherIdInteractor,
+        GetCacheStatsInteractor,
+        GetGroupCalendarInteractor,
+        GetTeacherCalendarInteractor,
+        GetTeacherCalendarVersionInteractor,
+        GetFreeRoomsInteractor,
+        GetLessonsByRoomInteractor,
+        GetDatesScheduleByRoomInteractor,
         scope=Scope.REQUEST,
     )
@@ -4,23 +4,56 @@ from typing import AsyncIterable
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from uuid import uuid4
 
-from dishka import AnyOf, Provider, Scope, from_context, provide
+from dishka import AnyOf, AsyncContainer, Provider, Scope, from_context, provide
+from fastapi import Request
 
+from pocket_kai.application.interfaces.cache import (
+    AccessTokenCache,
+    ReferenceCatalog,
+    ResponseCache,
+    RoomOccupancyCache,
+    ScheduleCache,
+    ServiceTokenCache,
+)
 from pocket_kai.application.interfaces.common import DateTimeManager, UUIDGenerator
+from pocket_kai.application.interfaces.entities.refresh_token import (
+    RefreshTokenUsageWriter,
+)
 from pocket_kai.application.interfaces.jwt import JWTManagerProtocol
 from pocket_kai.application.interfaces.kai_parser_api import KaiParserApiProtocol
 from pocket_kai.application.interfaces.unit_of_work import UnitOfWork
 from pocket_kai.config import Settings
-from pocket_kai.infrastructure.database.database import new_session_maker
+from pocket_kai.infrastructure.cache import (
+    InMemoryAccessTokenCache,
+    InMemoryReferenceCatalog,
+    InMemoryResponseCache,
+    InMemoryRoomOccupancyCache,
+    InMemoryScheduleCache,
+    InMemoryServiceTokenCache,
+)
+from pocket_kai.infrastructure.database.database import (
+    ReplicaSession,
+    ReplicaSessionMaker,
+    new_session_maker,
+)
 from pocket_kai.infrastructure.jwt import PyJWTManager
 from pocket_kai.infrastructure.kai_parser_api.api import KaiParserApi
+from pocket_kai.infrastructure.reference_catalog import ReferenceCatalogRefresher
+from pocket_kai.infrastructure.refresh_token_usage import RefreshTokenUsageBuffer
+from pocket_kai.infrastructure.room_occupancy import RoomOccupancyRefresher
+from pocket_kai.infrastructure.teacher_search import TeacherSearchIndex
 from pocket_kai.ioc.gateways import GatewaysProvider
 from pocket_kai.ioc.interactors import InteractorsProvider
 from pocket_kai.infrastructure.datetime_manager import UTCDateTimeManager
 
 
+# В запросах с этими методами интеракторы только читают
+_READ_ONLY_METHODS = frozenset({'GET', 'HEAD'})
+
+
 class AppProvider(Provider):
     settings = from_context(provides=Settings, scope=Scope.APP)
+    request = from_context(provides=Request, scope=Scope.REQUEST)
 
     @provide(scope=Scope.APP)
     def get_uuid_generator(self) -> UUIDGenerator:
@@ -45,6 +78,46 @@ class AppProvider(Provider):
             datetime_manager=datetime_manager,
         )
 
+    @provide(scope=Scope.APP)
+    def get_schedule_cache(self, settings: Settings) -> ScheduleCache:
+        return InMemoryScheduleCache(
+            max_size=settings.cache.SCHEDULE_CACHE_MAX_SIZE,
+            ttl=settings.cache.SCHEDULE_CACHE_TTL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_response_cache(self, settings: Settings) -> ResponseCache:
+        return InMemoryResponseCache(
+            max_size=settings.cache.RESPONSE_CACHE_MAX_SIZE,
+            ttl=settings.cache.RESPONSE_CACHE_TTL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_room_occupancy_cache(self) -> RoomOccupancyCache:
+        return InMemoryRoomOccupancyCache()
+
+    @provide(scope=Scope.APP)
+    def get_service_token_cache(self, settings: Settings) -> ServiceTokenCache:
+        return InMemoryServiceTokenCache(
+            max_size=settings.cache.SERVICE_TOKEN_CACHE_MAX_SIZE,
+            ttl=settings.cache.SERVICE_TOKEN_CACHE_TTL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_access_token_cache(self, settings: Settings) -> AccessTokenCache:
+        return InMemoryAccessTokenCache(
+            max_size=settings.cache.ACCESS_TOKEN_CACHE_MAX_SIZE,
+            ttl=settings.cache.ACCESS_TOKEN_CACHE_TTL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_teacher_search_index(self) -> TeacherSearchIndex:
+        return TeacherSearchIndex()
+
+    @provide(scope=Scope.APP)
+    def get_reference_catalog(self) -> ReferenceCatalog:
+        return InMemoryReferenceCatalog()
+
     @provide(scope=Scope.REQUEST)
     async def get_kai_parser_api(
         self,
@@ -63,14 +136,94 @@ class AppProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return new_session_maker(postgres_settings=settings.postgres)
 
+    @provide(scope=Scope.APP)
+    def get_replica_async_sessionmaker(
+        self,
+        settings: Settings,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ) -> ReplicaSessionMaker:
+        replica_session_maker = None
+        if settings.postgres.replica_database_uri is not None:
+            replica_session_maker = new_session_maker(
+                postgres_settings=settings.postgres,
+                replica=True,
+            )
+
+        return ReplicaSessionMaker(
+            primary=async_session_maker,
+            replica=replica_session_maker,
+            max_lag=settings.postgres.POSTGRES_REPLICA_MAX_LAG_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_refresh_token_usage_buffer(
+        self,
+        settings: Settings,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ) -> AnyOf[RefreshTokenUsageBuffer, RefreshTokenUsageWriter]:
+        return RefreshTokenUsageBuffer(
+            session_maker=async_session_maker,
+            flush_interval=settings.common.REFRESH_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_reference_catalog_refresher(
+        self,
+        settings: Settings,
+        reference_catalog: ReferenceCatalog,
+        teacher_search_index: TeacherSearchIndex,
+        replica_session_maker: ReplicaSessionMaker,
+    ) -> ReferenceCatalogRefresher:
+        return ReferenceCatalogRefresher(
+            catalog=reference_catalog,
+            teacher_search_index=teacher_search_index,
+            session_maker=replica_session_maker,
+            check_interval=settings.cache.REFERENCE_CATALOG_CHECK_INTERVAL_SECONDS,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_room_occupancy_refresher(
+        self,
+        settings: Settings,
+        room_occupancy_cache: RoomOccupancyCache,
+        replica_session_maker: ReplicaSessionMaker,
+    ) -> RoomOccupancyRefresher:
+        return RoomOccupancyRefresher(
+            cache=room_occupancy_cache,
+            session_maker=replica_session_maker,
+            refresh_interval=settings.cache.ROOM_OCCUPANCY_REFRESH_INTERVAL_SECONDS,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def get_async_session(
         self,
         async_session_maker: async_sessionmaker[AsyncSession],
+        replica_session_maker: ReplicaSessionMaker,
     ) -> AsyncIterable[AnyOf[AsyncSession, UnitOfWork]]:
         async with async_session_maker() as session:
+            replica_session_maker.track_writes(session.sync_session)
             yield session
 
+    @provide(scope=Scope.REQUEST)
+    async def get_replica_session(
+        self,
+        request: Request,
+        replica_session_maker: ReplicaSessionMaker,
+        container: AsyncContainer,
+    ) -> AsyncIterable[ReplicaSession]:
+        # Запросы, которые пишут в БД, читают через основную сессию: так
+        # интеракторы видят свои изменения и не зависят от отставания реплики.
+        # Основная сессия берётся из контейнера, только когда она нужна
+        if (
+            request.method not in _READ_ONLY_METHODS
+            or not replica_session_maker.is_replica_available()
+        ):
+            yield ReplicaSession(await container.get(AsyncSession))
+            return
+
+        async with replica_session_maker() as replica_session:
+            yield ReplicaSession(replica_session)
+
 
 providers = (
     AppProvider(),
@@ -1,3 +1,7 @@
+import logging
+
+from contextlib import asynccontextmanager
+
 from dishka import make_async_container
 from dishka.integrations import fastapi as dishka_fastapi
 from fastapi import FastAPI
@@ -6,6 +10,9 @@ from fastapi.responses import ORJSONResponse
 
 from pocket_kai.config import Settings, get_settings
 from pocket_kai.controllers.http.routers.main import router
+from pocket_kai.infrastructure.reference_catalog import ReferenceCatalogRefresher
+from pocket_kai.infrastructure.refresh_token_usage import RefreshTokenUsageBuffer
+from pocket_kai.infrastructure.room_occupancy import RoomOccupancyRefresher
 from pocket_kai.ioc.main import providers
 
 
@@ -63,6 +70,35 @@ origins = [
 ]
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refresh_token_usage_buffer = await container.get(RefreshTokenUsageBuffer)
+    refresh_token_usage_buffer.start()
+
+    reference_catalog_refresher = await container.get(ReferenceCatalogRefresher)
+    try:
+        await reference_catalog_refresher.refresh()
+    except Exception:
+        # Без каталога справочники читаются из БД, приложение работает
+        logging.exception('Failed to load reference catalog')
+    reference_catalog_refresher.start()
+
+    room_occupancy_refresher = await container.get(RoomOccupancyRefresher)
+    try:
+        await room_occupancy_refresher.refresh()
+    except Exception:
+        # Индекс построится при первом запросе свободных аудиторий
+        logging.exception('Failed to load room occupancy index')
+    room_occupancy_refresher.start()
+
+    yield
+
+    await room_occupancy_refresher.stop()
+    await reference_catalog_refresher.stop()
+    await refresh_token_usage_buffer.stop()
+    await container.close()
+
+
 def get_fastapi_app(lifespan=None) -> FastAPI:
     app = FastAPI(
         title='Pocket KAI API',
@@ -78,7 +114,7 @@ def get_fastapi_app(lifespan=None) -> FastAPI:
 
 
 def get_production_fastapi_app() -> FastAPI:
-    fastapi_app = get_fastapi_app()
+    fastapi_app = get_fastapi_app(lifespan=lifespan)
 
     fastapi_app.add_middleware(
         CORSMiddleware,
@@ -86,6 +122,7 @@ def get_production_fastapi_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=['*'],
         allow_headers=['*'],
+        expose_headers=['X-Next-Cursor'],
     )
 
     dishka_fastapi.setup_dishka(container=container, app=fastapi_app)
@@ -0,0 +1,65 @@
+import base64
+import datetime as dt
+import uuid
+
+import pytest
+
+from fastapi import HTTPException, Response
+
+from pocket_kai.controllers.http.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    set_next_cursor,
+)
+
+
+def test_cursor_round_trip():
+    group_name = '4101-1'
+    group_id = uuid.uuid4()
+
+    cursor = encode_cursor(group_name, group_id)
+
+    assert decode_cursor(cursor, str, uuid.UUID) == (group_name, group_id)
+
+
+def test_cursor_round_trip_with_datetime():
+    created_at = dt.datetime(2024, 9, 1, 12, 30, 15, 123456)
+
+    cursor = encode_cursor(created_at)
+
+    assert decode_cursor(cursor, dt.datetime.fromisoformat) == (created_at,)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor('группа/с+символами?', uuid.uuid4())
+
+    assert all(char.isalnum() or char in '-_=' for char in cursor)
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    [
+        'not base64!',
+        base64.urlsafe_b64encode(b'not json').decode(),
+        base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+        # Число значений не совпадает с числом парсеров
+        encode_cursor('4101-1'),
+        # Значение не проходит парсер
+        encode_cursor('4101-1', 'not uuid'),
+    ],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, str, uuid.UUID)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_next_cursor_header():
+    response = Response()
+    set_next_cursor(response, None)
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+    set_next_cursor(response, 'cursor')
+    assert response.headers[NEXT_CURSOR_HEADER] == 'cursor'
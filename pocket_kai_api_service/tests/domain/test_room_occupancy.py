@@ -0,0 +1,114 @@
+import datetime as dt
+
+import pytest
+
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.room_occupancy import (
+    RoomOccupancyIndex,
+    get_room_key,
+    get_slots_mask,
+)
+from tests.factories import make_lesson
+
+
+# Понедельник чётной (36-й) недели
+EVEN_MONDAY = dt.date(2024, 9, 2)
+# Понедельник нечётной (37-й) недели
+ODD_MONDAY = dt.date(2024, 9, 9)
+
+
+@pytest.mark.parametrize(
+    ('start_time', 'end_time', 'mask'),
+    [
+        (None, None, 0),
+        (dt.time(8, 0), dt.time(9, 30), 0b1),
+        # Лабораторная работа на две пары
+        (dt.time(9, 40), dt.time(12, 50), 0b110),
+        # Без времени окончания - пара, в которую попадает начало
+        (dt.time(13, 45), None, 0b1000),
+        # Перерыв между парами не занимает ни одной пары
+        (dt.time(9, 30), dt.time(9, 40), 0),
+    ],
+)
+def test_slots_mask(start_time, end_time, mask):
+    assert get_slots_mask(start_time, end_time) == mask
+
+
+def test_weekly_lesson_occupies_room_by_parity():
+    index = RoomOccupancyIndex(
+        [
+            make_lesson(audience_number='101', parsed_parity=WeekParity.ODD),
+            make_lesson(audience_number='102', parsed_parity=WeekParity.ANY),
+            make_lesson(
+                audience_number='103',
+                start_time=dt.time(9, 40),
+                end_time=dt.time(11, 10),
+            ),
+        ],
+    )
+
+    assert index.get_free_rooms('7', EVEN_MONDAY, pair_number=1) == ['101', '103']
+    assert index.get_free_rooms('7', ODD_MONDAY, pair_number=1) == ['103']
+    assert index.get_free_rooms('7', ODD_MONDAY, pair_number=2) == ['101', '102']
+    # Во вторник все аудитории свободны
+    tuesday = ODD_MONDAY + dt.timedelta(days=1)
+    assert index.get_free_rooms('7', tuesday, pair_number=1) == ['101', '102', '103']
+
+
+def test_dated_lesson_occupies_room_only_on_its_dates():
+    index = RoomOccupancyIndex(
+        [make_lesson(audience_number='101', parsed_dates=[EVEN_MONDAY])],
+    )
+
+    assert index.get_free_rooms('7', EVEN_MONDAY, pair_number=1) == []
+    assert index.get_free_rooms('7', ODD_MONDAY, pair_number=1) == ['101']
+
+
+def test_only_rooms_of_building_are_returned():
+    index = RoomOccupancyIndex(
+        [
+            make_lesson(building_number=' 7 ', audience_number='101 '),
+            make_lesson(building_number='8', audience_number='201'),
+            make_lesson(building_number=None, audience_number='301'),
+        ],
+    )
+
+    assert index.get_free_rooms('7', EVEN_MONDAY, pair_number=2) == ['101']
+    assert index.get_free_rooms('9', EVEN_MONDAY, pair_number=2) == []
+    assert len(index) == 2
+
+
+def test_padded_room_numbers_are_stripped():
+    padded = make_lesson(building_number='7 ', audience_number=' 101 ')
+    index = RoomOccupancyIndex([padded, make_lesson(audience_number='102')])
+
+    assert get_room_key(padded) == ('7', '101')
+    assert get_room_key(make_lesson(building_number='7', audience_number='  ')) is None
+    # Занятие в аудитории с пробелами занимает ту же аудиторию, что и без них
+    assert index.get_free_rooms(' 7', EVEN_MONDAY, pair_number=1) == []
+    assert index.get_free_rooms(' 7', EVEN_MONDAY, pair_number=2) == ['101', '102']
+
+
+def test_remove_lesson_keeps_other_lessons_of_room():
+    first = make_lesson(audience_number='101', parsed_parity=WeekParity.ODD)
+    second = make_lesson(audience_number='101', parsed_parity=WeekParity.EVEN)
+    index = RoomOccupancyIndex([first, second])
+
+    index.remove_lesson(first.id)
+
+    assert index.get_free_rooms('7', ODD_MONDAY, pair_number=1) == ['101']
+    assert index.get_free_rooms('7', EVEN_MONDAY, pair_number=1) == []
+    # Удаление неизвестного занятия ничего не меняет
+    index.remove_lesson(first.id)
+    assert len(index) == 1
+
+
+def test_upsert_lesson_moves_it_to_new_room():
+    lesson = make_lesson(audience_number='101')
+    index = RoomOccupancyIndex([lesson, make_lesson(audience_number='102')])
+
+    lesson.audience_number = '103'
+    index.upsert_lesson(lesson)
+
+    assert index.get_free_rooms('7', EVEN_MONDAY, pair_number=1) == ['101']
+    assert len(index) == 2
@@ -0,0 +1,114 @@
+import datetime as dt
+
+import pytest
+
+from pocket_kai.domain.common import (
+    WeekParity,
+    get_lesson_occurrences_window,
+    get_semester_bounds,
+)
+from pocket_kai.domain.schedule import ScheduleExpander, get_week_parity
+from tests.factories import make_lesson
+
+
+# Понедельник чётной (36-й) недели
+EVEN_MONDAY = dt.date(2024, 9, 2)
+# Понедельник нечётной (37-й) недели
+ODD_MONDAY = dt.date(2024, 9, 9)
+
+
+@pytest.mark.parametrize(
+    ('date', 'bounds'),
+    [
+        (dt.date(2024, 9, 1), (dt.date(2024, 9, 1), dt.date(2025, 1, 31))),
+        (dt.date(2024, 12, 31), (dt.date(2024, 9, 1), dt.date(2025, 1, 31))),
+        (dt.date(2025, 1, 31), (dt.date(2024, 9, 1), dt.date(2025, 1, 31))),
+        (dt.date(2025, 2, 1), (dt.date(2025, 2, 1), dt.date(2025, 8, 31))),
+        (dt.date(2025, 8, 31), (dt.date(2025, 2, 1), dt.date(2025, 8, 31))),
+    ],
+)
+def test_semester_bounds(date, bounds):
+    assert get_semester_bounds(date) == bounds
+
+
+@pytest.mark.parametrize(
+    ('date', 'window'),
+    [
+        # Осенний семестр и следующий за ним весенний
+        (dt.date(2024, 10, 15), (dt.date(2024, 9, 1), dt.date(2025, 8, 31))),
+        # Январь относится к осеннему семестру прошлого года
+        (dt.date(2025, 1, 20), (dt.date(2024, 9, 1), dt.date(2025, 8, 31))),
+        # Весенний семестр и следующий за ним осенний
+        (dt.date(2025, 3, 1), (dt.date(2025, 2, 1), dt.date(2026, 1, 31))),
+    ],
+)
+def test_lesson_occurrences_window(date, window):
+    assert get_lesson_occurrences_window(date) == window
+
+
+def test_lesson_occurrences_window_contains_date():
+    date = dt.date(2024, 1, 1)
+    while date < dt.date(2026, 1, 1):
+        window_start, window_end = get_lesson_occurrences_window(date)
+        assert window_start <= date <= window_end
+        date += dt.timedelta(days=1)
+
+
+def test_week_parity_matches_parity_for_date():
+    date = dt.date(2024, 1, 1)
+    while date < dt.date(2026, 1, 1):
+        assert get_week_parity(date) == WeekParity.get_parity_for_date(date)
+        date += dt.timedelta(days=1)
+
+
+def test_expander_weekly_lessons_by_parity():
+    any_week = make_lesson(number_of_day=1, parsed_parity=WeekParity.ANY)
+    odd_week = make_lesson(number_of_day=1, parsed_parity=WeekParity.ODD)
+    even_week = make_lesson(number_of_day=1, parsed_parity=WeekParity.EVEN)
+    tuesday = make_lesson(number_of_day=2, parsed_parity=WeekParity.ANY)
+    expander = ScheduleExpander([any_week, odd_week, even_week, tuesday])
+
+    assert expander.get_lessons(EVEN_MONDAY) == [any_week, even_week]
+    assert expander.get_lessons(ODD_MONDAY) == [any_week, odd_week]
+    assert expander.get_lessons(EVEN_MONDAY + dt.timedelta(days=1)) == [tuesday]
+    assert expander.get_lessons(EVEN_MONDAY + dt.timedelta(days=2)) == []
+
+
+def test_expander_dated_lessons_only_on_their_dates():
+    # Пара с распознанными датами не повторяется по дню недели
+    dated = make_lesson(
+        number_of_day=1,
+        parsed_dates=[EVEN_MONDAY, EVEN_MONDAY, ODD_MONDAY + dt.timedelta(days=2)],
+    )
+    expander = ScheduleExpander([dated])
+
+    assert expander.get_lessons(EVEN_MONDAY) == [dated]
+    assert expander.get_lessons(ODD_MONDAY) == []
+    assert expander.get_lessons(ODD_MONDAY + dt.timedelta(days=2)) == [dated]
+
+
+def test_expander_keeps_original_order():
+    first = make_lesson(number_of_day=1, start_time=dt.time(8, 0))
+    second = make_lesson(
+        number_of_day=3,
+        start_time=dt.time(9, 40),
+        parsed_dates=[EVEN_MONDAY],
+    )
+    third = make_lesson(number_of_day=1, start_time=dt.time(11, 20))
+    expander = ScheduleExpander([first, second, third])
+
+    assert expander.get_lessons(EVEN_MONDAY) == [first, second, third]
+
+
+def test_expand_days():
+    monday = make_lesson(number_of_day=1, parsed_parity=WeekParity.EVEN)
+    expander = ScheduleExpander([monday])
+
+    days = list(expander.expand(date_from=EVEN_MONDAY, days_count=8))
+
+    assert [date for date, _, _ in days] == [
+        EVEN_MONDAY + dt.timedelta(days=days) for days in range(8)
+    ]
+    assert days[0] == (EVEN_MONDAY, WeekParity.EVEN, [monday])
+    assert days[7] == (ODD_MONDAY, WeekParity.ODD, [])
+    assert all(lessons == [] for _, _, lessons in days[1:])
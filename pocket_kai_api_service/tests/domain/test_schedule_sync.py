@@ -0,0 +1,204 @@
+import dataclasses
+import datetime as dt
+import uuid
+
+import pytest
+
+from pocket_kai.domain.common import WeekParity
+from pocket_kai.domain.entitites.exam import ExamEntity
+from pocket_kai.domain.schedule_sync import (
+    diff_schedule,
+    exam_match_key,
+    exam_sync_key,
+    get_previous_semester,
+    lesson_match_key,
+    lesson_sync_key,
+)
+from tests.factories import make_lesson
+
+
+def make_exam(**fields) -> ExamEntity:
+    exam_fields = dict(
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2024, 12, 1),
+        original_date='10.01',
+        time=dt.time(9, 0),
+        audience_number='101',
+        building_number='7',
+        parsed_date=dt.date(2025, 1, 10),
+        academic_year='2024-2025',
+        academic_year_half=1,
+        semester=3,
+        discipline_id=uuid.uuid4(),
+        teacher_id=None,
+        group_id=uuid.uuid4(),
+    )
+    exam_fields.update(fields)
+
+    return ExamEntity(**exam_fields)
+
+
+def diff_lessons(new_lessons, saved_lessons):
+    return diff_schedule(
+        new_lessons,
+        saved_lessons,
+        key=lesson_sync_key,
+        match_key=lesson_match_key,
+    )
+
+
+def diff_exams(new_exams, saved_exams):
+    return diff_schedule(
+        new_exams,
+        saved_exams,
+        key=exam_sync_key,
+        match_key=exam_match_key,
+        unique_match_only=True,
+    )
+
+
+def test_lesson_sync_key_ignores_record_identity():
+    lesson = make_lesson(teacher_id=uuid.uuid4(), parsed_dates=[dt.date(2024, 9, 2)])
+    same_lesson = dataclasses.replace(
+        lesson,
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2025, 1, 1),
+        group_id=uuid.uuid4(),
+        teacher_id=str(lesson.teacher_id),
+        discipline_id=str(lesson.discipline_id),
+    )
+
+    assert lesson_sync_key(lesson) == lesson_sync_key(same_lesson)
+
+
+@pytest.mark.parametrize(
+    'changes',
+    [
+        {'number_of_day': 2},
+        {'start_time': dt.time(9, 40)},
+        {'parsed_parity': WeekParity.ODD},
+        {'parsed_dates': [dt.date(2024, 9, 2)]},
+        {'audience_number': '102'},
+        {'teacher_id': uuid.uuid4()},
+        {'department_id': uuid.uuid4()},
+    ],
+)
+def test_lesson_sync_key_depends_on_schedule_fields(changes):
+    lesson = make_lesson()
+
+    assert lesson_sync_key(lesson) != lesson_sync_key(
+        dataclasses.replace(lesson, **changes),
+    )
+
+
+def test_diff_unchanged_added_deleted():
+    kept = make_lesson()
+    deleted = make_lesson()
+    added = make_lesson()
+
+    diff = diff_lessons(
+        [dataclasses.replace(kept, id=uuid.uuid4()), added],
+        [kept, deleted],
+    )
+
+    assert diff.unchanged == [kept]
+    assert diff.changed == []
+    assert diff.added == [added]
+    assert diff.deleted == [deleted]
+
+
+def test_diff_matches_same_discipline_and_type():
+    saved = make_lesson(audience_number='101')
+    moved = dataclasses.replace(saved, id=uuid.uuid4(), audience_number='102')
+    other_type = dataclasses.replace(
+        saved,
+        id=uuid.uuid4(),
+        number_of_day=2,
+        original_lesson_type='пр',
+    )
+
+    diff = diff_lessons([moved, other_type], [saved])
+
+    assert diff.changed == [(saved, moved)]
+    assert diff.added == [other_type]
+    assert diff.deleted == []
+
+
+def test_diff_matches_closest_saved_lesson():
+    discipline_id = uuid.uuid4()
+    monday = make_lesson(discipline_id=discipline_id, number_of_day=1)
+    friday = make_lesson(
+        discipline_id=discipline_id,
+        number_of_day=5,
+        start_time=dt.time(13, 30),
+        end_time=dt.time(15, 0),
+    )
+    # Отличается от пары в пятницу только аудиторией
+    new_friday = dataclasses.replace(friday, id=uuid.uuid4(), audience_number='102')
+
+    diff = diff_lessons([new_friday], [monday, friday])
+
+    assert diff.changed == [(friday, new_friday)]
+    assert diff.deleted == [monday]
+
+
+def test_diff_deletes_saved_duplicates():
+    saved = make_lesson()
+    duplicate = dataclasses.replace(saved, id=uuid.uuid4())
+    new_lesson = dataclasses.replace(saved, id=uuid.uuid4())
+
+    diff = diff_lessons([new_lesson], [saved, duplicate])
+
+    assert diff.unchanged == [saved]
+    assert diff.deleted == [duplicate]
+
+
+def test_diff_exam_changed_only_when_match_is_unique():
+    discipline_id = uuid.uuid4()
+    first = make_exam(discipline_id=discipline_id, parsed_date=dt.date(2025, 1, 10))
+    second = make_exam(discipline_id=discipline_id, parsed_date=dt.date(2025, 1, 20))
+    new_exam = dataclasses.replace(first, id=uuid.uuid4(), audience_number='102')
+
+    diff = diff_exams([new_exam], [first, second])
+
+    assert diff.changed == []
+    assert diff.added == [new_exam]
+    assert diff.deleted == [first, second]
+
+
+def test_diff_exam_processes_every_unmatched_exam():
+    # Неоднозначная пара для первого экзамена не мешает сопоставить следующие
+    ambiguous_discipline_id = uuid.uuid4()
+    ambiguous_saved = [
+        make_exam(discipline_id=ambiguous_discipline_id, time=dt.time(9, 0)),
+        make_exam(discipline_id=ambiguous_discipline_id, time=dt.time(13, 0)),
+    ]
+    ambiguous_new = dataclasses.replace(
+        ambiguous_saved[0],
+        id=uuid.uuid4(),
+        time=dt.time(11, 0),
+    )
+    first_saved = make_exam()
+    first_new = dataclasses.replace(first_saved, id=uuid.uuid4(), time=dt.time(10, 0))
+    second_saved = make_exam()
+    second_new = dataclasses.replace(second_saved, id=uuid.uuid4(), building_number='8')
+
+    diff = diff_exams(
+        [ambiguous_new, first_new, second_new],
+        [*ambiguous_saved, first_saved, second_saved],
+    )
+
+    assert diff.changed == [(first_saved, first_new), (second_saved, second_new)]
+    assert diff.added == [ambiguous_new]
+    assert diff.deleted == ambiguous_saved
+
+
+@pytest.mark.parametrize(
+    ('academic_year', 'academic_year_half', 'previous'),
+    [
+        ('2024-2025', 2, ('2024-2025', 1)),
+        ('2024-2025', 1, ('2023-2024', 2)),
+    ],
+)
+def test_previous_semester(academic_year, academic_year_half, previous):
+    assert get_previous_semester(academic_year, academic_year_half) == previous
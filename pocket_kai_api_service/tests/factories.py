@@ -0,0 +1,33 @@
+import datetime as dt
+import uuid
+
+from pocket_kai.domain.common import LessonType, ParsedDatesStatus, WeekParity
+from pocket_kai.domain.entitites.lesson import LessonEntity
+
+
+def make_lesson(**fields) -> LessonEntity:
+    """
+    Пара с заполненными по умолчанию полями, нужные поля передаются явно
+    """
+    lesson_fields = dict(
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2024, 9, 1),
+        number_of_day=1,
+        original_dates=None,
+        parsed_parity=WeekParity.ANY,
+        parsed_dates=None,
+        parsed_dates_status=ParsedDatesStatus.GOOD,
+        start_time=dt.time(8, 0),
+        end_time=dt.time(9, 30),
+        audience_number='101',
+        building_number='7',
+        original_lesson_type='лек',
+        parsed_lesson_type=LessonType.lecture,
+        group_id=uuid.uuid4(),
+        discipline_id=uuid.uuid4(),
+        department_id=None,
+        teacher_id=None,
+    )
+    lesson_fields.update(fields)
+
+    return LessonEntity(**lesson_fields)
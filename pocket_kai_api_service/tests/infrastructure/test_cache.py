@@ -0,0 +1,169 @@
+import asyncio
+import datetime as dt
+import uuid
+
+from pocket_kai.application.interactors.reference import get_reference
+from pocket_kai.domain.entitites.department import DepartmentEntity
+from pocket_kai.domain.entitites.institute import InstituteEntity
+from pocket_kai.infrastructure.cache import InMemoryReferenceCatalog, LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_department(name: str = 'Кафедра') -> DepartmentEntity:
+    return DepartmentEntity(
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2024, 9, 1),
+        kai_id=1,
+        name=name,
+    )
+
+
+def make_institute() -> InstituteEntity:
+    return InstituteEntity(
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2024, 9, 1),
+        kai_id=1,
+        name='Институт',
+    )
+
+
+def test_lru_cache_expires_entries():
+    clock = FakeClock()
+    cache = LRUCache(name='test', max_size=10, ttl=60, clock=clock)
+    cache.set('key', 'value')
+
+    clock.now = 59.9
+    assert cache.get('key') == 'value'
+
+    clock.now = 60
+    assert cache.get('key') is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_cache_entry_ttl_is_capped_by_cache_ttl():
+    clock = FakeClock()
+    cache = LRUCache(name='test', max_size=10, ttl=60, clock=clock)
+    cache.set('short', 'value', ttl=10)
+    cache.set('long', 'value', ttl=600)
+
+    clock.now = 10
+    assert cache.get('short') is None
+    assert cache.get('long') == 'value'
+
+    clock.now = 60
+    assert cache.get('long') is None
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(name='test', max_size=2, ttl=60)
+    cache.set('first', 1)
+    cache.set('second', 2)
+    cache.get('first')
+    cache.set('third', 3)
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 1
+    assert cache.get('third') == 3
+
+
+def test_lru_cache_disabled_with_zero_size():
+    cache = LRUCache(name='test', max_size=0, ttl=60)
+    cache.set('key', 'value')
+
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_where():
+    cache = LRUCache(name='test', max_size=10, ttl=60)
+    cache.set(('group', 1), 'a')
+    cache.set(('group', 2), 'b')
+    cache.set(('teacher', 1), 'c')
+
+    cache.delete_where(lambda key: key[0] == 'group')
+    cache.delete_values_where(lambda value: value == 'c')
+
+    assert len(cache) == 0
+
+
+def test_reference_catalog_get_by_type_and_id():
+    department = make_department()
+    institute = make_institute()
+    catalog = InMemoryReferenceCatalog()
+    catalog.load([department, institute], version='v1')
+
+    assert catalog.get(DepartmentEntity, department.id) is department
+    # Id ищется как строка, тип записи учитывается
+    assert catalog.get(DepartmentEntity, str(department.id)) is department
+    assert catalog.get(InstituteEntity, department.id) is None
+    assert catalog.get_version() == 'v1'
+    assert (catalog.hits, catalog.misses) == (2, 1)
+
+
+def test_reference_catalog_add_and_remove():
+    department = make_department()
+    catalog = InMemoryReferenceCatalog()
+
+    catalog.add(department)
+    assert catalog.get(DepartmentEntity, department.id) is department
+
+    catalog.remove(DepartmentEntity, str(department.id))
+    assert catalog.get(DepartmentEntity, department.id) is None
+    # Удаление отсутствующей записи - не ошибка
+    catalog.remove(DepartmentEntity, department.id)
+
+
+def test_reference_catalog_load_replaces_entities():
+    old_department = make_department()
+    new_department = make_department()
+    catalog = InMemoryReferenceCatalog()
+    catalog.load([old_department], version='v1')
+
+    catalog.load([new_department], version='v2')
+
+    assert catalog.get(DepartmentEntity, old_department.id) is None
+    assert catalog.get(DepartmentEntity, new_department.id) is new_department
+    assert catalog.get_version() == 'v2'
+    assert catalog.stats()[0].size == 1
+
+
+def test_get_reference_reads_missing_entity_once():
+    department = make_department()
+    catalog = InMemoryReferenceCatalog()
+    calls = []
+
+    async def get_by_id(id: str) -> DepartmentEntity | None:
+        calls.append(id)
+        return department if id == department.id else None
+
+    async def get_twice() -> list[DepartmentEntity | None]:
+        return [
+            await get_reference(catalog, DepartmentEntity, department.id, get_by_id)
+            for _ in range(2)
+        ]
+
+    assert asyncio.run(get_twice()) == [department, department]
+    assert calls == [department.id]
+
+
+def test_get_reference_without_id_or_entity():
+    catalog = InMemoryReferenceCatalog()
+
+    async def get_by_id(id: str) -> DepartmentEntity | None:
+        return None
+
+    assert asyncio.run(get_reference(catalog, DepartmentEntity, None, get_by_id)) is None
+    missing_id = str(uuid.uuid4())
+    assert (
+        asyncio.run(get_reference(catalog, DepartmentEntity, missing_id, get_by_id))
+        is None
+    )
+    assert catalog.get(DepartmentEntity, missing_id) is None
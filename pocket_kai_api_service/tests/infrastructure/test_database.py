@@ -0,0 +1,89 @@
+import pytest
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from pocket_kai.infrastructure.database.database import ReplicaSessionMaker
+
+
+metadata = MetaData()
+
+groups = Table('groups', metadata, Column('id', Integer, primary_key=True))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite://')
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def replica_session_maker(clock):
+    # Сессии к БД в этих тестах не открываются, нужны только отметки записи
+    return ReplicaSessionMaker(
+        primary=None,
+        replica=lambda: None,
+        max_lag=5,
+        clock=clock,
+    )
+
+
+def open_session(engine, replica_session_maker) -> Session:
+    session = Session(engine)
+    replica_session_maker.track_writes(session)
+    return session
+
+
+def test_read_only_commit_keeps_replica(engine, replica_session_maker):
+    # Например, POST /group/schedule/batch только читает расписание
+    with open_session(engine, replica_session_maker) as session:
+        session.execute(select(groups))
+        session.commit()
+
+    assert replica_session_maker.is_replica_available()
+
+
+def test_rolled_back_write_keeps_replica(engine, replica_session_maker):
+    with open_session(engine, replica_session_maker) as session:
+        session.execute(insert(groups).values(id=1))
+        session.rollback()
+        session.commit()
+
+    assert replica_session_maker.is_replica_available()
+
+
+def test_not_committed_write_keeps_replica(engine, replica_session_maker):
+    with open_session(engine, replica_session_maker) as session:
+        session.execute(insert(groups).values(id=1))
+
+    assert replica_session_maker.is_replica_available()
+
+
+def test_committed_write_disables_replica_for_max_lag(
+    engine,
+    replica_session_maker,
+    clock,
+):
+    with open_session(engine, replica_session_maker) as session:
+        session.execute(insert(groups).values(id=1))
+        session.commit()
+
+    assert not replica_session_maker.is_replica_available()
+
+    clock.now += 5
+    assert replica_session_maker.is_replica_available()
@@ -0,0 +1,123 @@
+import datetime as dt
+import uuid
+
+from pocket_kai.domain.entitites.teacher import TeacherEntity
+from pocket_kai.infrastructure.teacher_search import (
+    TeacherSearchIndex,
+    get_substring_trigrams,
+    get_trigrams,
+    normalize_name,
+    similarity,
+)
+
+
+SIMILARITY_THRESHOLD = 0.3
+
+
+def make_teacher(name: str) -> TeacherEntity:
+    return TeacherEntity(
+        id=uuid.uuid4(),
+        created_at=dt.datetime(2024, 9, 1),
+        login=f'login-{uuid.uuid4().hex[:8]}',
+        name=name,
+    )
+
+
+def load_index(*names: str) -> TeacherSearchIndex:
+    index = TeacherSearchIndex()
+    index.load(make_teacher(name) for name in names)
+    return index
+
+
+def search(index: TeacherSearchIndex, query: str, limit: int = 10) -> list[str]:
+    return [
+        teacher.name
+        for teacher in index.search(query, limit, SIMILARITY_THRESHOLD)
+    ]
+
+
+def test_trigrams_like_pg_trgm():
+    assert get_trigrams('кот') == frozenset({'  к', ' ко', 'кот', 'от '})
+    assert get_trigrams('a-b') == frozenset({'  a', ' a ', '  b', ' b '})
+    assert get_trigrams('') == frozenset()
+
+
+def test_substring_trigrams():
+    assert get_substring_trigrams('иван') == frozenset({'ива', 'ван'})
+    assert get_substring_trigrams('ив а-бв') == frozenset()
+
+
+def test_similarity():
+    trigrams = get_trigrams('иванов')
+
+    assert similarity(trigrams, trigrams) == 1.0
+    assert similarity(trigrams, frozenset()) == 0.0
+    assert 0 < similarity(trigrams, get_trigrams('иванова')) < 1
+
+
+def test_normalize_name():
+    assert normalize_name('Пётр Семёнович') == 'петр семенович'
+
+
+def test_index_is_loaded_only_after_load():
+    index = TeacherSearchIndex()
+    assert not index.is_loaded()
+    assert index.search('иванов', 10, SIMILARITY_THRESHOLD) == []
+
+    index.load([])
+    assert index.is_loaded()
+
+
+def test_search_ranks_closest_names_first():
+    index = load_index(
+        'Сидоров Пётр Алексеевич',
+        'Иванова Мария Петровна',
+        'Иванов Иван Иванович',
+        'Петров Иван Сергеевич',
+    )
+
+    # Иванова ниже порога похожести, но запрос входит в её ФИО
+    assert search(index, 'Иван') == [
+        'Иванов Иван Иванович',
+        'Петров Иван Сергеевич',
+        'Иванова Мария Петровна',
+    ]
+
+
+def test_search_ignores_case_and_yo():
+    index = load_index('Семёнов Пётр Алексеевич')
+
+    assert search(index, 'СЕМЕНОВ') == ['Семёнов Пётр Алексеевич']
+
+
+def test_search_finds_substring_without_common_trigrams():
+    index = load_index('Абвгдеёжз Иван Петрович')
+
+    # Подстрока из середины слова не даёт общих триграмм с ФИО
+    assert search(index, 'вгд') == ['Абвгдеёжз Иван Петрович']
+
+
+def test_search_substring_requires_whole_query():
+    index = load_index('Бвабв Абгд Иванович')
+
+    # Все триграммы запроса есть в ФИО, но сам запрос в него не входит
+    assert search(index, 'вабг') == []
+    assert search(index, 'бвабв абг') == ['Бвабв Абгд Иванович']
+
+
+def test_search_short_substring():
+    index = load_index('Абвгдеёжз Иван Петрович', 'Петров Иван Сергеевич')
+
+    assert search(index, 'вг') == ['Абвгдеёжз Иван Петрович']
+
+
+def test_search_limit_and_reload():
+    index = load_index('Иванов А. А.', 'Иванов Б. Б.', 'Иванов В. В.')
+
+    assert len(search(index, 'Иванов', limit=2)) == 2
+
+    index.load([make_teacher('Петров Г. Г.')])
+
+    assert len(index) == 1
+    assert search(index, 'Иванов') == []
+    assert search(index, 'Петров') == ['Петров Г. Г.']